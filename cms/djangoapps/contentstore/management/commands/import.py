@@ -3,7 +3,8 @@ Script for importing courseware from XML format
 """
 
 from django.core.management.base import BaseCommand, CommandError, make_option
-from django_comment_common.utils import (seed_permissions_roles,
+from course_overviews.models import CourseOverview
+from django_comment_common.utils import (seed_permissions_roles, clear_discussion_modules,
                                          are_permissions_roles_seeded)
 from xmodule.modulestore.xml_importer import import_from_xml
 from xmodule.modulestore.django import modulestore
@@ -53,6 +54,8 @@ class Command(BaseCommand):
 
         for course in course_items:
             course_id = course.id
+            CourseOverview.update_from_course(course)
+            clear_discussion_modules(course_id)
             if not are_permissions_roles_seeded(course_id):
                 self.stdout.write('Seeding forum roles for course {0}\n'.format(course_id))
                 seed_permissions_roles(course_id)
@@ -1,4 +1,4 @@
-from cache_toolbox.core import get_cached_content, set_cached_content, del_cached_content
+from cache_toolbox.core import get_cached_content, set_cached_content, del_cached_content, LocalContentCache
 from xmodule.modulestore import Location
 from xmodule.contentstore.content import StaticContent
 from django.test import TestCase
@@ -34,3 +34,39 @@ class CachingTestCase(TestCase):
                          'should not be stored in cache with unicodeLocation')
         self.assertEqual(None, get_cached_content(self.nonUnicodeLocation),
                          'should not be stored in cache with nonUnicodeLocation')
+
+
+class LocalContentCacheTestCase(TestCase):
+    """
+    Tests of the process local, size bounded content cache
+    """
+    def content(self, name, size):
+        return StaticContent(Location(u'c4x', u'mitX', u'800', u'run', u'asset', name), name, 'text/plain', 'x' * size)
+
+    def test_evicts_least_recently_used(self):
+        cache = LocalContentCache(max_size=10, max_item_size=5, timeout=60)
+        for name in ('a', 'b'):
+            cache.set(name, self.content(name, 4))
+        cache.get('a')
+        cache.set('c', self.content('c', 4))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('c'))
+
+    def test_limits_entries(self):
+        cache = LocalContentCache(max_size=10, max_item_size=5, timeout=60, max_entries=2)
+        for name in ('a', 'b', 'c'):
+            cache.set(name, self.content(name, 0))
+        self.assertIsNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('c'))
+
+    def test_skips_large_content(self):
+        cache = LocalContentCache(max_size=10, max_item_size=5, timeout=60)
+        cache.set('a', self.content('a', 6))
+        self.assertIsNone(cache.get('a'))
+
+    def test_timeout(self):
+        cache = LocalContentCache(max_size=10, max_item_size=5, timeout=-1)
+        cache.set('a', self.content('a', 1))
+        self.assertIsNone(cache.get('a'))
@@ -80,7 +80,10 @@ class TestCourseListing(ModuleStoreTestCase):
         courses_list_by_groups = _accessible_courses_list_from_groups(self.request)
         self.assertEqual(len(courses_list_by_groups), 1)
         # check both course lists have same courses
-        self.assertEqual(courses_list, courses_list_by_groups)
+        self.assertEqual(
+            [course.course_id for course in courses_list],
+            [course.course_id for course in courses_list_by_groups]
+        )
 
     def test_errored_course_global_staff(self):
         """
@@ -139,7 +142,10 @@ class TestCourseListing(ModuleStoreTestCase):
         courses_list_by_groups = _accessible_courses_list_from_groups(self.request)
         self.assertEqual(len(courses_list_by_groups), 1)
         # check both course lists have same courses
-        self.assertEqual(courses_list, courses_list_by_groups)
+        self.assertEqual(
+            [course.course_id for course in courses_list],
+            [course.course_id for course in courses_list_by_groups]
+        )
 
         # now delete this course and re-add user to instructor group of this course
         delete_course_and_groups(course_key, commit=True)
@@ -211,7 +217,10 @@ class TestCourseListing(ModuleStoreTestCase):
         courses_list_by_groups = _accessible_courses_list_from_groups(self.request)
         self.assertEqual(len(courses_list_by_groups), 1)
         # check both course lists have same courses
-        self.assertEqual(courses_list, courses_list_by_groups)
+        self.assertEqual(
+            [course.course_id for course in courses_list],
+            [course.course_id for course in courses_list_by_groups]
+        )
 
         # now create another course with same course_id but different name case
         course_location_camel = SlashSeparatedCourseKey('Org', 'Course', 'Run')
@@ -15,6 +15,7 @@ from xmodule.modulestore.exceptions import ItemNotFoundError
 from xmodule.modulestore.locations import SlashSeparatedCourseKey, Location
 from xmodule.modulestore.store_utilities import delete_course
 from student.roles import CourseInstructorRole, CourseStaffRole
+from course_overviews.models import CourseOverview
 
 
 log = logging.getLogger(__name__)
@@ -40,6 +41,7 @@ def delete_course_and_groups(course_id, commit=False):
         print 'removing User permissions from course....'
         # in the django layer, we need to remove all the user permissions groups associated with this course
         if commit:
+            CourseOverview.delete_for_course(course_id)
             try:
                 staff_role = CourseStaffRole(course_id)
                 staff_role.remove_users(*staff_role.users_with_role())
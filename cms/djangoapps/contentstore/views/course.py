@@ -55,6 +55,7 @@ from student.roles import CourseRole, UserBasedRole
 
 from xmodule.modulestore.keys import CourseKey
 from course_creators.views import get_course_creator_status, add_user_with_status_unrequested
+from course_overviews.models import CourseOverview
 from contentstore import utils
 from student.roles import CourseInstructorRole, CourseStaffRole, CourseCreatorRole, GlobalStaff
 from student import auth
@@ -180,22 +181,16 @@ def _accessible_courses_list(request):
 
 def _accessible_courses_list_from_groups(request):
     """
-    List all courses available to the logged in user by reversing access group names
+    List the CourseOverviews of all courses available to the logged in user by reversing access group names
     """
-    courses_list = {}
-
     instructor_courses = UserBasedRole(request.user, CourseInstructorRole.ROLE).courses_with_role()
     staff_courses = UserBasedRole(request.user, CourseStaffRole.ROLE).courses_with_role()
     all_courses = instructor_courses | staff_courses
 
-    for course_access in all_courses:
-        course_key = course_access.course_id
-        if course_key not in courses_list:
-            course = modulestore('direct').get_course(course_key)
-            if course is not None and not isinstance(course, ErrorDescriptor):
-                # ignore deleted or errored courses
-                courses_list[course_key] = course
-
+    # CourseOverview ignores deleted or errored courses
+    courses_list = CourseOverview.get_from_ids(
+        course_access.course_id for course_access in all_courses
+    )
     return courses_list.values()
 
 
@@ -220,15 +215,16 @@ def course_listing(request):
 
     def format_course_for_view(course):
         """
-        return tuple of the data which the view requires for each course
+        return tuple of the data which the view requires for each course (a CourseDescriptor or CourseOverview)
         """
+        course_key = course.course_id
         return (
             course.display_name,
-            reverse_course_url('course_handler', course.id),
-            get_lms_link_for_item(course.location),
+            reverse_course_url('course_handler', course_key),
+            get_lms_link_for_item(course_key.make_usage_key('course', course_key.run)),
             course.display_org_with_default,
             course.display_number_with_default,
-            course.location.name
+            course_key.run
         )
 
     return render_to_response('index.html', {
@@ -336,6 +332,7 @@ def create_new_course(request):
         # work.
         CourseEnrollment.enroll(request.user, new_course.id)
         _users_assign_default_role(new_course.id)
+        CourseOverview.update_from_course(new_course)
 
         return JsonResponse({
             'url': reverse_course_url('course_handler', new_course.id)
@@ -31,6 +31,8 @@ from xmodule.modulestore.xml_exporter import export_to_xml
 from .access import has_course_access
 
 from extract_tar import safetar_extractall
+from course_overviews.models import CourseOverview
+from django_comment_common.utils import clear_discussion_modules
 from student import auth
 from student.roles import CourseInstructorRole, CourseStaffRole, GlobalStaff
 from util.json_request import JsonResponse
@@ -227,6 +229,8 @@ def import_handler(request, course_key_string):
                     )
 
                     new_location = course_items[0].location
+                    CourseOverview.update_from_course(course_items[0])
+                    clear_discussion_modules(course_key)
                     logging.debug('new course at {0}'.format(new_location))
 
                     session_status[key] = 3
@@ -33,6 +33,7 @@ from ..utils import get_modulestore
 from .access import has_course_access
 from .helpers import _xmodule_recurse, xblock_has_own_studio_page
 from contentstore.utils import compute_publish_state, PublishState
+from django_comment_common.utils import clear_discussion_modules
 from xmodule.modulestore.draft import DIRECT_ONLY_CATEGORIES
 from contentstore.views.preview import get_preview_fragment
 from edxmako.shortcuts import render_to_string
@@ -124,9 +125,9 @@ def xblock_handler(request, usage_key_string):
             delete_children = str_to_bool(request.REQUEST.get('recurse', 'False'))
             delete_all_versions = str_to_bool(request.REQUEST.get('all_versions', 'False'))
 
-            return _delete_item_at_location(usage_key, delete_children, delete_all_versions, request.user)
+            response = _delete_item_at_location(usage_key, delete_children, delete_all_versions, request.user)
         else:  # Since we have a usage_key, we are updating an existing xblock.
-            return _save_item(
+            response = _save_item(
                 request,
                 usage_key,
                 data=request.json.get('data'),
@@ -136,6 +137,9 @@ def xblock_handler(request, usage_key_string):
                 grader_type=request.json.get('graderType'),
                 publish=request.json.get('publish'),
             )
+        # the course's inline discussions may have changed
+        clear_discussion_modules(usage_key.course_key)
+        return response
     elif request.method in ('PUT', 'POST'):
         if 'duplicate_source_locator' in request.json:
             parent_usage_key = UsageKey.from_string(request.json['parent_locator'])
@@ -147,6 +151,7 @@ def xblock_handler(request, usage_key_string):
                 request.json.get('display_name'),
                 request.user,
             )
+            clear_discussion_modules(dest_usage_key.course_key)
 
             return JsonResponse({"locator": unicode(dest_usage_key)})
         else:
@@ -433,6 +438,7 @@ def _create_item(request):
     if not 'detached' in parent.runtime.load_block_type(category)._class_tags:
         parent.children.append(dest_usage_key)
         get_modulestore(parent.location).update_item(parent, request.user.id)
+    clear_discussion_modules(dest_usage_key.course_key)
 
     return JsonResponse({"locator": unicode(dest_usage_key), "courseKey": unicode(dest_usage_key.course_key)})
 
@@ -10,6 +10,7 @@ from contentstore.utils import get_modulestore, course_image_url
 from models.settings import course_grading
 from xmodule.fields import Date
 from xmodule.modulestore.django import modulestore
+from course_overviews.models import CourseOverview
 
 class CourseDetails(object):
     def __init__(self, org, course_id, run):
@@ -152,6 +153,7 @@ class CourseDetails(object):
 
         if dirty:
             module_store.update_item(descriptor, user.id)
+            CourseOverview.update_from_course(descriptor)
 
         # NOTE: below auto writes to the db w/o verifying that any of the fields actually changed
         # to make faster, could compare against db or could have client send over a list of which fields changed.
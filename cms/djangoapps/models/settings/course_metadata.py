@@ -1,6 +1,7 @@
 from xblock.fields import Scope
 
 from contentstore.utils import get_modulestore
+from course_overviews.models import CourseOverview
 from cms.lib.xblock.mixin import CmsBlockMixin
 
 
@@ -78,5 +79,7 @@ class CourseMetadata(object):
 
         if dirty:
             get_modulestore(descriptor.location).update_item(descriptor, user.id if user else None)
+            if descriptor.location.category == 'course':
+                CourseOverview.update_from_course(descriptor)
 
         return cls.fetch(descriptor)
@@ -530,6 +530,9 @@ INSTALLED_APPS = (
 
     # Monitoring signals
     'monitoring',
+
+    # Denormalized course summaries for course listings
+    'course_overviews',
 )
 
 
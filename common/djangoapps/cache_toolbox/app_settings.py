@@ -6,3 +6,32 @@ CACHE_TOOLBOX_DEFAULT_TIMEOUT = getattr(
     'CACHE_TOOLBOX_DEFAULT_TIMEOUT',
     60 * 60 * 24 * 3,
 )
+
+# Static content no bigger than this many bytes is also kept in a process local cache
+CONTENT_LOCAL_CACHE_MAX_ITEM_SIZE = getattr(
+    settings,
+    'CONTENT_LOCAL_CACHE_MAX_ITEM_SIZE',
+    1024 * 64,
+)
+
+# The total bytes of static content kept in the process local cache (0 disables it)
+CONTENT_LOCAL_CACHE_MAX_SIZE = getattr(
+    settings,
+    'CONTENT_LOCAL_CACHE_MAX_SIZE',
+    1024 * 1024 * 16,
+)
+
+# The number of static content entries kept in the process local cache
+CONTENT_LOCAL_CACHE_MAX_ENTRIES = getattr(
+    settings,
+    'CONTENT_LOCAL_CACHE_MAX_ENTRIES',
+    1000,
+)
+
+# Seconds static content stays in the process local cache. Deleting content only
+# clears the deleting process's local cache; so, this bounds how stale others get.
+CONTENT_LOCAL_CACHE_TIMEOUT = getattr(
+    settings,
+    'CONTENT_LOCAL_CACHE_TIMEOUT',
+    60,
+)
@@ -8,6 +8,10 @@ Core methods
 
 """
 
+import threading
+import time
+from collections import OrderedDict
+
 from django.core.cache import cache
 from django.db import DEFAULT_DB_ALIAS
 
@@ -109,18 +113,88 @@ def instance_key(model, instance_or_pk):
     )
 
 
+class LocalContentCache(object):
+    """
+    A process local LRU cache of static content with a timeout on each entry, bounded by both the
+    total size of the content's data and the number of entries (content w/o data in memory, such as
+    content spilled to the disk cache, has no size).
+    """
+    def __init__(self, max_size, max_item_size, timeout, max_entries=1000):
+        self.max_size = max_size
+        self.max_item_size = max_item_size
+        self.timeout = timeout
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, size, content)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                self._size -= entry[1]
+                return None
+            self._entries[key] = entry
+            return entry[2]
+
+    def set(self, key, content):
+        data = getattr(content, 'data', None)
+        size = len(data) if isinstance(data, basestring) else 0
+        if self.max_size <= 0 or self.max_entries <= 0 or size > self.max_item_size or size > self.max_size:
+            return
+        with self._lock:
+            self._delete(key)
+            self._entries[key] = (time.time() + self.timeout, size, content)
+            self._size += size
+            while self._size > self.max_size or len(self._entries) > self.max_entries:
+                _key, (_expires_at, evicted_size, _content) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+    def delete(self, key):
+        with self._lock:
+            self._delete(key)
+
+    def _delete(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
+
+
+local_content_cache = LocalContentCache(
+    app_settings.CONTENT_LOCAL_CACHE_MAX_SIZE,
+    app_settings.CONTENT_LOCAL_CACHE_MAX_ITEM_SIZE,
+    app_settings.CONTENT_LOCAL_CACHE_TIMEOUT,
+    app_settings.CONTENT_LOCAL_CACHE_MAX_ENTRIES,
+)
+
+
+def _content_key(location):
+    return unicode(location).encode("utf-8")
+
+
 def set_cached_content(content):
-    cache.set(unicode(content.location).encode("utf-8"), content)
+    key = _content_key(content.location)
+    local_content_cache.set(key, content)
+    cache.set(key, content)
 
 
 def get_cached_content(location):
-    return cache.get(unicode(location).encode("utf-8"))
+    key = _content_key(location)
+    content = local_content_cache.get(key)
+    if content is None:
+        content = cache.get(key)
+        if content is not None:
+            local_content_cache.set(key, content)
+    return content
 
 
 def del_cached_content(location):
     # delete content for the given location, as well as for content with run=None.
     # it's possible that the content could have been cached without knowing the
     # course_key - and so without having the run.
-    cache.delete_many(
-        [unicode(loc).encode("utf-8") for loc in [location, location.replace(run=None)]]
-    )
+    keys = [_content_key(loc) for loc in [location, location.replace(run=None)]]
+    for key in keys:
+        local_content_cache.delete(key)
+    cache.delete_many(keys)
@@ -1,16 +1,55 @@
 """
 Django Model baseclass for database-backed configuration.
 """
+import time
+from uuid import uuid4
+
 from django.db import models
 from django.contrib.auth.models import User
 from django.core.cache import get_cache, InvalidCacheBackendError
 
+from request_cache.middleware import RequestCache
+
 try:
     cache = get_cache('configuration')  # pylint: disable=invalid-name
 except InvalidCacheBackendError:
     from django.core.cache import cache
 
 
+# The key of a value shared by all processes which changes whenever any configuration changes
+CHANGE_STAMP_KEY = 'configuration/change_stamp'
+CHANGE_STAMP_TIMEOUT = 60 * 60 * 24 * 30
+
+# This process's copies of the current configurations: class -> (change stamp, expires at, configuration)
+_process_copies = {}
+
+
+def _change_stamp():
+    """
+    Returns the current change stamp (once per request), making a new one if it's
+    been evicted from the cache
+    """
+    in_request = RequestCache.get_current_request() is not None
+    request_cache = RequestCache.get_request_cache().data if in_request else {}
+    if 'config_models.change_stamp' in request_cache:
+        return request_cache['config_models.change_stamp']
+
+    stamp = cache.get(CHANGE_STAMP_KEY)
+    if stamp is None:
+        stamp = _new_change_stamp()
+    request_cache['config_models.change_stamp'] = stamp
+    return stamp
+
+
+def _new_change_stamp():
+    """
+    Record that the configuration has changed so that every process refreshes its copies
+    """
+    stamp = uuid4().hex
+    cache.set(CHANGE_STAMP_KEY, stamp, CHANGE_STAMP_TIMEOUT)
+    return stamp
+
+
 class ConfigurationModel(models.Model):
     """
     Abstract base class for model-based configuration
@@ -36,6 +75,10 @@ class ConfigurationModel(models.Model):
         """
         super(ConfigurationModel, self).save(*args, **kwargs)
         cache.delete(self.cache_key_name())
+        _process_copies.pop(type(self), None)
+        if RequestCache.get_current_request() is not None:
+            RequestCache.get_request_cache().data.pop('config_models.change_stamp', None)
+        _new_change_stamp()
 
     @classmethod
     def cache_key_name(cls):
@@ -44,6 +87,26 @@ class ConfigurationModel(models.Model):
 
     @classmethod
     def current(cls):
+        """
+        Return the active configuration entry, either from this process's copy
+        (if no configuration has changed since it was made), from cache,
+        from the database, or by creating a new empty entry (which is not
+        persisted).
+
+        Checking whether any configuration has changed takes one cache read per
+        request (or per call outside of requests).
+        """
+        stamp = _change_stamp()
+        copy = _process_copies.get(cls)
+        if copy is not None and copy[0] == stamp and copy[1] > time.time():
+            return copy[2]
+
+        current = cls._current_from_cache()
+        _process_copies[cls] = (stamp, time.time() + cls.cache_timeout, current)
+        return current
+
+    @classmethod
+    def _current_from_cache(cls):
         """
         Return the active configuration entry, either from cache,
         from the database, or by creating a new empty entry (which is not
@@ -8,8 +8,9 @@ from django.test import TestCase
 
 from freezegun import freeze_time
 
-from mock import patch
-from config_models.models import ConfigurationModel
+from mock import patch, Mock
+from config_models.models import ConfigurationModel, cache
+from request_cache.middleware import RequestCache
 
 
 class ExampleConfig(ConfigurationModel):
@@ -74,3 +75,49 @@ class ConfigurationModelTests(TestCase):
         ExampleConfig.current()
 
         mock_cache.set.assert_called_with(ExampleConfig.cache_key_name(), first, 300)
+
+
+class ConfigurationModelCopyTests(TestCase):
+    """
+    Tests of the process and request copies of the current configuration
+    """
+    def setUp(self):
+        self.user = User()
+        self.user.save()
+        cache.clear()
+
+    def test_process_copy(self):
+        ExampleConfig(changed_by=self.user, string_field='first').save()
+        self.assertEquals(ExampleConfig.current().string_field, 'first')
+
+        # unchanged configuration comes from the process's copy
+        with patch.object(ExampleConfig, '_current_from_cache') as mock_current:
+            self.assertEquals(ExampleConfig.current().string_field, 'first')
+            self.assertFalse(mock_current.called)
+
+        ExampleConfig(changed_by=self.user, string_field='second').save()
+        self.assertEquals(ExampleConfig.current().string_field, 'second')
+
+    def test_change_in_another_process(self):
+        ExampleConfig(changed_by=self.user, string_field='first').save()
+        self.assertEquals(ExampleConfig.current().string_field, 'first')
+
+        # another process saves a new configuration; this process sees the change stamp change
+        with patch('config_models.models._process_copies', {}):
+            ExampleConfig(changed_by=self.user, string_field='second').save()
+        self.assertEquals(ExampleConfig.current().string_field, 'second')
+
+    def test_request_memoization(self):
+        middleware = RequestCache()
+        middleware.process_request(Mock())
+        try:
+            ExampleConfig.current()
+            with patch('config_models.models.cache') as mock_cache:
+                ExampleConfig.current()
+                self.assertFalse(mock_cache.get.called)
+        finally:
+            middleware.process_response(Mock(), Mock())
+
+        with patch('config_models.models.cache') as mock_cache:
+            ExampleConfig.current()
+            self.assertTrue(mock_cache.get.called)
@@ -0,0 +1,144 @@
+"""
+A local disk cache for static content too large to keep in memcached.
+
+The content's metadata goes into the regular content cache (so del_cached_content invalidates it)
+and the bytes go into a file named from the content's location and upload date. A changed asset
+therefore never reads an old file; stale files are simply evicted once the cache is over its size.
+"""
+import errno
+import hashlib
+import logging
+import os
+import tempfile
+
+from django.conf import settings
+
+from xmodule.contentstore.content import StaticContent, StaticContentStream
+
+log = logging.getLogger(__name__)
+
+
+def disk_cache_settings():
+    """
+    Return (directory, max_size) for the disk cache or (None, None) if it isn't configured.
+
+    CONTENTSERVER_DISK_CACHE = {'DIRECTORY': '/tmp/edx-contentserver', 'MAX_SIZE': 1024 ** 3}
+    """
+    config = getattr(settings, 'CONTENTSERVER_DISK_CACHE', None)
+    if not config or not config.get('DIRECTORY'):
+        return None, None
+    return config['DIRECTORY'], config.get('MAX_SIZE', 1024 ** 3)
+
+
+class DiskCachedContent(StaticContent):
+    """
+    The metadata of static content whose bytes are in the disk cache of the server which cached it.
+    """
+    def __init__(self, content, file_name):
+        super(DiskCachedContent, self).__init__(
+            content.location, content.name, content.content_type, None,
+            last_modified_at=content.last_modified_at, thumbnail_location=content.thumbnail_location,
+            import_path=content.import_path, length=content.length, locked=content.locked,
+            content_digest=content.content_digest
+        )
+        self.file_name = file_name
+
+    def open(self):
+        """
+        Return a StaticContentStream of the cached file or None if it isn't on this server's disk.
+        """
+        directory, _max_size = disk_cache_settings()
+        if directory is None:
+            return None
+        path = os.path.join(directory, self.file_name)
+        try:
+            stream = open(path, 'rb')
+        except IOError:
+            return None
+        try:
+            # mark the file as recently used for _evict (access times aren't kept on noatime mounts)
+            os.utime(path, None)
+        except OSError:
+            pass
+        return StaticContentStream(
+            self.location, self.name, self.content_type, stream,
+            last_modified_at=self.last_modified_at, thumbnail_location=self.thumbnail_location,
+            import_path=self.import_path, length=self.length, locked=self.locked,
+            content_digest=self.content_digest
+        )
+
+
+def _file_name(content):
+    """
+    The cache file name for the given version of the content
+    """
+    key = u'{}@{}'.format(content.location, content.last_modified_at).encode('utf-8')
+    return hashlib.sha1(key).hexdigest()
+
+
+def spill_to_disk(content):
+    """
+    Copy the given StaticContentStream into the disk cache.
+
+    Returns a DiskCachedContent for the copy (to be put in the content cache) or None if the disk
+    cache isn't configured or the copy failed. Leaves the stream positioned at its start.
+    """
+    directory, max_size = disk_cache_settings()
+    if directory is None or content.length is None or content.length > max_size:
+        return None
+
+    try:
+        os.makedirs(directory)
+    except OSError as exc:
+        if exc.errno != errno.EEXIST:
+            log.warning("Unable to create the content disk cache directory %s: %s", directory, exc)
+            return None
+
+    file_name = _file_name(content)
+    # write to a temporary file and rename it so concurrent readers never see a partial file
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as temp_file:
+            for chunk in content.stream_data():
+                temp_file.write(chunk)
+        os.rename(temp_path, os.path.join(directory, file_name))
+    except (IOError, OSError) as exc:
+        log.warning("Unable to write %s to the content disk cache: %s", content.location, exc)
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return None
+    finally:
+        content._stream.seek(0)  # pylint: disable=protected-access
+
+    _evict(directory, max_size)
+    return DiskCachedContent(content, file_name)
+
+
+def _evict(directory, max_size):
+    """
+    Remove the least recently used files until the cache is no bigger than max_size bytes. A file's
+    modification time is its last use, as open touches it.
+    """
+    entries = []
+    total_size = 0
+    for file_name in os.listdir(directory):
+        if file_name.startswith('.tmp'):
+            continue
+        try:
+            stat = os.stat(os.path.join(directory, file_name))
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, file_name))
+        total_size += stat.st_size
+
+    entries.sort()
+    for _mtime, size, file_name in entries:
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(os.path.join(directory, file_name))
+        except OSError:
+            continue
+        total_size -= size
@@ -1,5 +1,11 @@
+import calendar
+import logging
+import re
+
+from django.conf import settings
 from django.http import (HttpResponse, HttpResponseNotModified,
     HttpResponseForbidden)
+from django.utils.http import http_date, parse_http_date_safe
 from student.models import CourseEnrollment
 
 from xmodule.contentstore.django import contentstore
@@ -7,6 +13,15 @@ from xmodule.contentstore.content import StaticContent, XASSET_LOCATION_TAG
 from xmodule.modulestore import InvalidLocationError, InvalidKeyError
 from cache_toolbox.core import get_cached_content, set_cached_content
 from xmodule.exceptions import NotFoundError
+from contentserver.disk_cache import DiskCachedContent, spill_to_disk
+
+log = logging.getLogger(__name__)
+
+# memcached won't store values of 1MB or more
+MAX_MEMCACHED_CONTENT_SIZE = 1048576
+
+# a single byte range of the form first-last, first-, or -suffix_length
+BYTE_RANGE_RE = re.compile(r'^(?P<first>\d*)-(?P<last>\d*)$')
 
 # TODO: Soon as we have a reasonable way to serialize/deserialize AssetKeys, we need
 # to change this file so instead of using course_id_partial, we're just using asset keys
@@ -23,30 +38,22 @@ class StaticContentServer(object):
                 response.status_code = 400
                 return response
 
-            # first look in our cache so we don't have to round-trip to the DB
-            content = get_cached_content(loc)
-            if content is None:
-                # nope, not in cache, let's fetch from DB
+            # first look in our cache so we don't have to round-trip to the DB. Anything cached
+            # has at least the content's metadata which is all that's needed to check access
+            # and answer conditional requests
+            cached = get_cached_content(loc)
+            metadata = cached
+            if metadata is None:
+                # nope, not in cache, let's read just the metadata from the DB
                 try:
-                    content = contentstore().find(loc, as_stream=True)
+                    metadata = contentstore().find_metadata(loc)
                 except NotFoundError:
                     response = HttpResponse()
                     response.status_code = 404
                     return response
 
-                # since we fetched it from DB, let's cache it going forward, but only if it's < 1MB
-                # this is because I haven't been able to find a means to stream data out of memcached
-                if content.length is not None:
-                    if content.length < 1048576:
-                        # since we've queried as a stream, let's read in the stream into memory to set in cache
-                        content = content.copy_to_in_mem()
-                        set_cached_content(content)
-            else:
-                # NOP here, but we may wish to add a "cache-hit" counter in the future
-                pass
-
             # Check that user has access to content
-            if getattr(content, "locked", False):
+            if getattr(metadata, "locked", False):
                 if not hasattr(request, "user") or not request.user.is_authenticated():
                     return HttpResponseForbidden('Unauthorized')
                 if not request.user.is_staff and not CourseEnrollment.is_enrolled_by_partial(
@@ -54,18 +61,149 @@ class StaticContentServer(object):
                 ):
                     return HttpResponseForbidden('Unauthorized')
 
-            # convert over the DB persistent last modified timestamp to a HTTP compatible
-            # timestamp, so we can simply compare the strings
-            last_modified_at_str = content.last_modified_at.strftime("%a, %d-%b-%Y %H:%M:%S GMT")
+            # see if the client has cached this content, if so then we needn't read the content at all
+            if is_not_modified(request, metadata):
+                response = HttpResponseNotModified()
+                set_caching_headers(response, metadata)
+                return response
+
+            content = None
+            if isinstance(cached, DiskCachedContent):
+                # the content is too large for memcached; read it from this server's disk cache
+                content = cached.open()
+            elif cached is not None:
+                content = cached
+            if content is None:
+                try:
+                    content = contentstore().find(loc, as_stream=True)
+                except NotFoundError:
+                    response = HttpResponse()
+                    response.status_code = 404
+                    return response
+
+                # since we fetched it from DB, let's cache it going forward: content < 1MB goes into
+                # memcached (and the process local cache if small enough) and larger content is
+                # spilled to the local disk cache
+                if content.length is not None:
+                    if content.length < MAX_MEMCACHED_CONTENT_SIZE:
+                        # since we've queried as a stream, let's read in the stream into memory to set in cache
+                        content = content.copy_to_in_mem()
+                        set_cached_content(content)
+                    else:
+                        disk_cached = spill_to_disk(content)
+                        if disk_cached is not None:
+                            set_cached_content(disk_cached)
 
-            # see if the client has cached this content, if so then compare the
-            # timestamps, if they are the same then just return a 304 (Not Modified)
-            if 'HTTP_IF_MODIFIED_SINCE' in request.META:
-                if_modified_since = request.META['HTTP_IF_MODIFIED_SINCE']
-                if if_modified_since == last_modified_at_str:
-                    return HttpResponseNotModified()
+            response = None
+            if 'HTTP_RANGE' in request.META and content.length is not None:
+                try:
+                    first_byte, last_byte = parse_range_header(request.META['HTTP_RANGE'], content.length)
+                except ValueError:
+                    # malformed or multiple ranges: ignore the header and send the whole content
+                    log.debug("Ignoring Range header %r for %s", request.META['HTTP_RANGE'], loc)
+                else:
+                    if first_byte is None:
+                        response = HttpResponse(status=416)
+                        response['Content-Range'] = 'bytes */{}'.format(content.length)
+                        return response
+                    response = HttpResponse(
+                        content.stream_data_in_range(first_byte, last_byte), content_type=content.content_type
+                    )
+                    response.status_code = 206
+                    response['Content-Range'] = 'bytes {}-{}/{}'.format(first_byte, last_byte, content.length)
+                    response['Content-Length'] = str(last_byte - first_byte + 1)
 
-            response = HttpResponse(content.stream_data(), content_type=content.content_type)
-            response['Last-Modified'] = last_modified_at_str
+            if response is None:
+                response = HttpResponse(content.stream_data(), content_type=content.content_type)
+                if content.length is not None:
+                    response['Content-Length'] = str(content.length)
+
+            response['Accept-Ranges'] = 'bytes'
+            set_caching_headers(response, content)
 
             return response
+
+
+def _etag(content):
+    """
+    The ETag of the content or None if its digest isn't known
+    """
+    content_digest = getattr(content, 'content_digest', None)
+    return '"{}"'.format(content_digest) if content_digest else None
+
+
+def _legacy_last_modified(last_modified_at):
+    """
+    The format Last-Modified used to be sent in, which some clients may still send back in If-Modified-Since
+    """
+    return last_modified_at.strftime("%a, %d-%b-%Y %H:%M:%S GMT")
+
+
+def set_caching_headers(response, content):
+    """
+    Set the Last-Modified, ETag and Cache-Control headers of a response for the given content.
+    """
+    if content.last_modified_at is not None:
+        response['Last-Modified'] = http_date(calendar.timegm(content.last_modified_at.utctimetuple()))
+    etag = _etag(content)
+    if etag:
+        response['ETag'] = etag
+    if getattr(content, 'locked', False):
+        # must be revalidated so that access gets checked
+        response['Cache-Control'] = 'private, no-cache'
+    else:
+        response['Cache-Control'] = 'public, max-age={}'.format(getattr(settings, 'CONTENTSERVER_MAX_AGE', 0))
+
+
+def is_not_modified(request, content):
+    """
+    Returns True if the request's If-None-Match or If-Modified-Since headers show the client already has
+    this version of the content. If-None-Match takes precedence as it's the more precise of the two.
+    """
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match is not None:
+        etag = _etag(content)
+        if etag is None:
+            return False
+        # weak comparison is fine for GET/HEAD
+        etags = [candidate.strip() for candidate in if_none_match.split(',')]
+        return '*' in etags or etag in etags or 'W/' + etag in etags
+
+    if_modified_since = request.META.get('HTTP_IF_MODIFIED_SINCE')
+    if if_modified_since is not None and content.last_modified_at is not None:
+        if if_modified_since == _legacy_last_modified(content.last_modified_at):
+            return True
+        if_modified_since = parse_http_date_safe(if_modified_since)
+        if if_modified_since is not None:
+            return calendar.timegm(content.last_modified_at.utctimetuple()) <= if_modified_since
+    return False
+
+
+def parse_range_header(header_value, content_length):
+    """
+    Parse the value of an HTTP Range header for a single byte range of content of the given length.
+
+    Returns (first_byte, last_byte) clipped to the content or (None, None) if the range can't be satisfied.
+    Raises ValueError if the header isn't a single, well formed byte range.
+    """
+    unit, _, byte_range = header_value.partition('=')
+    if unit.strip() != 'bytes' or ',' in byte_range:
+        raise ValueError(header_value)
+    match = BYTE_RANGE_RE.match(byte_range.strip())
+    if match is None or (match.group('first') == '' and match.group('last') == ''):
+        raise ValueError(header_value)
+
+    if match.group('first') == '':
+        # the last suffix_length bytes
+        suffix_length = int(match.group('last'))
+        if suffix_length == 0:
+            return None, None
+        return max(content_length - suffix_length, 0), content_length - 1
+
+    first_byte = int(match.group('first'))
+    last_byte = int(match.group('last')) if match.group('last') else content_length - 1
+    if last_byte < first_byte:
+        raise ValueError(header_value)
+    if first_byte >= content_length:
+        return None, None
+    return first_byte, min(last_byte, content_length - 1)
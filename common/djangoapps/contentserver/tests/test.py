@@ -3,6 +3,10 @@ Tests for StaticContentServer
 """
 import copy
 import logging
+import os
+import shutil
+import tempfile
+import unittest
 from uuid import uuid4
 from path import path
 from pymongo import MongoClient
@@ -11,7 +15,11 @@ from django.contrib.auth.models import User
 from django.conf import settings
 from django.test.client import Client
 from django.test.utils import override_settings
+from mock import patch
 
+from cache_toolbox.core import del_cached_content, get_cached_content
+from contentserver.disk_cache import DiskCachedContent, _evict
+from contentserver.middleware import parse_range_header
 from student.models import CourseEnrollment
 
 from xmodule.contentstore.django import contentstore, _CONTENTSTORE
@@ -131,3 +139,160 @@ class ContentStoreToyCourseTest(ModuleStoreTestCase):
         resp = self.client.get(self.url_locked)
         self.assertEqual(resp.status_code, 200) # pylint: disable=E1103
 
+
+    def test_range_request_full_file(self):
+        """
+        Test that a range request covering the whole asset returns all of it as partial content.
+        """
+        resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes=0-')
+        self.assertEqual(resp.status_code, 206)  # pylint: disable=E1103
+        content = self.contentstore.find(self.unlocked_asset)
+        self.assertEqual(
+            resp['Content-Range'],
+            'bytes {first}-{last}/{length}'.format(first=0, last=content.length - 1, length=content.length)
+        )
+        self.assertEqual(resp['Content-Length'], str(content.length))
+        self.assertEqual(resp.content, content.data)
+
+    def test_range_request_partial_file(self):
+        """
+        Test that a range request for part of the asset returns only those bytes.
+        """
+        content = self.contentstore.find(self.unlocked_asset)
+        first_byte, last_byte = 2, content.length / 2
+        resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes={}-{}'.format(first_byte, last_byte))
+        self.assertEqual(resp.status_code, 206)  # pylint: disable=E1103
+        self.assertEqual(resp['Content-Length'], str(last_byte - first_byte + 1))
+        self.assertEqual(resp.content, content.data[first_byte:last_byte + 1])
+
+    def test_range_request_unsatisfiable(self):
+        """
+        Test that a range starting past the end of the asset is refused.
+        """
+        content = self.contentstore.find(self.unlocked_asset)
+        resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes={}-'.format(content.length))
+        self.assertEqual(resp.status_code, 416)  # pylint: disable=E1103
+        self.assertEqual(resp['Content-Range'], 'bytes */{}'.format(content.length))
+
+    def test_range_request_malformed(self):
+        """
+        Test that multiple or malformed ranges are ignored and the whole asset is sent.
+        """
+        for header in ('bytes=0-1,4-5', 'bytes=abc', 'lines=0-1'):
+            resp = self.client.get(self.url_unlocked, HTTP_RANGE=header)
+            self.assertEqual(resp.status_code, 200)  # pylint: disable=E1103
+            self.assertEqual(resp['Accept-Ranges'], 'bytes')
+
+    def test_not_modified_etag(self):
+        """
+        Test that revalidating with the asset's ETag gets a 304 and a changed ETag gets the asset.
+        """
+        resp = self.client.get(self.url_unlocked)
+        etag = resp['ETag']
+        self.assertEqual(resp['Cache-Control'], 'public, max-age={}'.format(getattr(settings, 'CONTENTSERVER_MAX_AGE', 0)))
+
+        resp = self.client.get(self.url_unlocked, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 304)  # pylint: disable=E1103
+        self.assertEqual(resp['ETag'], etag)
+        resp = self.client.get(self.url_unlocked, HTTP_IF_NONE_MATCH='"other", W/{}'.format(etag))
+        self.assertEqual(resp.status_code, 304)  # pylint: disable=E1103
+        resp = self.client.get(self.url_unlocked, HTTP_IF_NONE_MATCH='"other"')
+        self.assertEqual(resp.status_code, 200)  # pylint: disable=E1103
+
+    def test_not_modified_since(self):
+        """
+        Test that If-Modified-Since is compared as a date rather than as a string.
+        """
+        resp = self.client.get(self.url_unlocked)
+        last_modified = resp['Last-Modified']
+        resp = self.client.get(self.url_unlocked, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(resp.status_code, 304)  # pylint: disable=E1103
+        resp = self.client.get(self.url_unlocked, HTTP_IF_MODIFIED_SINCE='Sun, 06 Nov 2050 08:49:37 GMT')
+        self.assertEqual(resp.status_code, 304)  # pylint: disable=E1103
+        resp = self.client.get(self.url_unlocked, HTTP_IF_MODIFIED_SINCE='Sun, 06 Nov 1994 08:49:37 GMT')
+        self.assertEqual(resp.status_code, 200)  # pylint: disable=E1103
+
+    def test_not_modified_without_reading_content(self):
+        """
+        Test that a revalidation which isn't cached only reads the asset's metadata.
+        """
+        etag = self.client.get(self.url_unlocked)['ETag']
+        del_cached_content(self.unlocked_asset)
+        with patch.object(self.contentstore, 'find') as mock_find:
+            resp = self.client.get(self.url_unlocked, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 304)  # pylint: disable=E1103
+        self.assertFalse(mock_find.called)
+
+    def test_locked_asset_not_modified_checks_access(self):
+        """
+        Test that revalidating a locked asset still requires access and isn't publicly cacheable.
+        """
+        self.client.login(username=self.staff_usr, password=self.staff_pwd)
+        resp = self.client.get(self.url_locked)
+        self.assertEqual(resp['Cache-Control'], 'private, no-cache')
+        etag = resp['ETag']
+        self.client.logout()
+        resp = self.client.get(self.url_locked, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, 403)  # pylint: disable=E1103
+
+    def test_large_asset_disk_cache(self):
+        """
+        Test that content too large for memcached is spilled to the disk cache and served from it.
+        """
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        del_cached_content(self.unlocked_asset)
+        content = self.contentstore.find(self.unlocked_asset)
+        with override_settings(CONTENTSERVER_DISK_CACHE={'DIRECTORY': cache_dir}):
+            with patch('contentserver.middleware.MAX_MEMCACHED_CONTENT_SIZE', 0):
+                resp = self.client.get(self.url_unlocked)
+                self.assertEqual(resp.status_code, 200)  # pylint: disable=E1103
+                self.assertEqual(resp.content, content.data)
+
+                cached = get_cached_content(self.unlocked_asset)
+                self.assertIsInstance(cached, DiskCachedContent)
+                with open(path(cache_dir) / cached.file_name, 'rb') as cached_file:
+                    self.assertEqual(cached_file.read(), content.data)
+
+                with patch('contentserver.middleware.contentstore') as mock_contentstore:
+                    resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes=1-3')
+                    self.assertFalse(mock_contentstore.called)
+                self.assertEqual(resp.status_code, 206)  # pylint: disable=E1103
+                self.assertEqual(resp.content, content.data[1:4])
+        del_cached_content(self.unlocked_asset)
+
+
+class DiskCacheEvictTest(unittest.TestCase):
+    """
+    Tests for evicting files from the content disk cache
+    """
+    def test_evicts_least_recently_used(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        for index, file_name in enumerate(('old', 'new')):
+            with open(os.path.join(cache_dir, file_name), 'wb') as cache_file:
+                cache_file.write('x' * 10)
+            os.utime(os.path.join(cache_dir, file_name), (0, 1000 + index))
+        _evict(cache_dir, 15)
+        self.assertEqual(os.listdir(cache_dir), ['new'])
+
+
+class ParseRangeHeaderTest(unittest.TestCase):
+    """
+    Tests for parsing Range headers
+    """
+    def test_ranges(self):
+        self.assertEqual(parse_range_header('bytes=0-99', 1000), (0, 99))
+        self.assertEqual(parse_range_header('bytes=500-', 1000), (500, 999))
+        self.assertEqual(parse_range_header('bytes=-100', 1000), (900, 999))
+        self.assertEqual(parse_range_header('bytes=-2000', 1000), (0, 999))
+        self.assertEqual(parse_range_header('bytes=900-2000', 1000), (900, 999))
+
+    def test_unsatisfiable(self):
+        self.assertEqual(parse_range_header('bytes=1000-', 1000), (None, None))
+        self.assertEqual(parse_range_header('bytes=-0', 1000), (None, None))
+
+    def test_malformed(self):
+        for header in ('bytes=0-1,4-5', 'bytes=abc', 'lines=0-1', 'bytes=5-1', 'bytes=-'):
+            with self.assertRaises(ValueError):
+                parse_range_header(header, 1000)
@@ -74,6 +74,19 @@ class CourseModeModelTest(TestCase):
         self.assertEqual(mode2, CourseMode.mode_for_course(self.course_key, u'verified'))
         self.assertIsNone(CourseMode.mode_for_course(self.course_key, 'DNE'))
 
+    def test_modes_for_courses(self):
+        """
+        Finding the modes of several courses at once
+        """
+        other_course_key = SlashSeparatedCourseKey('Test', 'OtherCourse', 'TestCourseRun')
+        self.create_mode('verified', 'Verified Certificate')
+        with self.assertNumQueries(1):
+            modes_by_course = CourseMode.modes_for_courses([self.course_key, other_course_key])
+        self.assertEqual(modes_by_course, {
+            self.course_key: CourseMode.modes_for_course(self.course_key),
+            other_course_key: [CourseMode.DEFAULT_MODE],
+        })
+
     def test_min_course_price_for_currency(self):
         """
         Get the min course price for a course according to currency
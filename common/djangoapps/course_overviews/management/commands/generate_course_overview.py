@@ -0,0 +1,29 @@
+"""
+Rebuild the CourseOverview rows for all courses (or the given ones) from the modulestore.
+"""
+from django.core.management.base import BaseCommand
+
+from course_overviews.models import CourseOverview
+from xmodule.error_module import ErrorDescriptor
+from xmodule.modulestore.django import modulestore
+from xmodule.modulestore.keys import CourseKey
+
+
+class Command(BaseCommand):
+    """
+    Refresh the course overviews, e.g., after xml courses change
+    """
+    args = '[<course_id> ...]'
+    help = 'Refresh the CourseOverview of each course id given or of all courses if none are given'
+
+    def handle(self, *args, **options):
+        if args:
+            courses = [modulestore().get_course(CourseKey.from_string(course_id)) for course_id in args]
+        else:
+            courses = modulestore().get_courses()
+
+        for course in courses:
+            if course is None or isinstance(course, ErrorDescriptor):
+                continue
+            CourseOverview.update_from_course(course)
+            self.stdout.write(u'Refreshed {}\n'.format(course.id))
@@ -0,0 +1,294 @@
+"""
+A denormalized summary of each course for pages which list courses (catalog, dashboard,
+Studio course listing) so they don't have to load every course's descriptor.
+
+WE'RE USING MIGRATIONS!
+
+If you make changes to this model, be sure to create an appropriate migration
+file and check it in at the same time as your model changes. To do that,
+
+1. Go to the edx-platform dir
+2. ./manage.py lms schemamigration course_overviews --auto description_of_your_change
+3. Add the migration file created in edx-platform/common/djangoapps/course_overviews/migrations/
+"""
+import logging
+from datetime import datetime
+from math import exp
+
+import dateutil.parser
+from django.db import models
+from django.utils.translation import ugettext as _
+from pytz import UTC
+
+from util.date_utils import strftime_localized
+from xmodule.contentstore.content import StaticContent
+from xmodule.course_module import CourseFields
+from xmodule.error_module import ErrorDescriptor
+from xmodule.fields import Date
+from xmodule.modulestore import XML_MODULESTORE_TYPE
+from xmodule.modulestore.django import modulestore
+from xmodule_django.models import CourseKeyField, NoneToEmptyManager
+
+log = logging.getLogger(__name__)
+
+
+class CourseOverview(models.Model):
+    """
+    The fields of a course needed to list it w/o loading the course from the modulestore.
+
+    It has the same attributes and methods as CourseDescriptor for what the catalog, the
+    dashboard and has_access need, so it can be passed to them instead of the course.
+
+    Rows are refreshed whenever Studio creates the course, saves its settings or imports it,
+    and are lazily created the first time a course is looked up by id. The catalog only
+    lists the courses which have a row; run the generate_course_overview command to add
+    the rows of courses which haven't been through Studio (e.g. xml courses).
+    """
+    objects = NoneToEmptyManager()
+
+    # the primary key, so that ``id`` can be the course's key as on CourseDescriptor
+    course_id = CourseKeyField(max_length=255, primary_key=True)
+
+    display_name = models.TextField(null=True)
+    display_org_with_default = models.TextField()
+    display_number_with_default = models.TextField()
+
+    start = models.DateTimeField(null=True)
+    end = models.DateTimeField(null=True)
+    advertised_start = models.TextField(null=True)
+    announcement = models.DateTimeField(null=True)
+    enrollment_start = models.DateTimeField(null=True)
+    enrollment_end = models.DateTimeField(null=True)
+    enrollment_domain = models.TextField(null=True)
+    days_early_for_beta = models.FloatField(null=True)
+
+    course_image_url = models.TextField()
+    static_asset_path = models.TextField(default='')
+    ispublic = models.NullBooleanField()
+    is_new = models.NullBooleanField()
+
+    certificates_show_before_end = models.BooleanField(default=False)
+    cert_name_short = models.TextField(default='')
+    cert_name_long = models.TextField(default='')
+    lowest_passing_grade = models.FloatField(null=True)
+    end_of_course_survey_url = models.TextField(null=True)
+
+    modified = models.DateTimeField(auto_now=True)
+
+    def __unicode__(self):
+        return u'{}: {}'.format(self.course_id, self.display_name)
+
+    @property
+    def id(self):  # pylint: disable=invalid-name
+        """
+        The course's key, as CourseDescriptor.id
+        """
+        return self.course_id
+
+    @property
+    def location(self):
+        """
+        The usage key of the course's root block
+        """
+        return self.course_id.make_usage_key('course', self.course_id.run)
+
+    @property
+    def org(self):
+        return self.course_id.org
+
+    @property
+    def number(self):
+        return self.course_id.course
+
+    @property
+    def display_name_with_default(self):
+        """
+        The display name or, if not set, the course's name with underscores replaced by spaces
+        """
+        if self.display_name is not None:
+            return self.display_name
+        return self.course_id.run.replace('_', ' ')
+
+    def has_started(self):
+        """
+        Returns True if the course has a start date and it has passed
+        """
+        return self.start is not None and datetime.now(UTC) > self.start
+
+    def has_ended(self):
+        """
+        Returns True if the course has an end date and it has passed
+        """
+        return self.end is not None and datetime.now(UTC) > self.end
+
+    def may_certify(self):
+        """
+        Return True if it is acceptable to show the student a certificate download link
+        """
+        return self.certificates_show_before_end or self.has_ended()
+
+    @property
+    def start_date_is_still_default(self):
+        """
+        Whether the course's start date hasn't been set nor advertised (see CourseDescriptor)
+        """
+        return self.advertised_start is None and self.start == CourseFields.start.default
+
+    @property
+    def start_date_text(self):
+        """
+        The text of the course's advertised start or, if there isn't one, start date (see
+        CourseDescriptor)
+        """
+        if isinstance(self.advertised_start, basestring):
+            try:
+                advertised_start = Date().from_json(self.advertised_start)
+            except ValueError:
+                advertised_start = None
+            if advertised_start is None:
+                return self.advertised_start.title()
+            return strftime_localized(advertised_start, "SHORT_DATE")
+        elif self.start_date_is_still_default:
+            # Translators: TBD stands for 'To Be Determined' and is used when a course
+            # does not yet have an announced start date.
+            return _('TBD')
+        return strftime_localized(self.start, "SHORT_DATE")
+
+    @property
+    def end_date_text(self):
+        """
+        The text of the course's end date or an empty string if it has none
+        """
+        if self.end is None:
+            return ''
+        return strftime_localized(self.end, "SHORT_DATE")
+
+    @property
+    def is_newish(self):
+        """
+        Whether the course is flagged as new or, if there is no flag, whether it was announced
+        in the last month or hasn't started yet (see CourseDescriptor)
+        """
+        if self.is_new is not None:
+            return self.is_new
+        announcement, start, now = self._sorting_dates()
+        if announcement and (now - announcement).days < 30:
+            return True
+        return (now - start).days < 1
+
+    @property
+    def sorting_score(self):
+        """
+        The lower, the "newer" the course, by its announcement or (advertised) start date (see
+        CourseDescriptor)
+        """
+        announcement, start, now = self._sorting_dates()
+        scale = 300.0  # about a year
+        if announcement:
+            return -exp(-(now - announcement).days / scale)
+        return exp((now - start).days / scale)
+
+    def _sorting_dates(self):
+        """
+        The announcement, (advertised) start and current dates for is_newish and sorting_score
+        """
+        try:
+            start = dateutil.parser.parse(self.advertised_start)
+            if start.tzinfo is None:
+                start = start.replace(tzinfo=UTC)
+        except (ValueError, AttributeError):
+            start = self.start
+        return self.announcement, start, datetime.now(UTC)
+
+    @classmethod
+    def update_from_course(cls, course):
+        """
+        Create or refresh the overview for the given CourseDescriptor and return it.
+        """
+        try:
+            overview = cls.objects.get(course_id=course.id)
+        except cls.DoesNotExist:
+            overview = cls(course_id=course.id)
+
+        overview.display_name = course.display_name
+        overview.display_org_with_default = course.display_org_with_default
+        overview.display_number_with_default = course.display_number_with_default
+        overview.start = course.start
+        overview.end = course.end
+        overview.advertised_start = course.advertised_start
+        overview.announcement = course.announcement
+        overview.enrollment_start = course.enrollment_start
+        overview.enrollment_end = course.enrollment_end
+        overview.enrollment_domain = course.enrollment_domain
+        overview.days_early_for_beta = course.days_early_for_beta
+        overview.course_image_url = _course_image_url(course)
+        overview.static_asset_path = course.static_asset_path
+        # ispublic comes from the lms xblock mixin
+        overview.ispublic = getattr(course, 'ispublic', None)
+        if isinstance(course.is_new, basestring):
+            overview.is_new = course.is_new.lower() in ['true', 'yes', 'y']
+        elif course.is_new is not None:
+            overview.is_new = bool(course.is_new)
+        else:
+            overview.is_new = None
+        overview.certificates_show_before_end = course.certificates_show_before_end
+        overview.cert_name_short = course.cert_name_short
+        overview.cert_name_long = course.cert_name_long
+        try:
+            overview.lowest_passing_grade = course.lowest_passing_grade
+        except ValueError:
+            # no grade cutoffs
+            overview.lowest_passing_grade = None
+        overview.end_of_course_survey_url = course.end_of_course_survey_url
+        overview.save()
+        return overview
+
+    @classmethod
+    def delete_for_course(cls, course_key):
+        """
+        Remove the overview for a deleted course
+        """
+        cls.objects.filter(course_id=course_key).delete()
+
+    @classmethod
+    def get_from_id(cls, course_key):
+        """
+        Return the overview for course_key or None if there is no such course.
+        """
+        return cls.get_from_ids([course_key]).get(course_key)
+
+    @classmethod
+    def get_from_ids(cls, course_keys):
+        """
+        Return a dict of {course_key: CourseOverview} for the given course keys using one query. Courses
+        w/o an overview yet are loaded from the modulestore and added; those which can't be loaded are
+        omitted.
+        """
+        course_keys = set(course_keys)
+        if not course_keys:
+            return {}
+        overviews = {
+            overview.course_id: overview
+            for overview in cls.objects.filter(course_id__in=course_keys)
+        }
+        for course_key in course_keys.difference(overviews):
+            course = modulestore().get_course(course_key)
+            if course is None or isinstance(course, ErrorDescriptor):
+                log.warning(u"Unable to create a CourseOverview for missing course %s", course_key)
+                continue
+            overviews[course_key] = cls.update_from_course(course)
+        return overviews
+
+
+def _course_image_url(course):
+    """
+    The url of the course's image (see courseware.courses.course_image_url)
+    """
+    if course.static_asset_path or modulestore().get_modulestore_type(course.id) == XML_MODULESTORE_TYPE:
+        url = '/static/' + (course.static_asset_path or getattr(course, 'data_dir', ''))
+        if course.course_image != course.fields['course_image'].default:
+            url += '/' + course.course_image
+        else:
+            url += '/images/course_image.jpg'
+        return url
+    return StaticContent.compute_location(course.id, course.course_image).to_deprecated_string()
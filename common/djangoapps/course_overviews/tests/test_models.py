@@ -0,0 +1,64 @@
+"""
+Tests for the CourseOverview model
+"""
+from datetime import datetime
+
+from django.test.utils import override_settings
+from pytz import UTC
+
+from course_overviews.models import CourseOverview
+from courseware.tests.modulestore_config import TEST_DATA_MONGO_MODULESTORE
+from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
+from xmodule.modulestore.tests.factories import CourseFactory
+
+
+@override_settings(MODULESTORE=TEST_DATA_MONGO_MODULESTORE)
+class CourseOverviewTest(ModuleStoreTestCase):
+    """
+    Tests for creating and refreshing course overviews
+    """
+    def setUp(self):
+        self.course = CourseFactory.create(
+            display_name='Robot Super Course',
+            start=datetime(2013, 1, 1, tzinfo=UTC),
+            end=datetime(2013, 6, 1, tzinfo=UTC),
+        )
+
+    def test_lazily_created(self):
+        self.assertFalse(CourseOverview.objects.filter(course_id=self.course.id).exists())
+        overview = CourseOverview.get_from_id(self.course.id)
+        self.assertEqual(overview.display_name_with_default, 'Robot Super Course')
+        self.assertEqual(overview.display_number_with_default, self.course.display_number_with_default)
+        self.assertEqual(overview.start, datetime(2013, 1, 1, tzinfo=UTC))
+        self.assertTrue(overview.has_ended())
+        self.assertTrue(CourseOverview.objects.filter(course_id=self.course.id).exists())
+
+    def test_matches_course(self):
+        # the catalog and dashboard use the overview in place of the course
+        overview = CourseOverview.update_from_course(self.course)
+        for attribute in (
+            'id', 'location', 'number', 'org', 'display_name_with_default', 'display_org_with_default',
+            'start_date_is_still_default', 'start_date_text', 'end_date_text', 'is_newish', 'sorting_score',
+            'cert_name_short', 'cert_name_long', 'lowest_passing_grade', 'end_of_course_survey_url',
+        ):
+            self.assertEqual(getattr(overview, attribute), getattr(self.course, attribute), attribute)
+        for method in ('has_started', 'has_ended', 'may_certify'):
+            self.assertEqual(getattr(overview, method)(), getattr(self.course, method)(), method)
+
+    def test_bulk_lookup(self):
+        other_course = CourseFactory.create(org='otherX')
+        missing_key = other_course.id.replace(run='missing')  # pylint: disable=no-member
+        CourseOverview.update_from_course(self.course)
+
+        with self.assertNumQueries(1):
+            CourseOverview.get_from_ids([self.course.id])
+        overviews = CourseOverview.get_from_ids([self.course.id, other_course.id, missing_key])
+        self.assertEqual(set(overviews), set([self.course.id, other_course.id]))
+
+    def test_refresh(self):
+        CourseOverview.update_from_course(self.course)
+        self.course.display_name = 'Renamed'
+        CourseOverview.update_from_course(self.course)
+        self.assertEqual(CourseOverview.objects.get(course_id=self.course.id).display_name, 'Renamed')
+        CourseOverview.delete_for_course(self.course.id)
+        self.assertFalse(CourseOverview.objects.filter(course_id=self.course.id).exists())
@@ -1,5 +1,10 @@
+from django.core.cache import cache
+
 from django_comment_common.models import Role
 
+# How long the LMS keeps a course's discussion modules (see clear_discussion_modules)
+DISCUSSION_MODULES_CACHE_TIMEOUT = 60 * 10
+
 _STUDENT_ROLE_PERMISSIONS = ["vote", "update_thread", "follow_thread", "unfollow_thread",
                              "update_comment", "create_sub_comment", "unvote", "create_thread",
                              "follow_commentable", "unfollow_commentable", "create_comment", ]
@@ -74,3 +79,18 @@ def are_permissions_roles_seeded(course_id):
             return False
 
     return True
+
+
+def discussion_modules_cache_key(course_key):
+    """
+    The key of the cached summary of the course's inline discussion modules
+    """
+    return u'django_comment_common.discussion_modules.{}'.format(course_key).encode('utf-8')
+
+
+def clear_discussion_modules(course_key):
+    """
+    Forget the cached summary of the course's inline discussion modules, from which the LMS
+    builds its discussion category map. Call this whenever the course's content changes.
+    """
+    cache.delete(discussion_modules_cache_key(course_key))
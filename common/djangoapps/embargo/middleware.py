@@ -31,6 +31,10 @@ EMBARGO_SITE_REDIRECT_URL = 'https://www.edx.org/'
 
 """
 import logging
+import threading
+import time
+from collections import OrderedDict
+
 import pygeoip
 
 from django.core.exceptions import MiddlewareNotUsed
@@ -76,11 +80,11 @@ class EmbargoMiddleware(object):
                 response = HttpResponseRedirect(redirect_url) if redirect_url \
                            else HttpResponseForbidden('Access Denied')
 
-            # If we're having performance issues, add caching here
             ip_addr = get_ip(request)
+            country_code_from_ip, reason = _embargo_decision(ip_addr)
 
             # if blacklisted, immediately fail
-            if ip_addr in IPFilter.current().blacklist_ips:
+            if reason == BLACKLISTED:
                 if course_is_embargoed:
                     msg = "Embargo: Restricting IP address %s to course %s because IP is blacklisted." % \
                           (ip_addr, course_id)
@@ -90,10 +94,8 @@ class EmbargoMiddleware(object):
                 log.info(msg)
                 return response
 
-            country_code_from_ip = pygeoip.GeoIP(settings.GEOIP_PATH).country_code_by_addr(ip_addr)
-            is_embargoed = country_code_from_ip in EmbargoedState.current().embargoed_countries_list
             # Fail if country is embargoed and the ip address isn't explicitly whitelisted
-            if is_embargoed and ip_addr not in IPFilter.current().whitelist_ips:
+            if reason == EMBARGOED_COUNTRY:
                 if course_is_embargoed:
                     msg = "Embargo: Restricting IP address %s to course %s because IP is from country %s." % \
                           (ip_addr, course_id, country_code_from_ip)
@@ -103,3 +105,71 @@ class EmbargoMiddleware(object):
 
                 log.info(msg)
                 return response
+
+
+# The reasons an IP address is embargoed
+BLACKLISTED = 'blacklisted'
+EMBARGOED_COUNTRY = 'embargoed_country'
+
+# How many IP addresses' decisions to remember and for how many seconds
+DECISION_CACHE_SIZE = 10000
+DECISION_CACHE_TIMEOUT = 300
+
+_geoip = None
+_geoip_lock = threading.Lock()
+_decisions = OrderedDict()  # (ip address, configuration version) -> (expires at, country code, reason)
+_decisions_lock = threading.Lock()
+
+
+def _geoip_reader():
+    """
+    The process wide GeoIP reader, which memory maps the database the first time it's needed
+    """
+    global _geoip  # pylint: disable=global-statement
+    if _geoip is None:
+        with _geoip_lock:
+            if _geoip is None:
+                _geoip = pygeoip.GeoIP(settings.GEOIP_PATH, pygeoip.MMAP_CACHE)
+    return _geoip
+
+
+def clear_decision_cache():
+    """
+    Forget the remembered embargo decisions
+    """
+    with _decisions_lock:
+        _decisions.clear()
+
+
+def _embargo_decision(ip_addr):
+    """
+    Returns (country code, reason) for the IP address, where reason is BLACKLISTED,
+    EMBARGOED_COUNTRY or None if the address isn't embargoed.
+
+    Decisions are remembered for a while per IP address and version of the IPFilter and
+    EmbargoedState configuration; so, a configuration change takes effect immediately.
+    """
+    ip_filter = IPFilter.current()
+    embargoed_state = EmbargoedState.current()
+    key = (ip_addr, ip_filter.pk, ip_filter.change_date, embargoed_state.pk, embargoed_state.change_date)
+
+    now = time.time()
+    with _decisions_lock:
+        decision = _decisions.pop(key, None)
+        if decision is not None and decision[0] > now:
+            _decisions[key] = decision
+            return decision[1], decision[2]
+
+    country_code, reason = None, None
+    if ip_addr in ip_filter.blacklist_ips:
+        reason = BLACKLISTED
+    else:
+        country_code = _geoip_reader().country_code_by_addr(ip_addr)
+        if country_code in embargoed_state.embargoed_countries_list and ip_addr not in ip_filter.whitelist_ips:
+            reason = EMBARGOED_COUNTRY
+
+    with _decisions_lock:
+        _decisions[key] = (now + DECISION_CACHE_TIMEOUT, country_code, reason)
+        while len(_decisions) > DECISION_CACHE_SIZE:
+            _decisions.popitem(last=False)
+    return country_code, reason
@@ -16,6 +16,7 @@ from xmodule.modulestore.tests.factories import CourseFactory
 
 # Explicitly import the cache from ConfigurationModel so we can reset it after each test
 from config_models.models import cache
+from embargo.middleware import clear_decision_cache
 from embargo.models import EmbargoedCourse, EmbargoedState, IPFilter
 
 
@@ -52,6 +53,7 @@ class EmbargoMiddlewareTests(TestCase):
         # Explicitly clear ConfigurationModel's cache so tests have a clear cache
         # and don't interfere with each other
         cache.clear()
+        clear_decision_cache()
         self.patcher.stop()
 
     def mock_country_code_by_addr(self, ip_addr):
@@ -185,6 +187,21 @@ class EmbargoMiddlewareTests(TestCase):
         response = self.client.get(self.regular_page, HTTP_X_FORWARDED_FOR='5.0.0.0', REMOTE_ADDR='5.0.0.0')
         self.assertEqual(response.status_code, 200)
 
+    @unittest.skipUnless(settings.ROOT_URLCONF == 'lms.urls', 'Test only valid in lms')
+    def test_decisions_cached(self):
+        with mock.patch.object(
+            pygeoip.GeoIP, 'country_code_by_addr', mock.Mock(side_effect=self.mock_country_code_by_addr)
+        ) as mock_lookup:
+            for __ in range(2):
+                response = self.client.get(self.embargoed_page, HTTP_X_FORWARDED_FOR='1.0.0.0', REMOTE_ADDR='1.0.0.0')
+                self.assertEqual(response.status_code, 302)
+            self.assertEqual(mock_lookup.call_count, 1)
+
+            # Changing the configuration takes effect immediately
+            IPFilter(whitelist='1.0.0.0', changed_by=self.user, enabled=True).save()
+            response = self.client.get(self.embargoed_page, HTTP_X_FORWARDED_FOR='1.0.0.0', REMOTE_ADDR='1.0.0.0')
+            self.assertEqual(response.status_code, 200)
+
     @unittest.skipUnless(settings.ROOT_URLCONF == 'lms.urls', 'Test only valid in lms')
     @mock.patch.dict(settings.FEATURES, {'EMBARGO': False})
     def test_countries_embargo_off(self):
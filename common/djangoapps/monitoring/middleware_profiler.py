@@ -0,0 +1,219 @@
+"""
+An opt-in, sampling profiler of the middleware stack.
+
+When enabled (FEATURES['ENABLE_MIDDLEWARE_PROFILER']), every configured middleware's
+process_request, process_view, process_response and process_exception methods are
+wrapped. For a sample of requests, the wrapper records each call's wall time and the
+number of database queries and cache operations it made. The totals are sent to
+datadog and logged in a report every REPORT_INTERVAL seconds.
+
+Configure it with:
+
+MIDDLEWARE_PROFILER = {
+    'SAMPLE_RATE': 0.01,  # the fraction of requests to profile
+    'REPORT_INTERVAL': 300,  # seconds between logged reports
+}
+
+"""
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
+from functools import wraps
+from importlib import import_module
+
+from django.conf import settings
+from django.core.cache import get_cache
+from django.db import connections
+
+from dogapi import dog_stats_api
+
+log = logging.getLogger(__name__)
+
+PROFILED_METHODS = ('process_request', 'process_view', 'process_response', 'process_exception')
+CACHE_METHODS = ('get', 'get_many', 'set', 'set_many', 'add', 'delete', 'delete_many', 'incr', 'decr')
+
+_local = threading.local()
+_stats_lock = threading.Lock()
+# (middleware, method) -> {'calls', 'time', 'max_time', 'queries', 'cache_ops'}
+_stats = defaultdict(lambda: {'calls': 0, 'time': 0.0, 'max_time': 0.0, 'queries': 0, 'cache_ops': 0})
+_last_report = [time.time()]
+# (class, method name, the class's own attribute before install or None) for uninstall
+_patched = []
+
+
+def _config(name, default):
+    return getattr(settings, 'MIDDLEWARE_PROFILER', {}).get(name, default)
+
+
+def install():
+    """
+    Wrap the methods of the configured middleware and count cache operations
+    """
+    for middleware_path in settings.MIDDLEWARE_CLASSES:
+        module_name, class_name = middleware_path.rsplit('.', 1)
+        try:
+            middleware_class = getattr(import_module(module_name), class_name)
+        except (ImportError, AttributeError):
+            log.warning("Unable to profile middleware %s", middleware_path)
+            continue
+        for method_name in PROFILED_METHODS:
+            if getattr(middleware_class.__dict__.get(method_name), '_profiled', False):
+                continue
+            # the method may be inherited (possibly from another profiled middleware)
+            method = getattr(middleware_class, method_name, None)
+            if method is not None:
+                method = getattr(method.im_func, '_original', method.im_func)
+                _patch(middleware_class, method_name, _profiled(middleware_path, method_name, method))
+
+    for alias in getattr(settings, 'CACHES', {}):
+        cache_class = get_cache(alias).__class__
+        for method_name in CACHE_METHODS:
+            method = getattr(cache_class, method_name, None)
+            if method is not None and not getattr(method, '_counted', False):
+                _patch(cache_class, method_name, _counted(method.im_func))
+
+
+def uninstall():
+    """
+    Restore the methods install wrapped
+    """
+    while _patched:
+        cls, method_name, previous = _patched.pop()
+        if previous is None:
+            delattr(cls, method_name)
+        else:
+            setattr(cls, method_name, previous)
+
+
+def _patch(cls, method_name, wrapper):
+    """
+    Set the wrapper as cls's method, remembering what it replaced for uninstall
+    """
+    _patched.append((cls, method_name, cls.__dict__.get(method_name)))
+    setattr(cls, method_name, wrapper)
+
+
+def _counted(method):
+    """
+    Wrap a cache method to count its calls during profiled middleware calls
+    """
+    @wraps(method)
+    def counted(*args, **kwargs):
+        if getattr(_local, 'cache_ops', None) is not None:
+            _local.cache_ops += 1
+        return method(*args, **kwargs)
+    counted._counted = True  # pylint: disable=protected-access
+    return counted
+
+
+def _query_count():
+    """The number of queries recorded by the debug cursors of all connections"""
+    return sum(len(connection.queries) for connection in connections.all())
+
+
+def _is_sampled(request):
+    """
+    Decide once per request whether it's profiled
+    """
+    sampled = getattr(request, '_middleware_profiler_sampled', None)
+    if sampled is None:
+        sampled = random.random() < _config('SAMPLE_RATE', 0.01)
+        try:
+            request._middleware_profiler_sampled = sampled  # pylint: disable=protected-access
+        except AttributeError:
+            return False
+    return sampled
+
+
+def _profiled(middleware_path, method_name, method):
+    """
+    Wrap a middleware method to record its cost on sampled requests
+    """
+    @wraps(method)
+    def profiled(self, request, *args, **kwargs):
+        if not _is_sampled(request) or getattr(_local, 'cache_ops', None) is not None:
+            # not sampled, or a nested call which is counted as part of the outer one
+            return method(self, request, *args, **kwargs)
+
+        debug_cursors = [(connection, connection.use_debug_cursor) for connection in connections.all()]
+        for connection, __ in debug_cursors:
+            connection.use_debug_cursor = True
+        queries_before = _query_count()
+        _local.cache_ops = 0
+        start = time.time()
+        try:
+            return method(self, request, *args, **kwargs)
+        finally:
+            elapsed = time.time() - start
+            cache_ops = _local.cache_ops
+            _local.cache_ops = None
+            queries = _query_count() - queries_before
+            for connection, use_debug_cursor in debug_cursors:
+                connection.use_debug_cursor = use_debug_cursor
+            _record(middleware_path, method_name, elapsed, queries, cache_ops)
+    profiled._profiled = True  # pylint: disable=protected-access
+    profiled._original = method  # pylint: disable=protected-access
+    return profiled
+
+
+def _record(middleware_path, method_name, elapsed, queries, cache_ops):
+    """
+    Add a call's cost to the totals, send it to datadog and log a report if it's time
+    """
+    tags = [u'middleware:{}'.format(middleware_path), u'method:{}'.format(method_name)]
+    dog_stats_api.histogram('edxapp.middleware.time', elapsed * 1000, tags=tags)
+    dog_stats_api.histogram('edxapp.middleware.queries', queries, tags=tags)
+    dog_stats_api.histogram('edxapp.middleware.cache_ops', cache_ops, tags=tags)
+
+    report = None
+    with _stats_lock:
+        stats = _stats[(middleware_path, method_name)]
+        stats['calls'] += 1
+        stats['time'] += elapsed
+        stats['max_time'] = max(stats['max_time'], elapsed)
+        stats['queries'] += queries
+        stats['cache_ops'] += cache_ops
+        if time.time() - _last_report[0] >= _config('REPORT_INTERVAL', 300):
+            _last_report[0] = time.time()
+            report = format_report()
+    if report:
+        log.info(u"Middleware profile:\n%s", report)
+
+
+def get_stats():
+    """
+    Returns a copy of the totals: {(middleware, method): {'calls', 'time', 'max_time', 'queries', 'cache_ops'}}
+    """
+    with _stats_lock:
+        return {key: dict(value) for key, value in _stats.iteritems()}
+
+
+def reset_stats():
+    """
+    Forget the totals
+    """
+    with _stats_lock:
+        _stats.clear()
+
+
+def format_report():
+    """
+    The totals as a table, the most expensive middleware first
+    """
+    lines = [u'{:<70} {:>8} {:>10} {:>10} {:>8} {:>8}'.format(
+        'middleware.method', 'calls', 'avg ms', 'max ms', 'avg db', 'avg cache'
+    )]
+    totals = sorted(_stats.iteritems(), key=lambda item: item[1]['time'], reverse=True)
+    for (middleware_path, method_name), stats in totals:
+        calls = stats['calls']
+        lines.append(u'{:<70} {:>8} {:>10.2f} {:>10.2f} {:>8.2f} {:>8.2f}'.format(
+            u'{}.{}'.format(middleware_path, method_name),
+            calls,
+            stats['time'] * 1000 / calls,
+            stats['max_time'] * 1000,
+            float(stats['queries']) / calls,
+            float(stats['cache_ops']) / calls,
+        ))
+    return u'\n'.join(lines)
@@ -0,0 +1,87 @@
+"""
+Tests of the middleware profiler
+"""
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.http import HttpRequest
+from django.test import TestCase
+from django.test.utils import override_settings
+from mock import patch
+
+from monitoring import middleware_profiler
+
+
+class ExampleMiddleware(object):
+    """
+    Middleware which makes a query and uses the cache
+    """
+    def process_request(self, request):  # pylint: disable=unused-argument
+        cache.get('example')
+        User.objects.count()
+
+    def process_response(self, request, response):  # pylint: disable=unused-argument
+        return response
+
+
+class InheritingMiddleware(ExampleMiddleware):
+    """
+    Middleware whose methods are all inherited
+    """
+    pass
+
+
+@override_settings(
+    MIDDLEWARE_CLASSES=('monitoring.tests.ExampleMiddleware',),
+    MIDDLEWARE_PROFILER={'SAMPLE_RATE': 1, 'REPORT_INTERVAL': 0},
+)
+class MiddlewareProfilerTests(TestCase):
+    """
+    Tests of the middleware profiler
+    """
+    def setUp(self):
+        middleware_profiler.install()
+        self.addCleanup(middleware_profiler.uninstall)
+        middleware_profiler.reset_stats()
+
+    def test_profiled(self):
+        middleware = ExampleMiddleware()
+        request = HttpRequest()
+        with patch('monitoring.middleware_profiler.log') as mock_log:
+            middleware.process_request(request)
+            response = middleware.process_response(request, 'response')
+        self.assertEquals(response, 'response')
+        self.assertTrue(mock_log.info.called)
+
+        stats = middleware_profiler.get_stats()
+        request_stats = stats[('monitoring.tests.ExampleMiddleware', 'process_request')]
+        self.assertEquals(request_stats['calls'], 1)
+        self.assertEquals(request_stats['queries'], 1)
+        self.assertEquals(request_stats['cache_ops'], 1)
+        response_stats = stats[('monitoring.tests.ExampleMiddleware', 'process_response')]
+        self.assertEquals(response_stats['queries'], 0)
+        self.assertEquals(response_stats['cache_ops'], 0)
+
+    def test_not_sampled(self):
+        with self.settings(MIDDLEWARE_PROFILER={'SAMPLE_RATE': 0}):
+            ExampleMiddleware().process_request(HttpRequest())
+        self.assertEquals(middleware_profiler.get_stats(), {})
+
+    def test_installed_once(self):
+        middleware_profiler.install()
+        ExampleMiddleware().process_request(HttpRequest())
+        stats = middleware_profiler.get_stats()
+        self.assertEquals(stats[('monitoring.tests.ExampleMiddleware', 'process_request')]['calls'], 1)
+
+    def test_inherited_methods(self):
+        with self.settings(MIDDLEWARE_CLASSES=('monitoring.tests.InheritingMiddleware',)):
+            middleware_profiler.install()
+        InheritingMiddleware().process_request(HttpRequest())
+        ExampleMiddleware().process_request(HttpRequest())
+        stats = middleware_profiler.get_stats()
+        self.assertEquals(stats[('monitoring.tests.InheritingMiddleware', 'process_request')]['calls'], 1)
+        self.assertEquals(stats[('monitoring.tests.ExampleMiddleware', 'process_request')]['calls'], 1)
+
+    def test_uninstall(self):
+        middleware_profiler.uninstall()
+        self.assertNotIn('_profiled', ExampleMiddleware.__dict__['process_request'].__dict__)
+        self.assertFalse(hasattr(cache.__class__.get, '_counted'))
@@ -7,14 +7,24 @@ class RequestCache(object):
     @classmethod
     def get_request_cache(cls):
         return _request_cache_threadlocal
-            
+
+    @classmethod
+    def get_current_request(cls):
+        """
+        The request this thread is handling or None if it isn't handling one (e.g. in a
+        management command or celery task, where the request cache is never cleared)
+        """
+        return getattr(_request_cache_threadlocal, 'request', None)
+
     def clear_request_cache(self):
         _request_cache_threadlocal.data = {}
 
     def process_request(self, request):
         self.clear_request_cache()
+        _request_cache_threadlocal.request = request
         return None
 
     def process_response(self, request, response):
         self.clear_request_cache()
+        _request_cache_threadlocal.request = None
         return response
\ No newline at end of file
@@ -2,6 +2,7 @@
 Models for reverification features common to both lms and studio
 """
 from datetime import datetime
+import logging
 import pytz
 
 from django.core.exceptions import ValidationError
@@ -9,6 +10,7 @@ from django.db import models
 from util.validate_on_save import ValidateOnSaveMixin
 from xmodule_django.models import CourseKeyField
 
+log = logging.getLogger(__name__)
 
 class MidcourseReverificationWindow(ValidateOnSaveMixin, models.Model):
     """
@@ -53,3 +55,25 @@ class MidcourseReverificationWindow(ValidateOnSaveMixin, models.Model):
             return cls.objects.get(course_id=course_id, start_date__lte=date, end_date__gte=date)
         except cls.DoesNotExist:
             return None
+
+    @classmethod
+    def get_windows(cls, course_ids, date):
+        """
+        Returns a dictionary mapping each of the given course ids which has a window
+        open on the given date to that window, using a single query. Courses with
+        no open window, or with more than one (which clean() should have prevented and
+        which get_window raises for), are left out; the latter are logged.
+        """
+        course_ids = list(course_ids)
+        if not course_ids:
+            return {}
+        windows = {}
+        duplicated = set()
+        for window in cls.objects.filter(course_id__in=course_ids, start_date__lte=date, end_date__gte=date):
+            if window.course_id in windows:
+                duplicated.add(window.course_id)
+            windows[window.course_id] = window
+        for course_id in duplicated:
+            log.error(u"Course %s has overlapping reverification windows open on %s", course_id, date)
+            del windows[course_id]
+        return windows
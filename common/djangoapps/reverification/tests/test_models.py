@@ -7,6 +7,7 @@ import pytz
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 from django.test.utils import override_settings
+from mock import patch
 
 from courseware.tests.tests import TEST_DATA_MONGO_MODULESTORE
 from reverification.models import MidcourseReverificationWindow
@@ -71,3 +72,26 @@ class TestMidcourseReverificationWindow(TestCase):
                 end_date=datetime.now(pytz.utc) + timedelta(days=4)
             )
             window_invalid.save()
+
+    def test_get_windows(self):
+        now = datetime.now(pytz.utc)
+        window = MidcourseReverificationWindowFactory(
+            course_id=self.course_id,
+            start_date=now - timedelta(days=3),
+            end_date=now + timedelta(days=3)
+        )
+        other_course_id = CourseFactory.create(org='otherX').id
+        self.assertEquals(
+            MidcourseReverificationWindow.get_windows([self.course_id, other_course_id], now),
+            {self.course_id: window}
+        )
+
+        # overlapping windows (which can only be created by bypassing clean()) are logged and left out
+        MidcourseReverificationWindow.objects.bulk_create([MidcourseReverificationWindow(
+            course_id=self.course_id,
+            start_date=now - timedelta(days=2),
+            end_date=now + timedelta(days=4)
+        )])
+        with patch('reverification.models.log') as mock_log:
+            self.assertEquals(MidcourseReverificationWindow.get_windows([self.course_id], now), {})
+        self.assertTrue(mock_log.error.called)
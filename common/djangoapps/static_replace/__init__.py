@@ -11,6 +11,10 @@ from xmodule.contentstore.content import StaticContent
 
 log = logging.getLogger(__name__)
 
+# the most staticfiles_storage lookups remembered by _staticfiles_url
+STATICFILES_URLS_MAX_ENTRIES = 10000
+_staticfiles_urls = {'storage': None, 'urls': {}}
+
 
 def _url_replace_regex(prefix):
     """
@@ -43,6 +47,28 @@ def try_staticfiles_lookup(path):
     return url
 
 
+def _staticfiles_url(path):
+    """
+    Returns the staticfiles_storage url of path or None if it's not in staticfiles_storage. Answers
+    are remembered as the collected static files don't change while the process runs (except in DEBUG).
+    """
+    if settings.DEBUG or _staticfiles_urls['storage'] is not staticfiles_storage or \
+            len(_staticfiles_urls['urls']) >= STATICFILES_URLS_MAX_ENTRIES:
+        _staticfiles_urls['storage'] = staticfiles_storage
+        _staticfiles_urls['urls'] = {}
+    urls = _staticfiles_urls['urls']
+    if path not in urls:
+        url = None
+        try:
+            if staticfiles_storage.exists(path):
+                url = staticfiles_storage.url(path)
+        except Exception as err:
+            log.warning("staticfiles_storage couldn't find path {0}: {1}".format(
+                path, str(err)))
+        urls[path] = url
+    return urls[path]
+
+
 def replace_jump_to_id_urls(text, course_id, jump_to_id_base_url):
     """
     This will replace a link to another piece of courseware to a 'jump_to'
@@ -105,34 +131,52 @@ def replace_static_urls(text, data_directory, course_id=None, static_asset_path=
     static_asset_path: Path for static assets, which overrides data_directory and course_namespace, if nonempty
     """
 
+    static_url_for = _static_url_resolver(data_directory, course_id, static_asset_path)
+
     def replace_static_url(match):
-        original = match.group(0)
-        prefix = match.group('prefix')
+        url = static_url_for(match.group('prefix'), match.group('rest'))
+        if url is None:
+            return match.group(0)
         quote = match.group('quote')
-        rest = match.group('rest')
+        return "".join([quote, url, quote])
+
+    return re.sub(_url_replace_regex(_static_prefix_regex(data_directory, static_asset_path)), replace_static_url, text)
 
+
+def _static_prefix_regex(data_directory, static_asset_path):
+    """
+    The regex for the prefix of the static urls which replace_static_urls rewrites
+    """
+    return u'(?:{static_url}|/static/)(?!{data_dir})'.format(
+        static_url=settings.STATIC_URL,
+        data_dir=static_asset_path or data_directory
+    )
+
+
+def _static_url_resolver(data_directory, course_id, static_asset_path):
+    """
+    Returns a function which maps the prefix and rest of a static url to the url to replace it with
+    or None if it should be left alone. See replace_static_urls.
+    """
+    # if we're running with a MongoBacked store course_namespace is not None, then use studio style urls
+    use_contentstore = (
+        (not static_asset_path) and course_id and
+        modulestore().get_modulestore_type(course_id) != XML_MODULESTORE_TYPE
+    )
+
+    def static_url_for(prefix, rest):
         # Don't mess with things that end in '?raw'
         if rest.endswith('?raw'):
-            return original
+            return None
 
         # In debug mode, if we can find the url as is,
         if settings.DEBUG and finders.find(rest, True):
-            return original
-        # if we're running with a MongoBacked store course_namespace is not None, then use studio style urls
-        elif (not static_asset_path) and course_id and modulestore().get_modulestore_type(course_id) != XML_MODULESTORE_TYPE:
+            return None
+        elif use_contentstore:
             # first look in the static file pipeline and see if we are trying to reference
             # a piece of static content which is in the edx-platform repo (e.g. JS associated with an xmodule)
-
-            exists_in_staticfiles_storage = False
-            try:
-                exists_in_staticfiles_storage = staticfiles_storage.exists(rest)
-            except Exception as err:
-                log.warning("staticfiles_storage couldn't find path {0}: {1}".format(
-                    rest, str(err)))
-
-            if exists_in_staticfiles_storage:
-                url = staticfiles_storage.url(rest)
-            else:
+            url = _staticfiles_url(rest)
+            if url is None:
                 # if not, then assume it's courseware specific content and then look in the
                 # Mongo-backed database
                 url = StaticContent.convert_legacy_static_url_with_course_id(rest, course_id)
@@ -150,14 +194,36 @@ def replace_static_urls(text, data_directory, course_id=None, static_asset_path=
                 log.warning("staticfiles_storage couldn't find path {0}: {1}".format(
                     rest, str(err)))
                 url = "".join([prefix, course_path])
+        return url
 
+    return static_url_for
+
+
+def replace_urls(text, data_directory, course_id, static_asset_path='', jump_to_id_base_url=None):
+    """
+    Apply replace_jump_to_id_urls (if jump_to_id_base_url is given), replace_course_urls and
+    replace_static_urls to text in a single pass over it.
+    """
+    course_url_base = '/courses/' + course_id.to_deprecated_string() + '/'
+    static_url_for = _static_url_resolver(data_directory, course_id, static_asset_path)
+    prefixes = [
+        u'(?P<static>{})'.format(_static_prefix_regex(data_directory, static_asset_path)),
+        u'(?P<course>/course/)',
+    ]
+    if jump_to_id_base_url is not None:
+        prefixes.append(u'(?P<jump_to_id>/jump_to_id/)')
+
+    def replace_url(match):
+        quote = match.group('quote')
+        rest = match.group('rest')
+        if match.group('static') is not None:
+            url = static_url_for(match.group('prefix'), rest)
+            if url is None:
+                return match.group(0)
+        elif match.group('course') is not None:
+            url = course_url_base + rest
+        else:
+            url = jump_to_id_base_url + rest
         return "".join([quote, url, quote])
 
-    return re.sub(
-        _url_replace_regex(u'(?:{static_url}|/static/)(?!{data_dir})'.format(
-            static_url=settings.STATIC_URL,
-            data_dir=static_asset_path or data_directory
-        )),
-        replace_static_url,
-        text
-    )
+    return re.sub(_url_replace_regex(u'|'.join(prefixes)), replace_url, text)
@@ -1,8 +1,8 @@
 import re
 
 from nose.tools import assert_equals, assert_true, assert_false  # pylint: disable=E0611
-from static_replace import (replace_static_urls, replace_course_urls,
-                            _url_replace_regex)
+from static_replace import (replace_static_urls, replace_course_urls, replace_jump_to_id_urls,
+                            replace_urls, _url_replace_regex)
 from mock import patch, Mock
 
 from xmodule.modulestore.locations import SlashSeparatedCourseKey
@@ -123,3 +123,45 @@ def test_regex():
     for s in no:
         print 'Should not match: {0!r}'.format(s)
         assert_false(re.match(regex, s))
+
+
+@patch('static_replace.staticfiles_storage')
+@patch('static_replace.modulestore')
+def test_staticfiles_lookups_remembered(mock_modulestore, mock_storage):
+    """
+    Make sure course asset urls don't look the same path up in staticfiles_storage twice
+    """
+    mock_storage.exists.return_value = False
+    mock_modulestore.return_value = Mock(MongoModuleStore)
+
+    with patch('static_replace.StaticContent') as mock_static_content:
+        mock_static_content.convert_legacy_static_url_with_course_id.return_value = '/c4x/org/course/asset/file.png'
+        for __ in range(2):
+            assert_equals(
+                '"/c4x/org/course/asset/file.png"',
+                replace_static_urls('"/static/file.png?a=b"', DATA_DIRECTORY, course_id=COURSE_KEY)
+            )
+    mock_storage.exists.assert_called_once_with('file.png?a=b')
+
+
+@patch('static_replace.staticfiles_storage')
+@patch('static_replace.modulestore')
+def test_replace_urls(mock_modulestore, mock_storage):
+    """
+    Make sure replace_urls does what replace_jump_to_id_urls, replace_course_urls and replace_static_urls do
+    """
+    mock_storage.exists.return_value = False
+    mock_storage.url.side_effect = lambda path: '/static/' + path
+    mock_modulestore.return_value = Mock(XMLModuleStore)
+    jump_to_id_base_url = '/courses/org/course/run/jump_to_id/'
+    text = 'a "/static/file.png" b \'/course/info\' c "/jump_to_id/abc" d "/static/file.png?raw" e "/foo"'
+
+    expected = replace_static_urls(
+        replace_course_urls(replace_jump_to_id_urls(text, COURSE_KEY, jump_to_id_base_url), COURSE_KEY),
+        DATA_DIRECTORY, course_id=COURSE_KEY
+    )
+    assert_equals(expected, replace_urls(text, DATA_DIRECTORY, COURSE_KEY, jump_to_id_base_url=jump_to_id_base_url))
+    assert_equals(
+        replace_static_urls(replace_course_urls(text, COURSE_KEY), DATA_DIRECTORY, course_id=COURSE_KEY),
+        replace_urls(text, DATA_DIRECTORY, COURSE_KEY)
+    )
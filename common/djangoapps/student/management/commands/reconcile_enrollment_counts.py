@@ -0,0 +1,40 @@
+"""
+Recompute the maintained enrollment counts of courses from the enrollment table
+"""
+from django.core.management.base import BaseCommand, CommandError
+from opaque_keys import InvalidKeyError
+
+from student.models import CourseEnrollment, CourseEnrollmentCount
+from xmodule.modulestore.locations import SlashSeparatedCourseKey
+
+
+class Command(BaseCommand):
+
+    args = "[<course_id> ...]"
+    help = """
+    Recomputes the enrollment counts (CourseEnrollmentCount) of the given courses,
+    or of every course with enrollments or counts, from the enrollment table.
+    Run it periodically to correct any drift, e.g. from bulk updates of enrollments.
+
+    Example:
+
+          $ ... reconcile_enrollment_counts edX/Open_DemoX/edx_demo_course
+
+    """
+
+    def handle(self, *args, **options):
+        if args:
+            try:
+                course_ids = [SlashSeparatedCourseKey.from_deprecated_string(course_id) for course_id in args]
+            except InvalidKeyError:
+                raise CommandError("Invalid course id")
+        else:
+            # values_list gives the course ids as strings
+            course_ids = set()
+            for model in (CourseEnrollment, CourseEnrollmentCount):
+                course_ids.update(model.objects.order_by().values_list('course_id', flat=True).distinct())
+            course_ids = [SlashSeparatedCourseKey.from_deprecated_string(course_id) for course_id in sorted(course_ids)]
+
+        for course_id in course_ids:
+            counts = CourseEnrollmentCount.reconcile(course_id)
+            self.stdout.write(u"{}: {}\n".format(course_id.to_deprecated_string(), sum(counts.itervalues())))
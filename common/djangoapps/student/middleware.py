@@ -5,33 +5,36 @@ disabled accounts from accessing the site.
 from django.http import HttpResponseForbidden
 from django.utils.translation import ugettext as _
 from django.conf import settings
-from student.models import UserStanding
+from student.models import get_user_security_state, clear_changed_user_security_states
 
 class UserStandingMiddleware(object):
     """
     Checks a user's standing on request. Returns a 403 if the user's
     status is 'disabled'.
+
+    It must come before TransactionMiddleware (and after RequestCache) so that
+    its process_response runs after the request's changes are committed.
     """
     def process_request(self, request):
         user = request.user
-        try:
-            user_account = UserStanding.objects.get(user=user.id)
-            # because user is a unique field in UserStanding, there will either be
-            # one or zero user_accounts associated with a UserStanding
-        except UserStanding.DoesNotExist:
-            pass
-        else:
-            if user_account.account_status == UserStanding.ACCOUNT_DISABLED:
-                msg = _(
-                            'Your account has been disabled. If you believe '
-                            'this was done in error, please contact us at '
-                            '{link_start}{support_email}{link_end}'
-                        ).format(
-                            support_email=settings.DEFAULT_FEEDBACK_EMAIL,
-                            link_start=u'<a href="mailto:{address}?subject={subject_line}">'.format(
-                                address=settings.DEFAULT_FEEDBACK_EMAIL,
-                                subject_line=_('Disabled Account'),
-                            ),
-                            link_end=u'</a>'
-                        )
-                return HttpResponseForbidden(msg)
+        # the standing comes from the user's cached security state, so this
+        # doesn't query the database on every request
+        if user.id is not None and get_user_security_state(user).account_disabled:
+            msg = _(
+                        'Your account has been disabled. If you believe '
+                        'this was done in error, please contact us at '
+                        '{link_start}{support_email}{link_end}'
+                    ).format(
+                        support_email=settings.DEFAULT_FEEDBACK_EMAIL,
+                        link_start=u'<a href="mailto:{address}?subject={subject_line}">'.format(
+                            address=settings.DEFAULT_FEEDBACK_EMAIL,
+                            subject_line=_('Disabled Account'),
+                        ),
+                        link_end=u'</a>'
+                    )
+            return HttpResponseForbidden(msg)
+
+    def process_response(self, request, response):  # pylint: disable=unused-argument
+        # the security states cached while the request's changes to them were uncommitted
+        clear_changed_user_security_states()
+        return response
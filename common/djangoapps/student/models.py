@@ -16,10 +16,11 @@ import json
 import logging
 from pytz import UTC
 import uuid
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 from dogapi import dog_stats_api
 
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from django.contrib.auth.models import User
 from django.contrib.auth.hashers import make_password
@@ -38,7 +39,7 @@ from xmodule.modulestore.locations import SlashSeparatedCourseKey
 
 from course_modes.models import CourseMode
 import lms.lib.comment_client as cc
-from util.query import use_read_replica_if_available
+from request_cache.middleware import RequestCache
 from xmodule_django.models import CourseKeyField, NoneToEmptyManager
 from xmodule.modulestore.keys import CourseKey
 from functools import total_ordering
@@ -67,6 +68,29 @@ class AnonymousUserId(models.Model):
     unique_together = (user, course_id)
 
 
+# the number of users whose anonymous ids are looked up or stored with a single query
+ANONYMOUS_ID_BATCH_SIZE = 300
+
+# how long the shared cache remembers which user an anonymous id belongs to
+ANONYMOUS_ID_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _anonymous_id_cache_key(anonymous_user_id):
+    """The cache key of the id of the user with the anonymous id"""
+    return u'student.anonymous_user_id.{}'.format(anonymous_user_id)
+
+
+def _compute_anonymous_id(user_id, course_id):
+    """The anonymous id of the user in the course (or across courses, if course_id is None)"""
+    # include the secret key as a salt, and to make the ids unique across different LMS installs.
+    hasher = hashlib.md5()
+    hasher.update(settings.SECRET_KEY)
+    hasher.update(unicode(user_id))
+    if course_id:
+        hasher.update(course_id.to_deprecated_string())
+    return hasher.hexdigest()
+
+
 def anonymous_id_for_user(user, course_id):
     """
     Return a unique id for a (user, course) pair, suitable for inserting
@@ -82,41 +106,72 @@ def anonymous_id_for_user(user, course_id):
     if cached_id is not None:
         return cached_id
 
-    # include the secret key as a salt, and to make the ids unique across different LMS installs.
-    hasher = hashlib.md5()
-    hasher.update(settings.SECRET_KEY)
-    hasher.update(unicode(user.id))
-    if course_id:
-        hasher.update(course_id.to_deprecated_string())
-    digest = hasher.hexdigest()
+    return anonymous_ids_for_users([user], course_id)[user.id]
 
-    try:
-        anonymous_user_id, __ = AnonymousUserId.objects.get_or_create(
-            defaults={'anonymous_user_id': digest},
-            user=user,
-            course_id=course_id
-        )
-        if anonymous_user_id.anonymous_user_id != digest:
-            log.error(
-                "Stored anonymous user id {stored!r} for user {user!r} "
-                "in course {course!r} doesn't match computed id {digest!r}".format(
-                    user=user,
-                    course=course_id,
-                    stored=anonymous_user_id.anonymous_user_id,
-                    digest=digest
+
+def anonymous_ids_for_users(users, course_id):
+    """
+    Returns a dictionary mapping the id of each of the given users to their
+    unique id in the course, as returned by anonymous_id_for_user. Anonymous
+    users are left out.
+
+    The stored ids are read, and the missing ones stored, in batches of
+    ANONYMOUS_ID_BATCH_SIZE users, so that loops over many students can look
+    their ids up once instead of once per student.
+    """
+    users = [user for user in users if not user.is_anonymous()]
+    anonymous_ids = {}
+    for batch_start in xrange(0, len(users), ANONYMOUS_ID_BATCH_SIZE):
+        batch = users[batch_start:batch_start + ANONYMOUS_ID_BATCH_SIZE]
+        digests = {user.id: _compute_anonymous_id(user.id, course_id) for user in batch}
+
+        stored_ids = dict(AnonymousUserId.objects.filter(
+            user_id__in=digests.keys(), course_id=course_id
+        ).values_list('user_id', 'anonymous_user_id'))
+        for user_id, stored_id in stored_ids.iteritems():
+            if stored_id != digests[user_id]:
+                log.error(
+                    "Stored anonymous user id {stored!r} for user {user!r} "
+                    "in course {course!r} doesn't match computed id {digest!r}".format(
+                        user=user_id,
+                        course=course_id,
+                        stored=stored_id,
+                        digest=digests[user_id]
+                    )
                 )
-            )
-    except IntegrityError:
-        # Another thread has already created this entry, so
-        # continue
-        pass
 
-    if not hasattr(user, '_anonymous_id'):
-        user._anonymous_id = {}
+        missing = [
+            AnonymousUserId(user_id=user_id, course_id=course_id, anonymous_user_id=digest)
+            for user_id, digest in digests.iteritems() if user_id not in stored_ids
+        ]
+        if missing:
+            try:
+                AnonymousUserId.objects.bulk_create(missing)
+            except IntegrityError:
+                # Another thread has already created some of these entries, so
+                # create the rest one at a time
+                for anonymous_user_id in missing:
+                    try:
+                        AnonymousUserId.objects.get_or_create(
+                            defaults={'anonymous_user_id': anonymous_user_id.anonymous_user_id},
+                            user_id=anonymous_user_id.user_id,
+                            course_id=course_id
+                        )
+                    except IntegrityError:
+                        pass
+
+        cache.set_many(
+            {_anonymous_id_cache_key(digest): user_id for user_id, digest in digests.iteritems()},
+            ANONYMOUS_ID_CACHE_TIMEOUT
+        )
 
-    user._anonymous_id[course_id] = digest
+        for user in batch:
+            if not hasattr(user, '_anonymous_id'):
+                user._anonymous_id = {}
+            user._anonymous_id[course_id] = digests[user.id]
+        anonymous_ids.update(digests)
 
-    return digest
+    return anonymous_ids
 
 
 def user_by_anonymous_id(id):
@@ -131,10 +186,46 @@ def user_by_anonymous_id(id):
     if id is None:
         return None
 
-    try:
-        return User.objects.get(anonymoususerid__anonymous_user_id=id)
-    except ObjectDoesNotExist:
-        return None
+    return users_by_anonymous_ids([id]).get(id)
+
+
+def users_by_anonymous_ids(anonymous_user_ids):
+    """
+    Returns a dictionary mapping each of the given anonymous ids which belongs to
+    a user to that user, as returned by user_by_anonymous_id.
+
+    The users of the ids are remembered in the cache, and the ids which aren't
+    are looked up in batches.
+    """
+    anonymous_user_ids = list(set(anonymous_user_id for anonymous_user_id in anonymous_user_ids if anonymous_user_id))
+    cached = cache.get_many([_anonymous_id_cache_key(anonymous_user_id) for anonymous_user_id in anonymous_user_ids])
+    user_ids = {}
+    uncached_ids = []
+    for anonymous_user_id in anonymous_user_ids:
+        user_id = cached.get(_anonymous_id_cache_key(anonymous_user_id))
+        if user_id is None:
+            uncached_ids.append(anonymous_user_id)
+        else:
+            user_ids[anonymous_user_id] = user_id
+
+    for batch_start in xrange(0, len(uncached_ids), ANONYMOUS_ID_BATCH_SIZE):
+        stored_ids = dict(AnonymousUserId.objects.filter(
+            anonymous_user_id__in=uncached_ids[batch_start:batch_start + ANONYMOUS_ID_BATCH_SIZE]
+        ).values_list('anonymous_user_id', 'user_id'))
+        cache.set_many(
+            {_anonymous_id_cache_key(stored_id): user_id for stored_id, user_id in stored_ids.iteritems()},
+            ANONYMOUS_ID_CACHE_TIMEOUT
+        )
+        user_ids.update(stored_ids)
+
+    users = {}
+    distinct_user_ids = list(set(user_ids.itervalues()))
+    for batch_start in xrange(0, len(distinct_user_ids), ANONYMOUS_ID_BATCH_SIZE):
+        users.update(User.objects.in_bulk(distinct_user_ids[batch_start:batch_start + ANONYMOUS_ID_BATCH_SIZE]))
+    return {
+        anonymous_user_id: users[user_id]
+        for anonymous_user_id, user_id in user_ids.iteritems() if user_id in users
+    }
 
 
 class UserStanding(models.Model):
@@ -414,15 +505,8 @@ class PasswordHistory(models.Model):
                 settings.ADVANCED_SECURITY_CONFIG['MIN_DAYS_FOR_STUDENT_ACCOUNTS_PASSWORD_RESETS']
 
         if days_before_password_reset:
-            history = PasswordHistory.objects.filter(user=user).order_by('-time_set')
-            time_last_reset = None
-
-            if history:
-                # first element should be the last time we reset password
-                time_last_reset = history[0].time_set
-            else:
-                # no history, then let's take the date the user joined
-                time_last_reset = user.date_joined
+            # the last time we reset password or, if there's no history, the date the user joined
+            time_last_reset = get_user_security_state(user).password_last_set or user.date_joined
 
             now = timezone.now()
 
@@ -518,19 +602,13 @@ class LoginFailures(models.Model):
         """
         Static method to return in a given user has his/her account locked out
         """
-        try:
-            record = LoginFailures.objects.get(user=user)
-            if not record.lockout_until:
-                return False
-
-            now = datetime.now(UTC)
-            until = record.lockout_until
-            is_locked_out = until and now < until
-
-            return is_locked_out
-        except ObjectDoesNotExist:
+        until = get_user_security_state(user).lockout_until
+        if not until:
             return False
 
+        now = datetime.now(UTC)
+        return now < until
+
     @classmethod
     def increment_lockout_counter(cls, user):
         """
@@ -560,6 +638,93 @@ class LoginFailures(models.Model):
             return
 
 
+# how long a user's security state is cached
+USER_SECURITY_STATE_CACHE_TIMEOUT = 60 * 60
+
+UserSecurityState = namedtuple('UserSecurityState', ['account_disabled', 'lockout_until', 'password_last_set'])
+
+
+def _user_security_state_cache_key(user_id):
+    """The cache key of the user's security state"""
+    return u'student.user_security_state.{}'.format(user_id)
+
+
+def get_user_security_state(user):
+    """
+    Returns the UserSecurityState of the user (or user id), which the login checks
+    and UserStandingMiddleware need on every request:
+
+    `account_disabled`: whether the user's UserStanding disables their account
+    `lockout_until`: the time the user's LoginFailures lockout ends, or None
+    `password_last_set`: the time of the user's latest PasswordHistory entry, or None
+
+    The state is cached, and the cache is cleared when any of the records it's
+    made from change, and again once the request which changed them has
+    committed (see clear_changed_user_security_states).
+    """
+    user_id = getattr(user, 'id', user)
+    key = _user_security_state_cache_key(user_id)
+    state = cache.get(key)
+    if state is None:
+        account_statuses = UserStanding.objects.filter(user_id=user_id).values_list('account_status', flat=True)
+        lockouts = LoginFailures.objects.filter(user_id=user_id).values_list('lockout_until', flat=True)
+        password_times = PasswordHistory.objects.filter(
+            user_id=user_id
+        ).order_by('-time_set').values_list('time_set', flat=True)
+        state = UserSecurityState(
+            UserStanding.ACCOUNT_DISABLED in account_statuses,
+            max([until for until in lockouts if until is not None] or [None]),
+            password_times[0] if password_times else None,
+        )
+        cache.set(key, state, USER_SECURITY_STATE_CACHE_TIMEOUT)
+    return state
+
+
+CHANGED_SECURITY_STATES_KEY = 'student.changed_user_security_states'
+
+
+@receiver(models.signals.post_save, sender=UserStanding)
+@receiver(models.signals.post_delete, sender=UserStanding)
+@receiver(models.signals.post_save, sender=LoginFailures)
+@receiver(models.signals.post_delete, sender=LoginFailures)
+@receiver(models.signals.post_save, sender=PasswordHistory)
+@receiver(models.signals.post_delete, sender=PasswordHistory)
+def clear_user_security_state(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Clear the cached security state of the user whose record changed.
+
+    The change isn't committed yet when the request's transaction is managed, so
+    another request (or this one) can cache the old state again before it is; the
+    user is remembered so their state is cleared again after the commit.
+    """
+    cache.delete(_user_security_state_cache_key(instance.user_id))
+    if RequestCache.get_current_request() is not None:
+        RequestCache.get_request_cache().data.setdefault(CHANGED_SECURITY_STATES_KEY, set()).add(instance.user_id)
+
+
+def clear_changed_user_security_states():
+    """
+    Clear the cached security states of the users whose records this request changed.
+    UserStandingMiddleware calls this once the response is past TransactionMiddleware,
+    i.e., after the request's changes are committed (or rolled back).
+    """
+    if RequestCache.get_current_request() is None:
+        return
+    user_ids = RequestCache.get_request_cache().data.pop(CHANGED_SECURITY_STATES_KEY, None)
+    if user_ids:
+        cache.delete_many([_user_security_state_cache_key(user_id) for user_id in user_ids])
+
+
+@receiver(models.signals.post_save, sender=User)
+def clear_new_user_security_state(sender, instance, created, **kwargs):  # pylint: disable=unused-argument
+    """
+    Clear any cached security state left by an earlier user with the new user's id
+    (e.g. a user whose creation was rolled back)
+    """
+    if created:
+        cache.delete(_user_security_state_cache_key(instance.id))
+
+
 class CourseEnrollment(models.Model):
     """
     Represents a Student's Enrollment record for a single Course. You should
@@ -574,6 +739,9 @@ class CourseEnrollment(models.Model):
     """
     MODEL_TAGS = ['course_id', 'is_active', 'mode']
 
+    # the request cache key of the enrollments loaded by _enrollments_in_request
+    REQUEST_CACHE_KEY = 'student.courseenrollments'
+
     user = models.ForeignKey(User)
     course_id = CourseKeyField(max_length=255, db_index=True)
     created = models.DateTimeField(auto_now_add=True, null=True, db_index=True)
@@ -643,9 +811,7 @@ class CourseEnrollment(models.Model):
 
         'course_id' is the course_id to return enrollments
         """
-        enrollment_number = CourseEnrollment.objects.filter(course_id=course_id, is_active=1).count()
-
-        return enrollment_number
+        return sum(CourseEnrollmentCount.counts_for_course(course_id).itervalues())
 
     @classmethod
     def is_course_full(cls, course):
@@ -748,9 +914,69 @@ class CourseEnrollment(models.Model):
         verified the user authentication and access.
         """
         enrollment = cls.get_or_create_enrollment(user, course_key)
+        # Lock the row until the end of the transaction so that a concurrent
+        # enroll sees this one's activation (and doesn't count it again)
+        enrollment = cls.objects.select_for_update().get(pk=enrollment.pk)
         enrollment.update_enrollment(is_active=True, mode=mode)
         return enrollment
 
+    @classmethod
+    def bulk_enroll(cls, users, course_key, mode="honor"):
+        """
+        Enroll many users in a course. This saves immediately.
+
+        Has the effect of calling `enroll` for each of the users who isn't
+        already enrolled (the mode of active enrollments isn't changed), in a
+        few queries: new enrollments are inserted with one bulk insert, and
+        inactive ones activated with one update. Their activation events are
+        emitted once they've all been saved.
+
+        `users` is a list of saved Users, no more than a few hundred of them, as
+        their enrollments are looked up together.
+
+        Returns a list of the enrollments that were created or activated.
+        """
+        assert(isinstance(course_key, CourseKey))
+
+        users = {user.id: user for user in users}
+        records = {
+            record.user_id: record
+            for record in cls.objects.select_for_update().filter(user_id__in=users.keys(), course_id=course_key)
+        }
+        new_records = [
+            cls(user_id=user_id, course_id=course_key, mode=mode)
+            for user_id in users if user_id not in records
+        ]
+        inactive_records = [record for record in records.itervalues() if not record.is_active]
+        activated_ids = [record.user_id for record in new_records + inactive_records]
+        if not activated_ids:
+            return []
+
+        try:
+            cls.objects.bulk_create(new_records)
+        except IntegrityError:
+            # Some of these users have been enrolled concurrently, so enroll them one at a time
+            return [cls.enroll(users[user_id], course_key, mode) for user_id in activated_ids]
+        cls.objects.filter(id__in=[record.id for record in inactive_records]).update(is_active=True, mode=mode)
+
+        # bulk_create and update don't send signals, so do what their receivers would
+        CourseEnrollmentCount.add(course_key, mode, len(activated_ids))
+        for user_id in activated_ids:
+            cls.clear_request_enrollments(user_id)
+
+        enrollments = list(cls.objects.filter(user_id__in=activated_ids, course_id=course_key))
+        for enrollment in enrollments:
+            enrollment.user = users[enrollment.user_id]
+            enrollment.emit_event(EVENT_NAME_ENROLLMENT_ACTIVATED)
+        dog_stats_api.increment(
+            "common.student.enrollment",
+            value=len(enrollments),
+            tags=[u"org:{}".format(course_key.org),
+                  u"offering:{}".format(course_key.offering),
+                  u"mode:{}".format(mode)]
+        )
+        return enrollments
+
     @classmethod
     def enroll_by_email(cls, email, course_id, mode="honor", ignore_errors=True):
         """
@@ -838,6 +1064,11 @@ class CourseEnrollment(models.Model):
 
         `course_id` is our usual course_id string (e.g. "edX/Test101/2013_Fall)
         """
+        enrollments = cls._enrollments_in_request(user)
+        if enrollments is not None:
+            record = enrollments.by_course.get(course_key)
+            return record is not None and record.is_active
+
         try:
             record = CourseEnrollment.objects.get(user=user, course_id=course_key)
             return record.is_active
@@ -861,6 +1092,10 @@ class CourseEnrollment(models.Model):
         """
         assert isinstance(course_id_partial, SlashSeparatedCourseKey)
         assert not course_id_partial.run  # None or empty string
+        enrollments = cls._enrollments_in_request(user)
+        if enrollments is not None:
+            return (course_id_partial.org, course_id_partial.course) in enrollments.active_partials
+
         course_key = SlashSeparatedCourseKey(course_id_partial.org, course_id_partial.course, '')
         querystring = unicode(course_key.to_deprecated_string())
         try:
@@ -883,6 +1118,11 @@ class CourseEnrollment(models.Model):
         Returns the mode for both inactive and active users.
         Returns None if the courseenrollment record does not exist.
         """
+        enrollments = cls._enrollments_in_request(user)
+        if enrollments is not None:
+            record = enrollments.by_course.get(course_id)
+            return record.mode if record is not None else None
+
         try:
             record = CourseEnrollment.objects.get(user=user, course_id=course_id)
 
@@ -893,6 +1133,41 @@ class CourseEnrollment(models.Model):
         except cls.DoesNotExist:
             return None
 
+    @classmethod
+    def _enrollments_in_request(cls, user):
+        """
+        Returns all of the user's enrollment records, loaded with a single query
+        the first time they're needed in the current request, as a RequestEnrollments
+        tuple of:
+
+        `by_course`: a dictionary of the records by course id, active or not
+        `active_partials`: the set of (org, course) pairs of the active records,
+            for answering is_enrolled_by_partial
+
+        Returns None if this thread isn't handling a request (the request cache is
+        only cleared between requests) or the user hasn't been saved.
+        """
+        if RequestCache.get_current_request() is None or getattr(user, 'id', None) is None:
+            return None
+
+        cached_enrollments = RequestCache.get_request_cache().data.setdefault(cls.REQUEST_CACHE_KEY, {})
+        if user.id not in cached_enrollments:
+            records = list(CourseEnrollment.objects.filter(user_id=user.id))
+            cached_enrollments[user.id] = RequestEnrollments(
+                {record.course_id: record for record in records},
+                frozenset((record.course_id.org, record.course_id.course) for record in records if record.is_active),
+            )
+        return cached_enrollments[user.id]
+
+    @classmethod
+    def clear_request_enrollments(cls, user_id):
+        """
+        Forget the user's enrollment records loaded in the current request, so
+        they're reloaded after a change
+        """
+        if RequestCache.get_current_request() is not None:
+            RequestCache.get_request_cache().data.get(cls.REQUEST_CACHE_KEY, {}).pop(user_id, None)
+
     @classmethod
     def enrollments_for_user(cls, user):
         return CourseEnrollment.objects.filter(user=user, is_active=1)
@@ -911,13 +1186,12 @@ class CourseEnrollment(models.Model):
         Returns a dictionary that stores the total enrollment count for a course, as well as the
         enrollment count for each individual mode.
         """
-        # Unfortunately, Django's "group by"-style queries look super-awkward
-        query = use_read_replica_if_available(cls.objects.filter(course_id=course_id, is_active=True).values('mode').order_by().annotate(Count('mode')))
         total = 0
         d = defaultdict(int)
-        for item in query:
-            d[item['mode']] = item['mode__count']
-            total += item['mode__count']
+        for mode, count in CourseEnrollmentCount.counts_for_course(course_id).iteritems():
+            if count:
+                d[mode] = count
+                total += count
         d['total'] = total
         return d
 
@@ -947,6 +1221,126 @@ class CourseEnrollment(models.Model):
             return True
 
 
+RequestEnrollments = namedtuple('RequestEnrollments', ['by_course', 'active_partials'])
+
+
+class CourseEnrollmentCount(models.Model):
+    """
+    The number of active enrollments in a course in each mode, so that enrollment
+    counts and capacity checks don't aggregate the enrollment table.
+
+    The counts are kept up to date by the CourseEnrollment signal handlers below, in
+    the same transaction as the enrollment change. A course's counts are computed
+    from the enrollment table the first time they're needed, and the
+    reconcile_enrollment_counts management command recomputes them to correct any
+    drift (e.g. from queryset updates, which don't send signals).
+
+    Whether a save changes the counts is decided from the state the enrollment
+    was loaded in, so two concurrent saves of the same enrollment which both
+    loaded it inactive would both count its activation. CourseEnrollment.enroll
+    and bulk_enroll lock the enrollment rows (select_for_update) to prevent this,
+    but the lock is only held until the end of the transaction; outside of one
+    (e.g. in autocommit scripts) and for other code that saves enrollments, the
+    counts can still drift until they're reconciled.
+    """
+    course_id = CourseKeyField(max_length=255, db_index=True)
+    mode = models.CharField(max_length=100)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = (('course_id', 'mode'),)
+
+    @classmethod
+    def counts_for_course(cls, course_id):
+        """
+        Returns a dictionary of the number of active enrollments in the course by mode
+        """
+        counts = {record.mode: record.count for record in cls.objects.filter(course_id=course_id)}
+        if not counts:
+            counts = cls.reconcile(course_id)
+        return counts
+
+    @classmethod
+    def reconcile(cls, course_id):
+        """
+        Recomputes the course's counts from the enrollment table, saves and returns them
+        """
+        # Unfortunately, Django's "group by"-style queries look super-awkward
+        query = CourseEnrollment.objects.filter(
+            course_id=course_id, is_active=True
+        ).values('mode').order_by().annotate(Count('mode'))
+        counts = {item['mode']: item['mode__count'] for item in query}
+        if not counts:
+            # a course with no enrollments still needs a record to show its counts are known
+            counts = {CourseMode.DEFAULT_MODE_SLUG: 0}
+
+        for record in cls.objects.filter(course_id=course_id):
+            if record.mode not in counts:
+                record.delete()
+        for mode, count in counts.iteritems():
+            record, created = cls.objects.get_or_create(course_id=course_id, mode=mode, defaults={'count': count})
+            if not created and record.count != count:
+                cls.objects.filter(pk=record.pk).update(count=count)
+        return counts
+
+    @classmethod
+    def add(cls, course_id, mode, delta):
+        """
+        Adds delta to the number of active enrollments in the course in the mode
+        """
+        records = cls.objects.filter(course_id=course_id, mode=mode)
+        if records.update(count=models.F('count') + delta):
+            return
+        # If none of the course's counts have been computed yet, they will be from the
+        # enrollment table (which includes this change) when they're first needed
+        if cls.objects.filter(course_id=course_id).exists():
+            __, created = cls.objects.get_or_create(course_id=course_id, mode=mode, defaults={'count': delta})
+            if not created:
+                # created concurrently
+                records.update(count=models.F('count') + delta)
+
+
+@receiver(models.signals.post_init, sender=CourseEnrollment)
+def remember_counted_state(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Remember the state of the enrollment as it's counted by CourseEnrollmentCount
+    """
+    if instance.pk and instance.is_active:
+        instance._counted_state = (instance.course_id, instance.mode)  # pylint: disable=protected-access
+    else:
+        instance._counted_state = None  # pylint: disable=protected-access
+
+
+@receiver(models.signals.post_save, sender=CourseEnrollment)
+@receiver(models.signals.post_delete, sender=CourseEnrollment)
+def update_enrollment_counts(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Update CourseEnrollmentCount when an enrollment is activated, deactivated or
+    changes mode
+    """
+    counted_state = instance._counted_state  # pylint: disable=protected-access
+    if kwargs.get('signal') is models.signals.post_delete or not instance.is_active:
+        state = None
+    else:
+        state = (instance.course_id, instance.mode)
+
+    if state != counted_state:
+        if counted_state is not None:
+            CourseEnrollmentCount.add(counted_state[0], counted_state[1], -1)
+        if state is not None:
+            CourseEnrollmentCount.add(state[0], state[1], 1)
+    instance._counted_state = state  # pylint: disable=protected-access
+
+
+@receiver(models.signals.post_save, sender=CourseEnrollment)
+@receiver(models.signals.post_delete, sender=CourseEnrollment)
+def clear_request_enrollments(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Reload the user's enrollments if they're needed again in this request
+    """
+    CourseEnrollment.clear_request_enrollments(instance.user_id)
+
+
 class CourseEnrollmentAllowed(models.Model):
     """
     Table of users (specified by email address strings) who are allowed to enroll in a specified course.
@@ -12,6 +12,7 @@ from xmodule.modulestore.locations import SlashSeparatedCourseKey
 from xmodule.modulestore.django import modulestore
 from xmodule.error_module import ErrorDescriptor
 from django.test.client import Client
+from course_overviews.models import CourseOverview
 from student.models import CourseEnrollment
 from student.views import get_course_enrollment_pairs
 from django.conf import settings
@@ -76,6 +77,23 @@ class TestCourseListing(ModuleStoreTestCase):
         courses_list = list(get_course_enrollment_pairs(self.student, None, []))
         self.assertEqual(len(courses_list), 0)
 
+    def test_course_list_from_overviews(self):
+        """
+        Test that the course list is read from the course overviews without loading the courses
+        """
+        course_location = SlashSeparatedCourseKey('Org1', 'Course1', 'Run1')
+        self._create_course_with_access_groups(course_location)
+        # creates the course's overview
+        list(get_course_enrollment_pairs(self.student, None, []))
+
+        with patch('course_overviews.models.modulestore') as mock_modulestore:
+            # the enrollments and their courses' overviews
+            with self.assertNumQueries(2):
+                courses_list = list(get_course_enrollment_pairs(self.student, None, []))
+        self.assertFalse(mock_modulestore.called)
+        self.assertIsInstance(courses_list[0][0], CourseOverview)
+        self.assertEqual(courses_list[0][0].id, course_location)
+
     def test_errored_course_regular_access(self):
         """
         Test the course list for regular staff when get_course returns an ErrorDescriptor
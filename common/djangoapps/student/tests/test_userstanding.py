@@ -3,7 +3,10 @@ These are tests for disabling and enabling student accounts, and for making sure
 that students with disabled accounts are unable to access the courseware.
 """
 from student.tests.factories import UserFactory, UserStandingFactory
-from student.models import UserStanding
+from student.middleware import UserStandingMiddleware
+from request_cache.middleware import RequestCache
+from student.models import UserStanding, get_user_security_state
+from django.http import HttpRequest, HttpResponse
 from django.test import TestCase, Client
 from django.core.urlresolvers import reverse, NoReverseMatch
 from nose.plugins.skip import SkipTest
@@ -113,3 +116,33 @@ class UserStandingTest(TestCase):
         self.assertEqual(
             UserStanding.objects.filter(user=self.good_user).count(), 0
         )
+
+    def test_standing_cached(self):
+        self.assertTrue(get_user_security_state(self.bad_user).account_disabled)
+        with self.assertNumQueries(0):
+            self.assertTrue(get_user_security_state(self.bad_user).account_disabled)
+
+        # changing the standing clears the cached state
+        standing = UserStanding.objects.get(user=self.bad_user)
+        standing.account_status = UserStanding.ACCOUNT_ENABLED
+        standing.save()
+        self.assertFalse(get_user_security_state(self.bad_user).account_disabled)
+
+    def test_state_cleared_after_request(self):
+        request = HttpRequest()
+        request_cache = RequestCache()
+        request_cache.process_request(request)
+        try:
+            standing = UserStanding.objects.get(user=self.bad_user)
+            standing.account_status = UserStanding.ACCOUNT_ENABLED
+            standing.save()
+            # e.g. cached by a concurrent request before the change is committed
+            get_user_security_state(self.bad_user)
+
+            UserStandingMiddleware().process_response(request, HttpResponse())
+        finally:
+            request_cache.process_response(request, HttpResponse())
+
+        # the state is read again once the request has committed
+        with self.assertNumQueries(3):
+            get_user_security_state(self.bad_user)
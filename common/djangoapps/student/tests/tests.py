@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 import pytz
 
 from django.conf import settings
+from django.core.cache import cache
 from django.test import TestCase
 from django.test.utils import override_settings
 from django.test.client import RequestFactory, Client
@@ -25,10 +26,14 @@ from xmodule.modulestore.locations import SlashSeparatedCourseKey
 
 from mock import Mock, patch
 
-from student.models import anonymous_id_for_user, user_by_anonymous_id, CourseEnrollment, unique_id_for_user
+from student.models import (
+    anonymous_id_for_user, anonymous_ids_for_users, user_by_anonymous_id, users_by_anonymous_ids, CourseEnrollment,
+    CourseEnrollmentCount, unique_id_for_user
+)
 from student.views import (process_survey_link, _cert_info,
                            change_enrollment, complete_course_mode_info)
 from student.tests.factories import UserFactory, CourseModeFactory
+from request_cache.middleware import RequestCache
 
 import shoppingcart
 
@@ -429,6 +434,108 @@ class EnrollInCourseTest(TestCase):
         self.assertTrue(CourseEnrollment.is_enrolled(user, course_id))
         self.assert_enrollment_event_was_emitted(user, course_id)
 
+    def test_enrollments_loaded_once_per_request(self):
+        user = User.objects.create(username="jack", email="jack@fake.edx.org")
+        course_id = SlashSeparatedCourseKey("edX", "Test101", "2013")
+        other_course_id = SlashSeparatedCourseKey("edX", "Test102", "2013")
+        CourseEnrollment.enroll(user, course_id, mode="verified")
+
+        middleware = RequestCache()
+        middleware.process_request(Mock())
+        try:
+            with self.assertNumQueries(1):
+                self.assertTrue(CourseEnrollment.is_enrolled(user, course_id))
+                self.assertFalse(CourseEnrollment.is_enrolled(user, other_course_id))
+                self.assertEqual("verified", CourseEnrollment.enrollment_mode_for_user(user, course_id))
+                self.assertIsNone(CourseEnrollment.enrollment_mode_for_user(user, other_course_id))
+                self.assertTrue(
+                    CourseEnrollment.is_enrolled_by_partial(user, SlashSeparatedCourseKey("edX", "Test101", None))
+                )
+                self.assertFalse(
+                    CourseEnrollment.is_enrolled_by_partial(user, SlashSeparatedCourseKey("edX", "Test102", None))
+                )
+
+            # changes are seen within the same request
+            CourseEnrollment.unenroll(user, course_id)
+            CourseEnrollment.enroll(user, other_course_id)
+            self.assertFalse(CourseEnrollment.is_enrolled(user, course_id))
+            self.assertTrue(CourseEnrollment.is_enrolled(user, other_course_id))
+            self.assertFalse(
+                CourseEnrollment.is_enrolled_by_partial(user, SlashSeparatedCourseKey("edX", "Test101", None))
+            )
+        finally:
+            middleware.process_response(Mock(), Mock())
+
+
+class EnrollmentCountTest(TestCase):
+    """Tests of the maintained enrollment counts"""
+
+    def setUp(self):
+        patcher = patch('student.models.tracker')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.course_id = SlashSeparatedCourseKey("edX", "Test101", "2013")
+        self.users = [UserFactory.create() for __ in range(3)]
+
+    def assert_counts(self, total, **modes):
+        counts = CourseEnrollment.enrollment_counts(self.course_id)
+        self.assertEqual(total, counts['total'])
+        for mode, count in modes.iteritems():
+            self.assertEqual(count, counts[mode])
+        self.assertEqual(total, CourseEnrollment.num_enrolled_in(self.course_id))
+
+    def test_counts_maintained(self):
+        self.assert_counts(0)
+        CourseEnrollment.enroll(self.users[0], self.course_id)
+        enrollment = CourseEnrollment.enroll(self.users[1], self.course_id, mode="verified")
+        self.assert_counts(2, honor=1, verified=1)
+
+        with self.assertNumQueries(1):
+            CourseEnrollment.num_enrolled_in(self.course_id)
+
+        enrollment.change_mode("honor")
+        self.assert_counts(2, honor=2, verified=0)
+
+        CourseEnrollment.unenroll(self.users[0], self.course_id)
+        self.assert_counts(1, honor=1)
+
+        enrollment.delete()
+        self.assert_counts(0, honor=0)
+
+    def test_counts_computed_when_first_needed(self):
+        for user in self.users:
+            CourseEnrollment.enroll(user, self.course_id)
+        CourseEnrollmentCount.objects.all().delete()
+        self.assert_counts(3, honor=3)
+
+    def test_reconcile(self):
+        for user in self.users:
+            CourseEnrollment.enroll(user, self.course_id)
+        self.assert_counts(3, honor=3)
+
+        # queryset updates don't send signals
+        CourseEnrollment.objects.filter(user=self.users[0]).update(mode="verified")
+        self.assert_counts(3, honor=3)
+        CourseEnrollmentCount.reconcile(self.course_id)
+        self.assert_counts(3, honor=2, verified=1)
+
+    def test_bulk_enroll(self):
+        self.assert_counts(0)
+        CourseEnrollment.enroll(self.users[0], self.course_id, mode="verified")
+        CourseEnrollment.enroll(self.users[1], self.course_id)
+        CourseEnrollment.unenroll(self.users[1], self.course_id)
+
+        enrollments = CourseEnrollment.bulk_enroll(self.users, self.course_id)
+        self.assertEqual(
+            set([self.users[1].id, self.users[2].id]),
+            set(enrollment.user_id for enrollment in enrollments)
+        )
+        for user in self.users:
+            self.assertTrue(CourseEnrollment.is_enrolled(user, self.course_id))
+        # the mode of an active enrollment isn't changed
+        self.assert_counts(3, honor=2, verified=1)
+        self.assertEqual([], CourseEnrollment.bulk_enroll(self.users, self.course_id))
+
 
 @override_settings(MODULESTORE=TEST_DATA_MIXED_MODULESTORE)
 class PaidRegistrationTest(ModuleStoreTestCase):
@@ -491,3 +598,22 @@ class AnonymousLookupTable(TestCase):
         anonymous_id = anonymous_id_for_user(self.user, self.course.id)
         real_user = user_by_anonymous_id(anonymous_id)
         self.assertEqual(self.user, real_user)
+
+    def test_bulk_roundtrip(self):
+        users = [self.user, UserFactory(), AnonymousUser()]
+        with self.assertNumQueries(2):
+            anonymous_ids = anonymous_ids_for_users(users, self.course.id)
+        self.assertEqual(2, len(anonymous_ids))
+        fresh_users = list(User.objects.filter(id__in=anonymous_ids))
+        for user in fresh_users:
+            self.assertEqual(anonymous_ids[user.id], anonymous_id_for_user(user, self.course.id))
+
+        # the stored ids are read with one query
+        fresh_users = list(User.objects.filter(id__in=anonymous_ids))
+        with self.assertNumQueries(1):
+            self.assertEqual(anonymous_ids, anonymous_ids_for_users(fresh_users, self.course.id))
+
+        cache.clear()
+        with self.assertNumQueries(2):
+            users_by_id = users_by_anonymous_ids(anonymous_ids.values() + ['unknown', None])
+        self.assertEqual({anonymous_ids[user.id]: user for user in users[:2]}, users_by_id)
@@ -37,6 +37,7 @@ from edxmako.shortcuts import render_to_response, render_to_string
 from mako.exceptions import TopLevelLookupException
 
 from course_modes.models import CourseMode
+from course_overviews.models import CourseOverview
 from student.models import (
     Registration, UserProfile, PendingNameChange,
     PendingEmailChange, CourseEnrollment, unique_id_for_user,
@@ -46,7 +47,7 @@ from student.models import (
 from student.forms import PasswordResetFormNoActive
 
 from verify_student.models import SoftwareSecurePhotoVerification, MidcourseReverificationWindow
-from certificates.models import CertificateStatuses, certificate_status_for_student
+from certificates.models import CertificateStatuses, certificate_status_for_student, certificate_statuses_for_student
 from dark_lang.models import DarkLangConfig
 
 from xmodule.course_module import CourseDescriptor
@@ -85,7 +86,6 @@ from util.password_policy_validators import (
 )
 
 from third_party_auth import pipeline, provider
-from xmodule.error_module import ErrorDescriptor
 
 log = logging.getLogger("edx.student")
 AUDIT_LOG = logging.getLogger("audit")
@@ -195,11 +195,32 @@ def reverification_info(course_enrollment_pairs, user, statuses):
             dict["must_reverify"] = []
             dict["must_reverify"] = [some information]
     """
+    windows = MidcourseReverificationWindow.get_windows(
+        [course.id for course, _enrollment in course_enrollment_pairs], datetime.datetime.now(UTC)
+    )
+    verification_statuses = SoftwareSecurePhotoVerification.user_statuses(user, windows.values())
+    return _reverification_info(course_enrollment_pairs, statuses, windows, verification_statuses)
+
+
+def _reverification_info(course_enrollment_pairs, statuses, windows, verification_statuses):
+    """
+    Implements the logic for reverification_info over the open windows of the courses
+    and the user's verification statuses, as returned by
+    MidcourseReverificationWindow.get_windows and SoftwareSecurePhotoVerification.user_statuses
+    """
     reverifications = defaultdict(list)
     for (course, enrollment) in course_enrollment_pairs:
-        info = single_course_reverification_info(user, course, enrollment)
-        if info:
-            reverifications[info.status].append(info)
+        window = windows.get(course.id)
+        # If there's no window OR the user is not verified, we don't get reverification info
+        if (not window) or (enrollment.mode != "verified"):
+            continue
+        status, _error_msg, display = verification_statuses[window.id]
+        reverifications[status].append(ReverifyInfo(
+            course.id, course.display_name, course.number,
+            window.end_date.strftime('%B %d, %Y %X %p'),
+            status,
+            display,
+        ))
 
     # Sort the data by the reverification_end_date
     for status in statuses:
@@ -238,26 +259,31 @@ def single_course_reverification_info(user, course, enrollment):  # pylint: disa
 
 def get_course_enrollment_pairs(user, course_org_filter, org_filter_out_set):
     """
-    Get the relevant set of (Course, CourseEnrollment) pairs to be displayed on
+    Get the relevant set of (CourseOverview, CourseEnrollment) pairs to be displayed on
     a student's dashboard.
     """
+    enrollments = []
     for enrollment in CourseEnrollment.enrollments_for_user(user):
-        course = course_from_id(enrollment.course_id)
-        if course and not isinstance(course, ErrorDescriptor):
-
-            # if we are in a Microsite, then filter out anything that is not
-            # attributed (by ORG) to that Microsite
-            if course_org_filter and course_org_filter != course.location.org:
-                continue
-            # Conversely, if we are not in a Microsite, then let's filter out any enrollments
-            # with courses attributed (by ORG) to Microsites
-            elif course.location.org in org_filter_out_set:
-                continue
-
+        # The ORG is part of the course id, so filter before loading the course.
+        # If we are in a Microsite, then filter out anything that is not
+        # attributed (by ORG) to that Microsite
+        if course_org_filter and course_org_filter != enrollment.course_id.org:
+            continue
+        # Conversely, if we are not in a Microsite, then let's filter out any enrollments
+        # with courses attributed (by ORG) to Microsites
+        elif enrollment.course_id.org in org_filter_out_set:
+            continue
+        enrollments.append(enrollment)
+
+    # the overviews have what the dashboard shows, so the courses aren't loaded from the modulestore
+    courses = CourseOverview.get_from_ids(enrollment.course_id for enrollment in enrollments)
+    for enrollment in enrollments:
+        course = courses.get(enrollment.course_id)
+        if course is not None:
             yield (course, enrollment)
         else:
-            log.error("User {0} enrolled in {2} course {1}".format(
-                        user.username, enrollment.course_id, "broken" if course else "non-existent"
+            log.error("User {0} enrolled in broken or non-existent course {1}".format(
+                        user.username, enrollment.course_id
                      ))
 
 
@@ -398,7 +424,7 @@ def register_user(request, extra_context=None):
     return render_to_response('register.html', context)
 
 
-def complete_course_mode_info(course_id, enrollment):
+def complete_course_mode_info(course_id, enrollment, modes=None):
     """
     We would like to compute some more information from the given course modes
     and the user's current enrollment
@@ -406,8 +432,12 @@ def complete_course_mode_info(course_id, enrollment):
     Returns the given information:
         - whether to show the course upsell information
         - numbers of days until they can't upsell anymore
+
+    `modes` is the course's modes dictionary, as returned by CourseMode.modes_for_course_dict;
+    it's looked up if not given.
     """
-    modes = CourseMode.modes_for_course_dict(course_id)
+    if modes is None:
+        modes = CourseMode.modes_for_course_dict(course_id)
     mode_info = {'show_upsell': False, 'days_for_upsell': None}
     # we want to know if the user is already verified and if verified is an
     # option
@@ -460,28 +490,46 @@ def dashboard(request):
     show_courseware_links_for = frozenset(course.id for course, _enrollment in course_enrollment_pairs
                                           if has_access(request.user, 'load', course))
 
-    course_modes = {course.id: complete_course_mode_info(course.id, enrollment) for course, enrollment in course_enrollment_pairs}
-    cert_statuses = {course.id: cert_info(request.user, course) for course, _enrollment in course_enrollment_pairs}
+    # Fetch the modes, certificates, email authorizations and verification attempts
+    # of all the courses at once, then work out each course's information from them
+    course_ids = [course.id for course, _enrollment in course_enrollment_pairs]
+    modes_by_course = CourseMode.modes_for_courses(course_ids)
+    certificate_statuses = certificate_statuses_for_student(user, course_ids)
+    windows = MidcourseReverificationWindow.get_windows(course_ids, datetime.datetime.now(UTC))
+    verification_statuses = SoftwareSecurePhotoVerification.user_statuses(user, windows.values())
+
+    course_modes = {
+        course.id: complete_course_mode_info(
+            course.id, enrollment, {mode.slug: mode for mode in modes_by_course[course.id]}
+        )
+        for course, enrollment in course_enrollment_pairs
+    }
+    cert_statuses = {
+        course.id: _cert_info(user, course, certificate_statuses[course.id]) if course.may_certify() else {}
+        for course, _enrollment in course_enrollment_pairs
+    }
 
     # only show email settings for Mongo course and when bulk email is turned on
-    show_email_settings_for = frozenset(
-        course.id for course, _enrollment in course_enrollment_pairs if (
-            settings.FEATURES['ENABLE_INSTRUCTOR_EMAIL'] and
-            modulestore().get_modulestore_type(course.id) != XML_MODULESTORE_TYPE and
-            CourseAuthorization.instructor_email_enabled(course.id)
-        )
-    )
+    show_email_settings_for = frozenset()
+    if settings.FEATURES['ENABLE_INSTRUCTOR_EMAIL']:
+        show_email_settings_for = frozenset(CourseAuthorization.courses_with_instructor_email_enabled(
+            course_id for course_id in course_ids
+            if modulestore().get_modulestore_type(course_id) != XML_MODULESTORE_TYPE
+        ))
 
     # Verification Attempts
     # Used to generate the "you must reverify for course x" banner
-    verification_status, verification_msg = SoftwareSecurePhotoVerification.user_status(user)
+    verification_status, verification_msg, _display = verification_statuses[None]
 
     # Gets data for midcourse reverifications, if any are necessary or have failed
     statuses = ["approved", "denied", "pending", "must_reverify"]
-    reverifications = reverification_info(course_enrollment_pairs, user, statuses)
+    reverifications = _reverification_info(course_enrollment_pairs, statuses, windows, verification_statuses)
 
-    show_refund_option_for = frozenset(course.id for course, _enrollment in course_enrollment_pairs
-                                       if _enrollment.refundable())
+    # students may receive a refund if the course offers a verified certificate; see CourseEnrollment.refundable
+    show_refund_option_for = frozenset(
+        course_id for course_id in course_ids
+        if any(mode.slug == 'verified' for mode in modes_by_course[course_id])
+    )
 
     # get info w.r.t ExternalAuthMap
     external_auth_map = None
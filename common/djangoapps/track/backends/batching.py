@@ -0,0 +1,218 @@
+"""
+Event tracker backend that queues events in memory and sends them in
+batches to another backend on a background thread, so that requests
+don't wait on the backend (e.g. a slow MongoDB).
+
+Example configuration::
+
+  TRACKING_BACKENDS = {
+      'mongo': {
+          'ENGINE': 'track.backends.batching.BatchingBackend',
+          'OPTIONS': {
+              'backend': {
+                  'ENGINE': 'track.backends.mongodb.MongoBackend',
+                  'OPTIONS': {'database': 'track'},
+              },
+              'max_queue_size': 10000,
+              'max_batch_size': 100,
+              'flush_interval': 1.0,
+              'overflow_policy': 'drop_oldest',
+          }
+      }
+  }
+
+"""
+
+from __future__ import absolute_import
+
+import atexit
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+
+from dogapi import dog_stats_api
+
+from track.backends import BaseBackend
+
+
+log = logging.getLogger(__name__)
+
+# What to do with an event when the queue is full:
+# drop the oldest queued event to make room for it
+DROP_OLDEST = 'drop_oldest'
+# wait (up to block_timeout seconds) for the flusher to make room; drop the event if it doesn't
+BLOCK = 'block'
+# once the queue is more than half full, keep events with a probability which falls to 0 as it fills
+SAMPLE = 'sample'
+OVERFLOW_POLICIES = (DROP_OLDEST, BLOCK, SAMPLE)
+
+
+class BatchingBackend(BaseBackend):
+    """
+    Event tracker backend which queues events for a background thread to send
+    to another backend in batches (see `BaseBackend.send_batch`).
+
+    Only backends which override `send_batch` (e.g. `MongoBackend`,
+    `LoggerBackend`) write a batch at once; others still get one `send` per
+    event, just off the request thread.
+
+    The counts of events queued, flushed, dropped (because the queue was
+    full) and failed (because the backend raised) are available from `stats`.
+    Events sent one at a time by a backend whose `send` swallows its own
+    errors never count as failed.
+
+    """
+
+    def __init__(self, backend, max_queue_size=10000, max_batch_size=100, flush_interval=1.0,
+                 overflow_policy=DROP_OLDEST, block_timeout=0.1, **kwargs):
+        """
+        :Parameters:
+
+          - `backend`: dict with the 'ENGINE' and 'OPTIONS' of the backend to send batches to
+          - `max_queue_size`: the most events to hold in memory
+          - `max_batch_size`: the most events to send to the backend at once
+          - `flush_interval`: the most seconds an event waits before being sent
+          - `overflow_policy`: one of 'drop_oldest', 'block' or 'sample'
+          - `block_timeout`: the most seconds the 'block' policy waits for room
+
+        """
+        super(BatchingBackend, self).__init__(**kwargs)
+
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError('Invalid overflow policy %s' % overflow_policy)
+
+        # avoid the circular import of track.tracker
+        from track.tracker import _instantiate_backend_from_name  # pylint: disable=protected-access
+        self.backend = _instantiate_backend_from_name(backend['ENGINE'], backend.get('OPTIONS', {}))
+
+        self.max_queue_size = max_queue_size
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._pid = None
+        self._flushing = 0
+
+        self.queued = 0
+        self.flushed = 0
+        self.dropped = 0
+        self.failed = 0
+
+        atexit.register(self.flush)
+
+    @property
+    def stats(self):
+        """The counts of events queued, flushed, dropped and failed and currently waiting in the queue"""
+        with self._condition:
+            return {
+                'queued': self.queued,
+                'flushed': self.flushed,
+                'dropped': self.dropped,
+                'failed': self.failed,
+                'waiting': len(self._queue),
+            }
+
+    def send(self, event):
+        """Queue the event for the flusher thread"""
+        self._ensure_flusher()
+        with self._condition:
+            if not self._make_room():
+                self.dropped += 1
+                dog_stats_api.increment('track.batching.dropped')
+                return
+            self._queue.append(event)
+            self.queued += 1
+            if len(self._queue) >= self.max_batch_size:
+                self._condition.notify_all()
+
+    def _make_room(self):
+        """
+        Apply the overflow policy. Returns False if the new event should be
+        dropped. Must be called holding self._condition.
+        """
+        if self.overflow_policy == SAMPLE:
+            high_water_mark = self.max_queue_size / 2.0
+            if len(self._queue) > high_water_mark:
+                keep_probability = (self.max_queue_size - len(self._queue)) / high_water_mark
+                if random.random() >= keep_probability:
+                    return False
+        if len(self._queue) < self.max_queue_size:
+            return True
+
+        if self.overflow_policy == DROP_OLDEST:
+            self._queue.popleft()
+            self.dropped += 1
+            dog_stats_api.increment('track.batching.dropped')
+            return True
+        elif self.overflow_policy == BLOCK:
+            deadline = time.time() + self.block_timeout
+            while len(self._queue) >= self.max_queue_size:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                self._condition.notify_all()
+                self._condition.wait(remaining)
+            return True
+        return False
+
+    def _ensure_flusher(self):
+        """Start the flusher thread in this process (again, if the process has forked since)"""
+        if self._pid == os.getpid() and self._thread is not None and self._thread.is_alive():
+            return
+        with self._condition:
+            if self._pid != os.getpid() or self._thread is None or not self._thread.is_alive():
+                if self._pid != os.getpid():
+                    # the events queued in the parent are the parent's to send
+                    self._queue.clear()
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._run, name='track-batching-flusher')
+                self._thread.daemon = True
+                self._thread.start()
+
+    def _run(self):
+        """The flusher thread's loop"""
+        while True:
+            with self._condition:
+                if len(self._queue) < self.max_batch_size:
+                    self._condition.wait(self.flush_interval)
+            self._flush_batches()
+
+    def _flush_batches(self):
+        """Send everything currently queued to the backend, a batch at a time"""
+        while True:
+            with self._condition:
+                if not self._queue:
+                    return
+                batch = [self._queue.popleft() for __ in xrange(min(self.max_batch_size, len(self._queue)))]
+                self._flushing += 1
+                # wake up any senders blocked on a full queue
+                self._condition.notify_all()
+            try:
+                with dog_stats_api.timer('track.batching.send_batch'):
+                    self.backend.send_batch(batch)
+            except Exception:  # pylint: disable=broad-except
+                log.exception('Error sending a batch of %d events to the event tracker backend', len(batch))
+                with self._condition:
+                    self.failed += len(batch)
+            else:
+                with self._condition:
+                    self.flushed += len(batch)
+            finally:
+                with self._condition:
+                    self._flushing -= 1
+                    self._condition.notify_all()
+
+    def flush(self):
+        """Send all queued events before returning (e.g. at exit or in tests)"""
+        self._flush_batches()
+        # wait for any batch the flusher thread is in the middle of sending
+        with self._condition:
+            while self._flushing:
+                self._condition.wait(self.flush_interval)
@@ -0,0 +1,251 @@
+"""
+Event tracker backend that saves events to compressed, column oriented
+segment files, and the functions to read them back.
+
+Rather than one JSON document per event, each segment holds the values of
+every field of up to `segment_size` events one column at a time, and the
+fields which repeat the most across events (the event type, course, user,
+page, agent, ...) are dictionary encoded: each distinct value is stored once
+and the column holds indexes into those values. The segment is then gzipped.
+
+`read_segment` streams a segment's events back in the same shape as the
+events the JSON `LoggerBackend` logs.
+
+"""
+
+from __future__ import absolute_import
+
+import atexit
+import glob
+import gzip
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from track.backends import BaseBackend
+from track.utils import DateTimeJSONEncoder
+
+
+log = logging.getLogger(__name__)
+
+SEGMENT_FORMAT = 'edx.tracking.columnar'
+SEGMENT_VERSION = 1
+SEGMENT_SUFFIX = '.seg.gz'
+
+# the fields to dictionary encode. 'context.x' is the field x of the event's context
+DICTIONARY_FIELDS = (
+    'event_type', 'event_source', 'username', 'page', 'agent', 'host', 'context.course_id',
+)
+
+# the index of a missing value in a dictionary encoded column
+MISSING_INDEX = -1
+
+
+class ColumnarBackend(BaseBackend):
+    """
+    Event tracker backend which writes columnar segment files.
+
+    Events are buffered in memory and written out as a new segment once
+    `segment_size` events are buffered, `max_segment_age` seconds after the
+    first was buffered (checked when the next event arrives) and at exit.
+    Since a segment is compressed as it's written, consider wrapping this
+    backend in a `track.backends.batching.BatchingBackend`.
+
+    """
+
+    def __init__(self, directory, prefix='tracking', segment_size=10000, max_segment_age=300, **kwargs):
+        """
+        :Parameters:
+
+          - `directory`: where to write segment files
+          - `prefix`: the start of segment file names
+          - `segment_size`: the most events in a segment
+          - `max_segment_age`: the most seconds an event is buffered for (if others follow it)
+
+        """
+        super(ColumnarBackend, self).__init__(**kwargs)
+
+        self.directory = directory
+        self.prefix = prefix
+        self.segment_size = segment_size
+        self.max_segment_age = max_segment_age
+
+        self._events = []
+        self._first_event_at = None
+        self._segment_number = 0
+        self._lock = threading.Lock()
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        atexit.register(self.flush)
+
+    def send(self, event):
+        self.send_batch([event])
+
+    def send_batch(self, events):
+        with self._lock:
+            if not self._events:
+                self._first_event_at = time.time()
+            self._events.extend(events)
+            if len(self._events) >= self.segment_size or time.time() - self._first_event_at >= self.max_segment_age:
+                self._write_segment()
+
+    def flush(self):
+        """Write any buffered events to a segment"""
+        with self._lock:
+            self._write_segment()
+
+    def _write_segment(self):
+        """Write the buffered events to a new segment file. Must be called holding self._lock."""
+        while self._events:
+            events, self._events = self._events[:self.segment_size], self._events[self.segment_size:]
+            self._segment_number += 1
+            file_name = '{prefix}-{timestamp}-{pid}-{number:06d}{suffix}'.format(
+                prefix=self.prefix,
+                timestamp=time.strftime('%Y%m%d%H%M%S', time.gmtime()),
+                pid=os.getpid(),
+                number=self._segment_number,
+                suffix=SEGMENT_SUFFIX,
+            )
+            # write to a temporary file and rename it so readers never see a partial segment
+            temp_fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix='.tmp')
+            try:
+                with os.fdopen(temp_fd, 'wb') as temp_file:
+                    with gzip.GzipFile(fileobj=temp_file, mode='wb') as segment_file:
+                        json.dump(encode_segment(events), segment_file, cls=DateTimeJSONEncoder, separators=(',', ':'))
+                os.rename(temp_path, os.path.join(self.directory, file_name))
+            except (IOError, OSError, TypeError, ValueError):
+                # The events will be lost
+                log.exception('Error writing a segment of %d events to the columnar event tracker backend', len(events))
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+        self._first_event_at = None
+
+
+def _get_field(event, field):
+    """Returns (True, value) of the (possibly 'context.' prefixed) field of the event or (False, None)"""
+    if field.startswith('context.'):
+        event = event.get('context')
+        field = field[len('context.'):]
+        if not isinstance(event, dict):
+            return False, None
+    if field in event:
+        return True, event[field]
+    return False, None
+
+
+def encode_segment(events):
+    """
+    Returns the (JSON serializable) columnar segment of a list of events
+    """
+    columns = {}
+
+    for field in DICTIONARY_FIELDS:
+        dictionary = []
+        indexes = {}
+        values = []
+        for event in events:
+            present, value = _get_field(event, field)
+            if not present:
+                values.append(MISSING_INDEX)
+                continue
+            # the JSON of the value so unhashable values can be dictionary encoded too
+            key = json.dumps(value, cls=DateTimeJSONEncoder, sort_keys=True)
+            if key not in indexes:
+                indexes[key] = len(dictionary)
+                dictionary.append(value)
+            values.append(indexes[key])
+        columns[field] = {'dictionary': dictionary, 'values': values}
+
+    plain_fields = set()
+    for event in events:
+        plain_fields.update(event)
+    plain_fields.difference_update(DICTIONARY_FIELDS)
+
+    for field in plain_fields:
+        values = []
+        missing = []
+        for row, event in enumerate(events):
+            if field not in event:
+                missing.append(row)
+                values.append(None)
+            elif field == 'context' and isinstance(event['context'], dict):
+                values.append({
+                    key: value for key, value in event['context'].iteritems()
+                    if 'context.' + key not in DICTIONARY_FIELDS
+                })
+            else:
+                values.append(event[field])
+        columns[field] = {'values': values, 'missing': missing}
+
+    return {
+        'format': SEGMENT_FORMAT,
+        'version': SEGMENT_VERSION,
+        'count': len(events),
+        'columns': columns,
+    }
+
+
+def decode_segment(segment):
+    """
+    Generates the events of a columnar segment
+    """
+    if segment.get('format') != SEGMENT_FORMAT or segment.get('version') != SEGMENT_VERSION:
+        raise ValueError('Not a version {} columnar tracking log segment'.format(SEGMENT_VERSION))
+
+    columns = segment['columns']
+    plain_columns = [
+        (field, column['values'], set(column['missing']))
+        for field, column in columns.iteritems()
+        if 'dictionary' not in column
+    ]
+    dictionary_columns = [
+        (field, column['dictionary'], column['values'])
+        for field, column in columns.iteritems()
+        if 'dictionary' in column
+    ]
+
+    for row in xrange(segment['count']):
+        event = {}
+        for field, values, missing in plain_columns:
+            if row not in missing:
+                event[field] = values[row]
+        for field, dictionary, values in dictionary_columns:
+            index = values[row]
+            if index == MISSING_INDEX:
+                continue
+            if field.startswith('context.'):
+                event['context'][field[len('context.'):]] = dictionary[index]
+            else:
+                event[field] = dictionary[index]
+        yield event
+
+
+def read_segment(path):
+    """
+    Generates the events in the segment file at path
+    """
+    with gzip.open(path, 'rb') as segment_file:
+        segment = json.load(segment_file)
+    return decode_segment(segment)
+
+
+def read_segments(path):
+    """
+    Generates the events in the segment file at path or, if path is a
+    directory, in all of the segment files in it in the order they were written
+    """
+    if os.path.isdir(path):
+        paths = sorted(
+            glob.glob(os.path.join(path, '*' + SEGMENT_SUFFIX)),
+            key=lambda segment_path: os.path.basename(segment_path).rsplit('-', 3)[1:]
+        )
+    else:
+        paths = [path]
+    for segment_path in paths:
+        for event in read_segment(segment_path):
+            yield event
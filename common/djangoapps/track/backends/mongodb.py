@@ -95,3 +95,14 @@ class MongoBackend(BaseBackend):
             # during the next event.
             msg = 'Error inserting to MongoDB event tracker backend'
             log.exception(msg)
+
+    def send_batch(self, events):
+        """
+        Insert the events in to the Mongo collection with one insert.
+
+        Unlike `send`, a PyMongoError is raised to the caller (e.g. the
+        batching backend, which logs it and counts the events as failed).
+        """
+        if not events:
+            return
+        self.collection.insert(events, manipulate=False, continue_on_error=True)
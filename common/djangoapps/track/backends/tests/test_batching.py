@@ -0,0 +1,109 @@
+from __future__ import absolute_import
+
+import threading
+import time
+
+from django.test import TestCase
+
+from track.backends import BaseBackend
+from track.backends.batching import BatchingBackend
+
+
+class RecordingBackend(BaseBackend):
+    """Backend which records the batches it's sent"""
+    def __init__(self, **kwargs):
+        super(RecordingBackend, self).__init__(**kwargs)
+        self.batches = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def send(self, event):
+        self.send_batch([event])
+
+    def send_batch(self, events):
+        self.release.wait()
+        self.batches.append(events)
+
+
+class FailingBackend(BaseBackend):
+    """Backend which can't send anything"""
+    def send(self, event):
+        raise Exception('unavailable')
+
+
+def make_backend(engine='track.backends.tests.test_batching.RecordingBackend', **options):
+    options.setdefault('flush_interval', 60)
+    return BatchingBackend(backend={'ENGINE': engine}, **options)
+
+
+class TestBatchingBackend(TestCase):
+    def test_batches(self):
+        backend = make_backend(max_batch_size=2)
+        # keep the flusher thread from sending anything until we flush
+        backend.backend.release.clear()
+        for i in range(5):
+            backend.send({'test': i})
+        backend.backend.release.set()
+        backend.flush()
+
+        events = [event for batch in backend.backend.batches for event in batch]
+        self.assertEqual([{'test': i} for i in range(5)], sorted(events, key=lambda event: event['test']))
+        self.assertTrue(all(len(batch) <= 2 for batch in backend.backend.batches))
+        self.assertEqual(
+            {'queued': 5, 'flushed': 5, 'dropped': 0, 'failed': 0, 'waiting': 0},
+            backend.stats
+        )
+
+    def test_drop_oldest(self):
+        backend = make_backend(max_queue_size=3, max_batch_size=10)
+        backend._ensure_flusher()  # pylint: disable=protected-access
+        backend.backend.release.clear()
+        # hold the flusher thread while the events are sent
+        with backend._condition:  # pylint: disable=protected-access
+            for i in range(5):
+                backend.send({'test': i})
+            self.assertEqual([{'test': i} for i in range(2, 5)], list(backend._queue))  # pylint: disable=protected-access
+        backend.backend.release.set()
+        backend.flush()
+        self.assertEqual(2, backend.stats['dropped'])
+
+    def test_block(self):
+        backend = make_backend(max_queue_size=2, max_batch_size=1, overflow_policy='block', block_timeout=0.01)
+        backend.backend.release.clear()
+        # the flusher thread takes the first event and is stuck sending it
+        backend.send({'test': 0})
+        for __ in range(1000):
+            if backend._flushing:  # pylint: disable=protected-access
+                break
+            time.sleep(0.01)
+        for i in range(1, 4):
+            backend.send({'test': i})
+        # the newest event is dropped once the wait for room times out
+        self.assertEqual([{'test': 1}, {'test': 2}], list(backend._queue))  # pylint: disable=protected-access
+        self.assertEqual(1, backend.stats['dropped'])
+        backend.backend.release.set()
+        backend.flush()
+        self.assertEqual(3, backend.stats['flushed'])
+
+    def test_sample(self):
+        backend = make_backend(max_queue_size=10, max_batch_size=100, overflow_policy='sample')
+        backend.backend.release.clear()
+        with backend._condition:  # pylint: disable=protected-access
+            for i in range(100):
+                backend.send({'test': i})
+            waiting = len(backend._queue)  # pylint: disable=protected-access
+        self.assertTrue(5 <= waiting <= 10)
+        self.assertEqual(100 - waiting, backend.stats['dropped'])
+        backend.backend.release.set()
+        backend.flush()
+
+    def test_failed(self):
+        backend = make_backend(engine='track.backends.tests.test_batching.FailingBackend')
+        backend.send({'test': 1})
+        backend.flush()
+        self.assertEqual(1, backend.stats['failed'])
+        self.assertEqual(0, backend.stats['flushed'])
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            make_backend(overflow_policy='ignore')
@@ -0,0 +1,66 @@
+from __future__ import absolute_import
+
+import datetime
+import json
+import os
+import shutil
+import tempfile
+
+from django.test import TestCase
+
+from track.backends.columnar import ColumnarBackend, encode_segment, decode_segment, read_segments
+from track.utils import DateTimeJSONEncoder
+
+
+class TestColumnarBackend(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        self.events = [
+            {
+                'username': 'user{}'.format(i % 3),
+                'event_type': '/courses/edX/toy/2012_Fall/courseware',
+                'event_source': 'server',
+                'event': {'POST': {}, 'GET': {'i': [str(i)]}},
+                'agent': 'Mozilla/5.0',
+                'page': None,
+                'time': datetime.datetime(2014, 1, 1, 0, 0, i),
+                'host': 'localhost',
+                'ip': '127.0.0.1',
+                'context': {'course_id': 'edX/toy/2012_Fall', 'user_id': i % 3, 'org_id': 'edX'},
+            }
+            for i in range(10)
+        ]
+        # events which lack some fields
+        self.events.append({'event_type': 'no_context', 'time': datetime.datetime(2014, 1, 1)})
+        self.events.append({'event_type': 'no_course', 'context': {'path': '/'}})
+
+    def expected(self, events):
+        """The events as the logger backend would have logged them"""
+        return [json.loads(json.dumps(event, cls=DateTimeJSONEncoder)) for event in events]
+
+    def test_encode_decode(self):
+        segment = json.loads(json.dumps(encode_segment(self.events), cls=DateTimeJSONEncoder))
+        self.assertEqual(self.expected(self.events), list(decode_segment(segment)))
+        # repeated values are only stored once
+        self.assertEqual(['user0', 'user1', 'user2'], segment['columns']['username']['dictionary'])
+
+    def test_segments(self):
+        backend = ColumnarBackend(directory=self.directory, segment_size=5)
+        for event in self.events:
+            backend.send(event)
+        self.assertEqual(2, len(os.listdir(self.directory)))
+
+        backend.flush()
+        self.assertEqual(3, len(os.listdir(self.directory)))
+        self.assertEqual(self.expected(self.events), list(read_segments(self.directory)))
+
+    def test_max_segment_age(self):
+        backend = ColumnarBackend(directory=self.directory, max_segment_age=0)
+        backend.send(self.events[0])
+        self.assertEqual(self.expected(self.events[:1]), list(read_segments(self.directory)))
+
+    def test_invalid_segment(self):
+        with self.assertRaises(ValueError):
+            list(decode_segment({'format': 'other'}))
@@ -47,6 +47,17 @@ class TestLoggerBackend(TestCase):
         self.assertEqual(saved_events[0], unpacked_event)
         self.assertEqual(saved_events[1], unpacked_event)
 
+    def test_send_batch(self):
+        self.handler.reset()
+
+        # A batch is logged with one call, one serialized event per line
+        self.backend.send_batch([{'test': 1}, {'test': 2}])
+        self.backend.send_batch([])
+
+        self.assertEqual(len(self.handler.messages['info']), 1)
+        saved_events = [json.loads(e) for e in self.handler.messages['info'][0].split('\n')]
+        self.assertEqual(saved_events, [{'test': 1}, {'test': 2}])
+
 
 class MockLoggingHandler(logging.Handler):
     """
@@ -0,0 +1,28 @@
+"""
+Print the events in columnar tracking log segments as JSON lines (the format of the
+tracking log written by track.backends.logger.LoggerBackend).
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from track.backends.columnar import read_segments
+
+
+class Command(BaseCommand):
+    args = '<segment file|directory> [segment file|directory ...]'
+    help = """
+    Print the events in the given columnar tracking log segment files (or all of the
+    segment files in the given directories) as one JSON object per line.
+    """
+
+    def handle(self, *args, **options):
+        if len(args) < 1:
+            raise CommandError('Usage is dump_tracking_segments {0}'.format(self.args))
+
+        for path in args:
+            try:
+                for event in read_segments(path):
+                    self.stdout.write(json.dumps(event) + '\n')
+            except (IOError, ValueError) as err:
+                raise CommandError('Unable to read {0}: {1}'.format(path, err))
@@ -17,6 +17,7 @@ from xmodule.seq_module import SequenceModule
 from xmodule.vertical_module import VerticalModule
 from xmodule.x_module import shim_xmodule_js, XModuleDescriptor, XModule
 from lms.lib.xblock.runtime import quote_slashes
+from request_cache.middleware import RequestCache
 from xmodule.modulestore import MONGO_MODULESTORE_TYPE
 from xmodule.modulestore.django import modulestore
 
@@ -131,6 +132,53 @@ def replace_static_urls(data_dir, block, view, frag, context, course_id=None, st
     ))
 
 
+def replace_urls(data_dir, course_id, jump_to_id_base_url, block, view, frag, context, static_asset_path=''):  # pylint: disable=unused-argument
+    """
+    Does what replace_static_urls, replace_course_urls and replace_jump_to_id_urls do in a single pass
+    over the fragment's content (see static_replace.replace_urls).
+
+    The content of a container (e.g. a sequence or vertical) includes the already rewritten content of
+    its children; so, the rewritten content of each block is remembered for the rest of the request and
+    a container only rewrites the parts of its content outside of its children's content. Outside of a
+    request (e.g. in a celery task) nothing is remembered and each block rewrites all of its content.
+    """
+    if RequestCache.get_current_request() is not None:
+        rewritten_fragments = RequestCache.get_request_cache().data.setdefault(
+            'xmodule_modifiers.rewritten_fragments', {}
+        )
+    else:
+        rewritten_fragments = {}
+
+    def rewrite(text):
+        return static_replace.replace_urls(
+            text, data_dir, course_id, static_asset_path=static_asset_path, jump_to_id_base_url=jump_to_id_base_url
+        )
+
+    content = frag.content
+    child_spans = []
+    for child_id in getattr(block, 'children', None) or []:
+        child_content = rewritten_fragments.get(child_id)
+        if child_content:
+            start = content.find(child_content)
+            if start != -1:
+                child_spans.append((start, start + len(child_content)))
+
+    pieces = []
+    position = 0
+    for start, end in sorted(child_spans):
+        if start < position:
+            # overlaps a preceding child (e.g. the same content rendered twice)
+            continue
+        pieces.append(rewrite(content[position:start]))
+        pieces.append(content[start:end])
+        position = end
+    pieces.append(rewrite(content[position:]))
+    new_content = u''.join(pieces)
+
+    rewritten_fragments[block.scope_ids.usage_id] = new_content
+    return wrap_fragment(frag, new_content)
+
+
 def grade_histogram(module_id):
     '''
     Print out a histogram of grades on a given problem in staff member debug info.
@@ -88,7 +88,8 @@ class MongoContentStore(ContentStore):
                     location, fp.displayname, fp.content_type, fp, last_modified_at=fp.uploadDate,
                     thumbnail_location=thumbnail_location,
                     import_path=getattr(fp, 'import_path', None),
-                    length=fp.length, locked=getattr(fp, 'locked', False)
+                    length=fp.length, locked=getattr(fp, 'locked', False),
+                    content_digest=getattr(fp, 'md5', None)
                 )
             else:
                 with self.fs.get(content_id) as fp:
@@ -99,7 +100,8 @@ class MongoContentStore(ContentStore):
                         location, fp.displayname, fp.content_type, fp.read(), last_modified_at=fp.uploadDate,
                         thumbnail_location=thumbnail_location,
                         import_path=getattr(fp, 'import_path', None),
-                        length=fp.length, locked=getattr(fp, 'locked', False)
+                        length=fp.length, locked=getattr(fp, 'locked', False),
+                        content_digest=getattr(fp, 'md5', None)
                     )
         except NoFile:
             if throw_on_not_found:
@@ -107,6 +109,26 @@ class MongoContentStore(ContentStore):
             else:
                 return None
 
+    def find_metadata(self, location, throw_on_not_found=True):
+        """
+        Return a StaticContent w/o data for the given asset reading only its metadata from the files
+        collection (w/o opening the gridfs file). Callers which need the bytes should use find.
+        """
+        item = self.fs_files.find_one(
+            self.asset_db_key(location),
+            fields=['displayname', 'contentType', 'uploadDate', 'length', 'md5', 'locked', 'import_path']
+        )
+        if item is None:
+            if throw_on_not_found:
+                raise NotFoundError()
+            else:
+                return None
+        return StaticContent(
+            location, item.get('displayname'), item.get('contentType'), None, last_modified_at=item.get('uploadDate'),
+            import_path=item.get('import_path'), length=item.get('length'), locked=item.get('locked', False),
+            content_digest=item.get('md5')
+        )
+
     def get_stream(self, location):
         content_id = self.asset_db_key(location)
         fs_pointer = self.fs_files.find_one(content_id, fields={'_id': 1})
@@ -1,4 +1,5 @@
 import logging
+import threading
 from cStringIO import StringIO
 from math import exp
 from lxml import etree
@@ -55,8 +56,19 @@ class StringOrDate(Date):
             return result
 
 
-edx_xml_parser = etree.XMLParser(dtd_validation=False, load_dtd=False,
-                                 remove_comments=True, remove_blank_text=True)
+_parsers = threading.local()
+
+
+def _get_xml_parser():
+    """
+    The calling thread's parser for course.xml; lxml parsers are not thread safe (see
+    xml_module.get_edx_xml_parser)
+    """
+    parser = getattr(_parsers, 'parser', None)
+    if parser is None:
+        parser = _parsers.parser = etree.XMLParser(dtd_validation=False, load_dtd=False,
+                                                   remove_comments=True, remove_blank_text=True)
+    return parser
 
 _cached_toc = {}
 
@@ -526,7 +538,7 @@ class CourseDescriptor(CourseFields, SequenceDescriptor):
         # bleh, have to parse the XML here to just pull out the url_name attribute
         # I don't think it's stored anywhere in the instance.
         course_file = StringIO(xml_data.encode('ascii', 'ignore'))
-        xml_obj = etree.parse(course_file, parser=edx_xml_parser).getroot()
+        xml_obj = etree.parse(course_file, parser=_get_xml_parser()).getroot()
 
         policy_dir = None
         url_name = xml_obj.get('url_name', xml_obj.get('slug'))
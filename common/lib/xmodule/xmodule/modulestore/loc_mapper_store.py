@@ -3,6 +3,7 @@ Method for converting among our differing Location/Locator whatever reprs
 '''
 from random import randint
 import re
+import time
 import pymongo
 import bson.son
 import urllib
@@ -28,6 +29,12 @@ class LocMapperStore(object):
     '''
 
     SCHEMA_VERSION = 1
+    # the max number of courses' map entries to keep in process memory
+    MAX_IN_MEMORY_ENTRIES = 100
+    # the number of seconds a course's map entry is kept in process memory, so that changes made
+    # by other processes (e.g., delete_course_mapping) are seen
+    IN_MEMORY_ENTRY_TIMEOUT = 60
+
     def __init__(
         self, cache, host, db, collection, port=27017, user=None, password=None,
         **kwargs
@@ -51,6 +58,10 @@ class LocMapperStore(object):
         self.location_map = self.db[collection + '.location_map']
         self.location_map.write_concern = {'w': 1}
         self.cache = cache
+        # {course_son key: (location_map entry, time read)}. An entry is reread once it's older than
+        # IN_MEMORY_ENTRY_TIMEOUT, as another process may have deleted or changed it; and a block not
+        # found in it is refetched before concluding it's missing.
+        self._entries = {}
 
     # location_map functions
     def create_map_entry(self, course_key, org=None, offering=None, draft_branch='draft', prod_branch='published',
@@ -107,6 +118,7 @@ class LocMapperStore(object):
             'block_map': block_map or {},
             'schema': self.SCHEMA_VERSION,
         })
+        self._entries.pop(self._entry_key(course_key), None)
 
         return CourseLocator(org, offering)
 
@@ -137,16 +149,18 @@ class LocMapperStore(object):
         if cached_value:
             return cached_value
 
-        entry = self.location_map.find_one(course_son)
+        course_key = location.course_key
+        entry = self._get_map_entries([course_key]).get(course_key)
+        if entry is not None and self._block_id_from_entry(entry, location) is None:
+            # the in memory entry may predate another process mapping this block
+            entry = self._get_map_entries([course_key], refresh=True).get(course_key)
         if entry is None:
             if add_entry_if_missing:
                 # create a new map
-                self.create_map_entry(location.course_key)
-                entry = self.location_map.find_one(course_son)
+                self.create_map_entry(course_key)
+                entry = self._get_map_entries([course_key], refresh=True)[course_key]
             else:
                 raise ItemNotFoundError(location)
-        else:
-            entry = self._migrate_if_necessary([entry])[0]
 
         block_id = entry['block_map'].get(self.encode_key_for_mongo(location.name))
         category = location.category
@@ -173,21 +187,7 @@ class LocMapperStore(object):
             else:
                 raise ItemNotFoundError(location)
 
-        prod_course_locator = CourseLocator(
-            org=entry['org'],
-            offering=entry['offering'],
-            branch=entry['prod_branch']
-        )
-        published_usage = BlockUsageLocator(
-            prod_course_locator,
-            block_type=category,
-            block_id=block_id
-        )
-        draft_usage = BlockUsageLocator(
-            prod_course_locator.for_branch(entry['draft_branch']),
-            block_type=category,
-            block_id=block_id
-        )
+        published_usage, draft_usage = self._usages_from_entry(entry, category, block_id)
         if published:
             result = published_usage
         else:
@@ -196,6 +196,92 @@ class LocMapperStore(object):
         self._cache_location_map_entry(location, published_usage, draft_usage)
         return result
 
+    def translate_locations_bulk(self, locations, published=True):
+        """
+        Translate many module locations to Locators reading each course's map entry only once. Unlike
+        translate_location, this never adds entries to the map.
+
+        :param locations: an iterable of Locations pointing to modules
+        :param published: a boolean to indicate whether the caller wants the draft or published branch.
+
+        Returns a dict of {location: locator} which omits any location which has no mapping.
+        """
+        result = {}
+        locations = list(locations)
+        cache_keys = dict((self._location_cache_key(location), location) for location in locations)
+        cached = self.cache.get_many(cache_keys.keys()) if cache_keys else {}
+        locations_by_course = {}
+        for cache_key, location in cache_keys.iteritems():
+            if cache_key in cached:
+                result[location] = cached[cache_key][0 if published else 1]
+            else:
+                locations_by_course.setdefault(location.course_key, []).append(location)
+        if not locations_by_course:
+            return result
+
+        setmany = {}
+        for course_key, entry in self._get_map_entries(locations_by_course.keys()).iteritems():
+            for location in locations_by_course[course_key]:
+                category_n_block_id = self._block_id_from_entry(entry, location)
+                if category_n_block_id is None:
+                    continue
+                published_usage, draft_usage = self._usages_from_entry(entry, *category_n_block_id)
+                setmany.update(self._location_map_cache_entries(location, published_usage, draft_usage))
+                result[location] = published_usage if published else draft_usage
+
+        if setmany:
+            self.cache.set_many(setmany)
+        return result
+
+    def translate_locators_bulk(self, locators):
+        """
+        Translate many BlockUsageLocators to Locations reading each course's map entry at most once. See
+        translate_locator_to_location.
+
+        Returns a dict of {locator: location} which omits any locator which has no mapping.
+        """
+        locators = list(locators)
+        cached = self.cache.get_many([unicode(locator) for locator in locators]) if locators else {}
+        result = {}
+        locators_by_course = {}
+        for locator in locators:
+            location = cached.get(unicode(locator))
+            if location is not None:
+                result[locator] = location
+            else:
+                # the entries are matched by their lower_offering, so group by it too
+                locators_by_course.setdefault((locator.org, locator.offering.lower()), []).append(locator)
+        if not locators_by_course:
+            return result
+
+        self._migrate_offering_if_necessary()
+        entries = self.location_map.find({'$or': [
+            bson.son.SON([('org', org), ('lower_offering', lower_offering)])
+            for org, lower_offering in locators_by_course
+        ]})
+        setmany = {}
+        for entry in entries:
+            course_locators = locators_by_course.get((entry['org'], entry['lower_offering']))
+            if not course_locators:
+                continue
+            old_course_id = self._generate_location_course_id(entry['_id'])
+            block_id_map = {}
+            for old_name, cat_to_usage in entry['block_map'].iteritems():
+                for category, block_id in cat_to_usage.iteritems():
+                    block_id_map[block_id] = (category, old_name)
+            for locator in course_locators:
+                if locator.block_id not in block_id_map:
+                    continue
+                category, old_name = block_id_map[locator.block_id]
+                location = old_course_id.make_usage_key(category, self.decode_key_from_mongo(old_name))
+                published_usage, draft_usage = self._usages_from_entry(entry, category, locator.block_id)
+                setmany.update(self._location_map_cache_entries(location, published_usage, draft_usage))
+                result[locator] = location
+
+        if setmany:
+            self.cache.set_many(setmany)
+        return result
+
     def translate_locator_to_location(self, locator, get_course=False, lower_only=False):
         """
         Returns an old style Location for the given Locator if there's an appropriate entry in the
@@ -243,15 +329,7 @@ class LocMapperStore(object):
                 ('lower_offering', locator.offering.lower()),
             ]))
         else:
-            # migrate any records which don't have the lower_org and lower_offering fields as
-            # this won't be able to find what it wants. (only needs to be run once ever per db,
-            # I'm not sure how to control that, but I'm putting some check here for once per launch)
-            if not getattr(self, 'offering_migrated', False):
-                obsolete = self.location_map.find(
-                    {'org': {"$exists": False}, "offering": {"$exists": False}, }
-                )
-                self._migrate_if_necessary(obsolete)
-                setattr(self, 'offering_migrated', True)
+            self._migrate_offering_if_necessary()
 
             entry = self.location_map.find_one(bson.son.SON([
                 ('org', locator.org),
@@ -338,6 +416,93 @@ class LocMapperStore(object):
         else:
             return draft_course_locator
 
+    def _migrate_offering_if_necessary(self):
+        """
+        migrate any records which don't have the lower_org and lower_offering fields as
+        lookups by locator won't be able to find what they want. (only needs to be run once ever per db,
+        I'm not sure how to control that, but I'm putting some check here for once per launch)
+        """
+        if not getattr(self, 'offering_migrated', False):
+            obsolete = self.location_map.find(
+                {'org': {"$exists": False}, "offering": {"$exists": False}, }
+            )
+            self._migrate_if_necessary(obsolete)
+            setattr(self, 'offering_migrated', True)
+
+    def _get_map_entries(self, course_keys, refresh=False):
+        """
+        Return {course_key: location_map entry} for those of the course_keys which have entries. Uses the
+        in memory entries which haven't timed out unless refresh and reads the rest in one query.
+        """
+        result = {}
+        missing = []
+        now = time.time()
+        for course_key in course_keys:
+            entry, read_at = (None, None) if refresh else self._entries.get(self._entry_key(course_key), (None, None))
+            if entry is None or now - read_at > self.IN_MEMORY_ENTRY_TIMEOUT:
+                missing.append(course_key)
+            else:
+                result[course_key] = entry
+        if not missing:
+            return result
+
+        if len(self._entries) + len(missing) > self.MAX_IN_MEMORY_ENTRIES:
+            self._entries = {}
+        entries = self.location_map.find({'_id': {'$in': [
+            self._construct_course_son(course_key) for course_key in missing
+        ]}})
+        for entry in self._migrate_if_necessary(entries):
+            if entry is None:
+                continue
+            course_key = self._generate_location_course_id(entry['_id'])
+            self._entries[self._entry_key(course_key)] = (entry, now)
+            result[course_key] = entry
+        return result
+
+    @staticmethod
+    def _entry_key(course_key):
+        """
+        The key for the course's entry in the in memory entries
+        """
+        return (course_key.org, course_key.course, course_key.run)
+
+    def _block_id_from_entry(self, entry, location):
+        """
+        Return (category, block_id) for the location if the entry maps it unambiguously, otherwise None.
+        """
+        block_id = entry['block_map'].get(self.encode_key_for_mongo(location.name))
+        if block_id is None:
+            return None
+        if location.category is None:
+            # jump_to_id uses a None category.
+            if len(block_id) != 1:
+                return None
+            return block_id.items()[0]
+        if location.category in block_id:
+            return location.category, block_id[location.category]
+        return None
+
+    def _usages_from_entry(self, entry, category, block_id):
+        """
+        Return the published and draft BlockUsageLocators for the block in the given map entry
+        """
+        prod_course_locator = CourseLocator(
+            org=entry['org'],
+            offering=entry['offering'],
+            branch=entry['prod_branch']
+        )
+        published_usage = BlockUsageLocator(
+            prod_course_locator,
+            block_type=category,
+            block_id=block_id
+        )
+        draft_usage = BlockUsageLocator(
+            prod_course_locator.for_branch(entry['draft_branch']),
+            block_type=category,
+            block_id=block_id
+        )
+        return published_usage, draft_usage
+
     def _add_to_block_map(self, location, course_son, block_map, block_id=None):
         '''add the given location to the block_map and persist it'''
         if block_id is None:
@@ -426,7 +591,7 @@ class LocMapperStore(object):
         """
         See if the location x published pair is in the cache. If so, return the mapped locator.
         """
-        entry = self.cache.get(u'{}+{}'.format(location.course_key, location))
+        entry = self.cache.get(self._location_cache_key(location))
         if entry is not None:
             if published:
                 return entry[0]
@@ -434,6 +599,13 @@ class LocMapperStore(object):
                 return entry[1]
         return None
 
+    @staticmethod
+    def _location_cache_key(location):
+        """
+        The cache key for the location's (published, draft) locators
+        """
+        return u'{}+{}'.format(location.course_key, location)
+
     def _get_course_locator_from_cache(self, old_course_id, published):
         """
         Get the course Locator for this old course id
@@ -479,15 +651,21 @@ class LocMapperStore(object):
         Also caches the inverse. If the location is category=='course', it caches it for
         the get_course query
         """
+        self.cache.set_many(self._location_map_cache_entries(location, published_usage, draft_usage))
+
+    def _location_map_cache_entries(self, location, published_usage, draft_usage):
+        """
+        Return the dict of cache entries for _cache_location_map_entry
+        """
         setmany = {}
         if location.category == 'course':
             setmany[u'courseId+{}'.format(published_usage.package_id)] = location
             setmany[u'courseIdLower+{}'.format(published_usage.package_id.lower())] = location
         setmany[unicode(published_usage)] = location
         setmany[unicode(draft_usage)] = location
-        setmany[unicode(location)] = (published_usage, draft_usage)
+        setmany[self._location_cache_key(location)] = (published_usage, draft_usage)
         setmany[unicode(location.course_key)] = (published_usage, draft_usage)
-        self.cache.set_many(setmany)
+        return setmany
 
     def delete_course_mapping(self, course_key):
         """
@@ -496,6 +674,7 @@ class LocMapperStore(object):
         :param course_key: a CourseKey for the course we wish to delete
         """
         self.location_map.remove(self._interpret_location_course_id(course_key))
+        self._entries.pop(self._entry_key(course_key), None)
 
         # Remove the location of course (draft and published) from cache
         cached_key = self.cache.get(unicode(course_key))
@@ -6,6 +6,8 @@ In this way, courses can be served up both - say - XMLModuleStore or MongoModule
 """
 
 import logging
+import sys
+import threading
 from uuid import uuid4
 from opaque_keys import InvalidKeyError
 
@@ -134,23 +136,24 @@ class MixedModuleStore(ModuleStoreWriteBase):
 
         courses = {}  # a dictionary of stringified course locations to course objects
         has_locators = any(issubclass(CourseLocator, store.reference_type) for store in stores)
-        for store in stores:
-            store_courses = store.get_courses()
+        courses_by_store = _get_courses_concurrently(stores)
+        if has_locators:
+            # see if a locator version of each course is in the result. If there's no existing mapping,
+            # then the course can't have been in split
+            course_locators = loc_mapper().translate_locations_bulk(
+                course.location
+                for store_courses in courses_by_store
+                for course in store_courses
+                if isinstance(course.location, Location)
+            )
+        for store_courses in courses_by_store:
             # filter out ones which were fetched from earlier stores but locations may not be ==
             for course in store_courses:
                 course_location = unicode(course.location)
                 if course_location not in courses:
                     if has_locators and isinstance(course.location, Location):
-                        # see if a locator version of course is in the result
-                        try:
-                            # if there's no existing mapping, then the course can't have been in split
-                            course_locator = loc_mapper().translate_location(
-                                course.location,
-                                add_entry_if_missing=False
-                            )
-                            if unicode(course_locator) not in courses:
-                                courses[course_location] = course
-                        except ItemNotFoundError:
+                        course_locator = course_locators.get(course.location)
+                        if course_locator is None or unicode(course_locator) not in courses:
                             courses[course_location] = course
                     else:
                         courses[course_location] = course
@@ -332,6 +335,48 @@ class MixedModuleStore(ModuleStoreWriteBase):
         return courses
 
 
+def _get_courses_concurrently(stores):
+    """
+    Call get_courses on each of the stores on its own thread so that listing courses costs the latency
+    of the slowest store rather than the sum of them. Returns the lists of courses in stores' order and
+    reraises the first exception any store raised.
+    """
+    if len(stores) < 2:
+        return [store.get_courses() for store in stores]
+
+    results = [None] * len(stores)
+    errors = []
+
+    def fetch(index, store, request_cache_data):
+        """
+        Get the store's courses sharing the calling thread's request cache (which is thread local)
+        """
+        try:
+            if request_cache_data is not None:
+                store.request_cache.data = request_cache_data
+            results[index] = store.get_courses()
+        except Exception:  # pylint: disable=broad-except
+            errors.append(sys.exc_info())
+
+    threads = []
+    for index, store in enumerate(stores):
+        request_cache = getattr(store, 'request_cache', None)
+        thread = threading.Thread(
+            target=fetch,
+            args=(index, store, getattr(request_cache, 'data', None)),
+            name='get_courses-{}'.format(index),
+        )
+        thread.daemon = True
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0][0], errors[0][1], errors[0][2]
+    return results
+
+
 def _compare_stores(left, right):
     """
     Order stores via precedence: if a course is found in an earlier store, it shadows the later store.
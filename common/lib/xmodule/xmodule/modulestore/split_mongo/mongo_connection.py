@@ -1,19 +1,34 @@
 """
 Segregation of pymongo functions from the data modeling mechanisms for split modulestore.
 """
+import copy
 import re
+import threading
+from collections import OrderedDict
+
 import pymongo
 from bson import son
 
+# fields only present on structure documents persisted as a diff against another structure
+DELTA_BASE = 'delta_base'
+DELTA_DEPTH = 'delta_depth'
+DELETED_BLOCKS = 'deleted_blocks'
+
 class MongoConnection(object):
     """
     Segregation of pymongo functions from the data modeling mechanisms for split modulestore.
     """
     def __init__(
-        self, db, collection, host, port=27017, tz_aware=True, user=None, password=None, **kwargs
+        self, db, collection, host, port=27017, tz_aware=True, user=None, password=None,
+        structure_snapshot_interval=None, structure_cache_size=16, **kwargs
     ):
         """
         Create & open the connection, authenticate, and provide pointers to the collections
+
+        :param structure_snapshot_interval: if set, new structure versions are persisted as a diff of
+        their 'blocks' against their previous_version and every structure_snapshot_interval'th version
+        in a chain is persisted in full. If None (the default), every version is persisted in full.
+        :param structure_cache_size: the max number of reconstructed structures to keep in memory
         """
         self.database = pymongo.database.Database(
             pymongo.MongoClient(
@@ -41,30 +56,124 @@ class MongoConnection(object):
         self.structures.write_concern = {'w': 1}
         self.definitions.write_concern = {'w': 1}
 
+        self.structure_snapshot_interval = structure_snapshot_interval
+        self.structure_cache_size = structure_cache_size
+        # {structure_id: reconstructed structure}, in lru order. Structures are immutable once
+        # inserted except via update_structure which evicts the entries it changes.
+        self._structure_cache = OrderedDict()
+        self._structure_cache_lock = threading.RLock()
+
     def get_structure(self, key):
         """
         Get the structure from the persistence mechanism whose id is the given key
         """
-        return self.structures.find_one({'_id': key})
+        cached = self._get_cached_structure(key)
+        if cached is not None:
+            return cached
+        return self._reconstruct_structure(self.structures.find_one({'_id': key}))
 
     def find_matching_structures(self, query):
         """
         Find the structure matching the query. Right now the query must be a legal mongo query
         :param query: a mongo-style query of {key: [value|{$in ..}|..], ..}
+
+        Note: structures persisted as diffs only contain the blocks which changed in that version;
+        so, queries on 'blocks.*' only match such versions if the block changed in them.
         """
-        return self.structures.find(query)
+        return (self._reconstruct_structure(entry) for entry in self.structures.find(query))
 
     def insert_structure(self, structure):
         """
         Create the structure in the db
         """
-        self.structures.insert(structure)
+        self.structures.insert(self._encode_structure(structure))
 
     def update_structure(self, structure):
         """
         Update the db record for structure
         """
-        self.structures.update({'_id': structure['_id']}, structure)
+        if self.structure_snapshot_interval:
+            # the versions diffed against this one are rebuilt from its blocks; so, persist them in
+            # full (as reconstructed from its current content) before changing it
+            for dependent in self.structures.find({DELTA_BASE: structure['_id']}):
+                self.structures.update({'_id': dependent['_id']}, self._reconstruct_structure(dependent))
+                with self._structure_cache_lock:
+                    self._structure_cache.pop(dependent['_id'], None)
+        self.structures.update({'_id': structure['_id']}, self._encode_structure(structure))
+        with self._structure_cache_lock:
+            self._structure_cache.pop(structure['_id'], None)
+
+    def _encode_structure(self, structure):
+        """
+        Return the document to persist for structure: structure itself when persisting full
+        versions, otherwise a copy whose 'blocks' only has the blocks which differ from its
+        previous_version and which records the deleted block ids.
+        """
+        if not self.structure_snapshot_interval or structure.get('previous_version') is None:
+            return structure
+        base_id = structure['previous_version']
+        base_doc = self.structures.find_one({'_id': base_id}, fields=[DELTA_DEPTH])
+        if base_doc is None:
+            return structure
+        depth = base_doc.get(DELTA_DEPTH, 0) + 1
+        if depth >= self.structure_snapshot_interval:
+            return structure
+        base = self.get_structure(base_id)
+
+        delta = son.SON((key, value) for key, value in structure.iteritems() if key != 'blocks')
+        delta['blocks'] = {
+            block_id: block
+            for block_id, block in structure['blocks'].iteritems()
+            if base['blocks'].get(block_id) != block
+        }
+        delta[DELETED_BLOCKS] = [
+            block_id for block_id in base['blocks'] if block_id not in structure['blocks']
+        ]
+        delta[DELTA_BASE] = base_id
+        delta[DELTA_DEPTH] = depth
+        return delta
+
+    def _reconstruct_structure(self, entry):
+        """
+        Return the full structure for the persisted document entry, applying its diff (if any)
+        to its reconstructed base.
+        """
+        if entry is None or DELTA_BASE not in entry:
+            return entry
+        base = self.get_structure(entry[DELTA_BASE])
+        structure = son.SON(
+            (key, value) for key, value in entry.iteritems()
+            if key not in (DELTA_BASE, DELTA_DEPTH, DELETED_BLOCKS, 'blocks')
+        )
+        structure['blocks'] = base['blocks']
+        for block_id in entry[DELETED_BLOCKS]:
+            structure['blocks'].pop(block_id, None)
+        structure['blocks'].update(entry['blocks'])
+        self._cache_structure(structure)
+        return structure
+
+    def _get_cached_structure(self, key):
+        """
+        Return a copy of the cached reconstructed structure for key or None
+        """
+        with self._structure_cache_lock:
+            structure = self._structure_cache.pop(key, None)
+            if structure is None:
+                return None
+            self._structure_cache[key] = structure
+        # callers mutate the structures they get back
+        return copy.deepcopy(structure)
+
+    def _cache_structure(self, structure):
+        """
+        Remember a copy of the reconstructed structure evicting the least recently used ones
+        """
+        if self.structure_cache_size <= 0:
+            return
+        with self._structure_cache_lock:
+            self._structure_cache[structure['_id']] = copy.deepcopy(structure)
+            while len(self._structure_cache) > self.structure_cache_size:
+                self._structure_cache.popitem(last=False)
 
     def get_course_index(self, key, ignore_case=False):
         """
@@ -34,6 +34,9 @@ Representation:
                 ***** 'previous_version': the guid for the structure which previously changed this xblock
                 (will be the previous value of update_version; so, may point to a structure not in this
                 structure's history.)
+    ** when persisted as a diff (see structure_snapshot_interval), the db record's 'blocks' only holds the
+    changed blocks and it also has 'delta_base', 'delta_depth', and 'deleted_blocks'. The MongoConnection
+    reconstructs the full structure; so, this class never sees those.
 * definition: shared content with revision history for xblock content fields
     ** '_id': definition_id (guid),
     ** 'category': xblock type id
@@ -107,15 +110,20 @@ class SplitMongoModuleStore(ModuleStoreWriteBase):
                  error_tracker=null_error_tracker,
                  loc_mapper=None,
                  i18n_service=None,
+                 structure_snapshot_interval=None,
                  **kwargs):
         """
         :param doc_store_config: must have a host, db, and collection entries. Other common entries: port, tz_aware.
+        :param structure_snapshot_interval: if set, persist each new structure version as a diff against
+        its previous version and only every structure_snapshot_interval'th version in full.
         """
 
         super(SplitMongoModuleStore, self).__init__(**kwargs)
         self.loc_mapper = loc_mapper
 
-        self.db_connection = MongoConnection(**doc_store_config)
+        self.db_connection = MongoConnection(
+            structure_snapshot_interval=structure_snapshot_interval, **doc_store_config
+        )
         self.db = self.db_connection.database
 
         # Code review question: How should I expire entries?
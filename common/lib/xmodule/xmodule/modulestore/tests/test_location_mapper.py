@@ -1,13 +1,14 @@
 """
 Test the loc mapper store
 """
+import time
 import unittest
 import uuid
 from xmodule.modulestore import Location
 from xmodule.modulestore.locator import BlockUsageLocator, CourseLocator
 from xmodule.modulestore.exceptions import ItemNotFoundError, InvalidLocationError
 from xmodule.modulestore.loc_mapper_store import LocMapperStore
-from mock import Mock
+from mock import Mock, patch
 from xmodule.modulestore.locations import SlashSeparatedCourseKey
 import bson.son
 
@@ -251,6 +252,119 @@ class TestLocationMapper(LocMapperSetupSansDjango):
             new_prob_locn, delta_new_org, delta_new_offering, new_usage_id, 'published', True
         )
 
+    def test_translate_locations_bulk(self):
+        """
+        Test translating many locations in one call
+        """
+        org = 'foo_org'
+        course = 'bar_course'
+        run = 'baz_run'
+        course_key = SlashSeparatedCourseKey(org, course, run)
+        loc_mapper().create_map_entry(
+            course_key,
+            block_map={
+                'abc123': {'problem': 'problem2'},
+                'def456': {'vertical': 'vertical1'},
+            }
+        )
+        mapped_problem = course_key.make_usage_key('problem', 'abc123')
+        mapped_vertical = course_key.make_usage_key('vertical', 'def456')
+        unmapped = course_key.make_usage_key('problem', 'xyz789')
+        unmapped_course = SlashSeparatedCourseKey(org, course, 'no_run').make_usage_key('problem', 'abc123')
+
+        result = loc_mapper().translate_locations_bulk(
+            [mapped_problem, mapped_vertical, unmapped, unmapped_course], published=False
+        )
+        self.assertEqual(set(result), set([mapped_problem, mapped_vertical]))
+        self.assertEqual(result[mapped_problem].block_id, 'problem2')
+        self.assertEqual(result[mapped_problem].branch, 'draft')
+        self.assertEqual(result[mapped_vertical].block_id, 'vertical1')
+        # doesn't add entries
+        self.assertEqual(loc_mapper().translate_locations_bulk([unmapped]), {})
+        # results are cached for the single location translation
+        self.assertEqual(
+            loc_mapper().translate_location(mapped_problem, add_entry_if_missing=False).block_id,
+            'problem2'
+        )
+
+    def test_translate_locators_bulk(self):
+        """
+        Test translating many locators in one call
+        """
+        course_key = SlashSeparatedCourseKey('foo_org', 'bar_course', 'baz_run')
+        loc_mapper().create_map_entry(
+            course_key,
+            block_map={
+                'abc123': {'problem': 'problem2'},
+                'def456': {'vertical': 'vertical1'},
+            }
+        )
+        course_locator = CourseLocator(org='foo_org', offering='bar_course.baz_run', branch='published')
+        problem = BlockUsageLocator(course_locator, block_type='problem', block_id='problem2')
+        vertical = BlockUsageLocator(course_locator, block_type='vertical', block_id='vertical1')
+        unmapped = BlockUsageLocator(course_locator, block_type='problem', block_id='nope')
+
+        result = loc_mapper().translate_locators_bulk([problem, vertical, unmapped])
+        self.assertEqual(result, {
+            problem: course_key.make_usage_key('problem', 'abc123'),
+            vertical: course_key.make_usage_key('vertical', 'def456'),
+        })
+        # now served from the cache
+        self.instrumented_cache.reset_mock()
+        self.assertEqual(loc_mapper().translate_locators_bulk([problem, vertical]), result)
+        self.assertFalse(self.instrumented_cache.set_many.called)
+
+    def test_translate_locators_bulk_mixed_case(self):
+        """
+        Test that bulk translation finds courses whose offering isn't all lower case
+        """
+        course_key = SlashSeparatedCourseKey('MITx', '6.002x', '2012_Fall')
+        loc_mapper().create_map_entry(course_key, block_map={'abc123': {'problem': 'problem2'}})
+        course_locator = CourseLocator(org='MITx', offering='6.002x.2012_Fall', branch='published')
+        problem = BlockUsageLocator(course_locator, block_type='problem', block_id='problem2')
+
+        self.assertEqual(
+            loc_mapper().translate_locators_bulk([problem]),
+            {problem: course_key.make_usage_key('problem', 'abc123')}
+        )
+
+    def test_in_memory_entries(self):
+        """
+        Test that a course's map entry is read once per process but refetched for unknown blocks
+        """
+        course_key = SlashSeparatedCourseKey('foo_org', 'bar_course', 'baz_run')
+        loc_mapper().create_map_entry(course_key, block_map={'abc123': {'problem': 'problem2'}})
+        location = course_key.make_usage_key('problem', 'abc123')
+        self.assertEqual(loc_mapper().translate_location(location, add_entry_if_missing=False).block_id, 'problem2')
+
+        # another process maps a new block
+        loc_mapper().location_map.update(
+            {'_id': loc_mapper()._construct_course_son(course_key)},  # pylint: disable=protected-access
+            {'$set': {'block_map.def456': {'vertical': 'vertical1'}}}
+        )
+        new_location = course_key.make_usage_key('vertical', 'def456')
+        self.assertEqual(
+            loc_mapper().translate_location(new_location, add_entry_if_missing=False).block_id, 'vertical1'
+        )
+
+    def test_in_memory_entries_time_out(self):
+        """
+        Test that a course's in memory map entry is reread once it times out, e.g., to see another
+        process deleting it
+        """
+        course_key = SlashSeparatedCourseKey('foo_org', 'bar_course', 'baz_run')
+        loc_mapper().create_map_entry(course_key, block_map={'abc123': {'problem': 'problem2'}})
+        location = course_key.make_usage_key('problem', 'abc123')
+        loc_mapper().translate_locations_bulk([location])
+        # another process deletes the mapping
+        course_son = loc_mapper()._construct_course_son(course_key)  # pylint: disable=protected-access
+        loc_mapper().location_map.remove(course_son)
+        self.instrumented_cache.get_many.return_value = {}
+
+        self.assertIn(location, loc_mapper().translate_locations_bulk([location]))
+        with patch('xmodule.modulestore.loc_mapper_store.time.time', return_value=time.time() + 61):
+            self.assertNotIn(location, loc_mapper().translate_locations_bulk([location]))
+
     def test_translate_locator(self):
         """
         tests translate_locator_to_location(BlockUsageLocator)
@@ -401,6 +515,12 @@ class TrivialCache(object):
         """
         return self.cache.get(key, default)
 
+    def get_many(self, keys):
+        """
+        Mock the .get_many
+        """
+        return dict((key, self.cache[key]) for key in keys if key in self.cache)
+
     def set_many(self, entries):
         """
         mock set_many
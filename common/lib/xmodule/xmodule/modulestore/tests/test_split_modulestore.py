@@ -1,6 +1,7 @@
 """
     Test split modulestore w/o using any django stuff.
 """
+import copy
 import datetime
 import unittest
 import uuid
@@ -18,6 +19,8 @@ from xmodule.modulestore.inheritance import InheritanceMixin
 from xmodule.x_module import XModuleMixin
 from xmodule.fields import Date, Timedelta
 from xmodule.modulestore.split_mongo.split import SplitMongoModuleStore
+from xmodule.modulestore.split_mongo.mongo_connection import MongoConnection
+from bson.objectid import ObjectId
 from xmodule.modulestore.tests.test_modulestore import check_has_course_method
 
 
@@ -1653,6 +1656,82 @@ class TestSchema(SplitModuleTest):
                 "{0.name} has records with wrong schema_version".format(collection)
             )
 
+
+class TestStructureDeltas(unittest.TestCase):
+    """
+    Test persisting structures as diffs against their previous versions
+    """
+    def setUp(self):
+        super(TestStructureDeltas, self).setUp()
+        config = dict(SplitModuleTest.DOC_STORE_CONFIG)
+        config['collection'] = 'modulestore{0}'.format(uuid.uuid4().hex[:5])
+        self.db_connection = MongoConnection(structure_snapshot_interval=3, **config)
+        self.addCleanup(self.db_connection.database.drop_collection, self.db_connection.structures)
+
+    def _structure(self, previous, blocks):
+        """
+        Make a structure record w/ the given blocks
+        """
+        return {
+            '_id': ObjectId(),
+            'root': 'course',
+            'previous_version': previous['_id'] if previous else None,
+            'blocks': blocks,
+        }
+
+    def test_round_trip(self):
+        first = self._structure(None, {'course': {'fields': {'children': ['a']}}, 'a': {'fields': {}}})
+        self.db_connection.insert_structure(first)
+        second = self._structure(first, {'course': {'fields': {'children': ['b']}}, 'b': {'fields': {}}})
+        self.db_connection.insert_structure(second)
+
+        raw = self.db_connection.structures.find_one({'_id': second['_id']})
+        self.assertEqual(raw['delta_base'], first['_id'])
+        self.assertEqual(raw['deleted_blocks'], ['a'])
+        self.assertEqual(set(raw['blocks']), set(['course', 'b']))
+        self.assertEqual(self.db_connection.get_structure(second['_id']), second)
+        self.assertEqual(self.db_connection.get_structure(first['_id']), first)
+
+    def test_snapshot_interval(self):
+        previous = None
+        for index in range(4):
+            structure = self._structure(previous, {'course': {'fields': {'index': index}}})
+            self.db_connection.insert_structure(structure)
+            previous = structure
+        depths = [
+            raw.get('delta_depth', 0)
+            for raw in self.db_connection.structures.find().sort('_id')
+        ]
+        self.assertEqual(depths, [0, 1, 2, 0])
+        self.assertEqual(
+            [entry['blocks']['course']['fields']['index'] for entry in self.db_connection.find_matching_structures({})],
+            [0, 1, 2, 3]
+        )
+
+    def test_update_base(self):
+        block_a = {'fields': {'data': 'original'}}
+        first = self._structure(None, {'course': {'fields': {}}, 'a': copy.deepcopy(block_a)})
+        self.db_connection.insert_structure(first)
+        second = self._structure(first, {'course': {'fields': {'changed': True}}, 'a': copy.deepcopy(block_a)})
+        self.db_connection.insert_structure(second)
+        third = self._structure(second, {'course': {'fields': {'changed': False}}, 'a': copy.deepcopy(block_a)})
+        self.db_connection.insert_structure(third)
+        # the dependents' blocks aren't all in their diffs
+        self.assertNotIn('a', self.db_connection.structures.find_one({'_id': second['_id']})['blocks'])
+        # cache the reconstructed dependent
+        self.assertEqual(self.db_connection.get_structure(second['_id']), second)
+
+        # rewriting a base must not corrupt the versions diffed against it, including in blocks they
+        # didn't change
+        first['blocks']['course']['fields']['orphan'] = True
+        first['blocks']['a']['fields']['data'] = 'changed'
+        self.db_connection.update_structure(first)
+        self.assertEqual(self.db_connection.get_structure(first['_id']), first)
+        self.assertEqual(self.db_connection.get_structure(second['_id']), second)
+        self.assertEqual(self.db_connection.get_structure(third['_id']), third)
+        self.assertNotIn('delta_base', self.db_connection.structures.find_one({'_id': second['_id']}))
+
+
 #===========================================
 def modulestore():
     """
@@ -3,11 +3,13 @@ Tests around our XML modulestore, including importing
 well-formed and not-well-formed XML.
 """
 import os.path
+import threading
 import unittest
 from glob import glob
 from mock import patch
 
 from xmodule.modulestore.xml import XMLModuleStore
+from xmodule.xml_module import get_edx_xml_parser
 from xmodule.modulestore import Location, XML_MODULESTORE_TYPE
 
 from .test_modulestore import check_path_to_location
@@ -40,6 +42,31 @@ class TestXMLModuleStore(unittest.TestCase):
 
         check_path_to_location(modulestore)
 
+    def test_concurrent_load(self):
+        """
+        Loading courses on several threads loads the same courses and modules as loading them serially
+        """
+        serial = XMLModuleStore(DATA_DIR, course_dirs=['toy', 'simple'])
+        concurrent = XMLModuleStore(DATA_DIR, course_dirs=['toy', 'simple'], course_load_workers=2)
+        self.assertEqual(sorted(serial.courses), sorted(concurrent.courses))
+        for course in serial.get_courses():
+            self.assertEqual(
+                set(serial.modules[course.id]),
+                set(concurrent.modules[course.id])
+            )
+        check_path_to_location(concurrent)
+
+    def test_parser_per_thread(self):
+        """
+        Each thread parses module files with its own parser, as lxml parsers aren't thread safe
+        """
+        parsers = []
+        thread = threading.Thread(target=lambda: parsers.append(get_edx_xml_parser()))
+        thread.start()
+        thread.join()
+        self.assertIs(get_edx_xml_parser(), get_edx_xml_parser())
+        self.assertIsNot(get_edx_xml_parser(), parsers[0])
+
     def test_xml_modulestore_type(self):
         store = XMLModuleStore(DATA_DIR, course_dirs=['toy', 'simple'])
         self.assertEqual(store.get_modulestore_type('foo/bar/baz'), XML_MODULESTORE_TYPE)
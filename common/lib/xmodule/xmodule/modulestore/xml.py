@@ -6,9 +6,11 @@ import os
 import re
 import sys
 import glob
+import threading
 
 from collections import defaultdict
 from cStringIO import StringIO
+from Queue import Queue, Empty
 from fs.osfs import OSFS
 from importlib import import_module
 from lxml import etree
@@ -33,8 +35,17 @@ from .inheritance import compute_inherited_metadata, inheriting_field_data
 
 from xblock.fields import ScopeIds, Reference, ReferenceList, ReferenceValueDict
 
-edx_xml_parser = etree.XMLParser(dtd_validation=False, load_dtd=False,
-                                 remove_comments=True, remove_blank_text=True)
+
+
+def _make_xml_parser():
+    """
+    Make an lxml parser configured the way edx xml must be parsed. lxml parsers are not thread safe;
+    so, each thread loading courses needs its own.
+    """
+    return etree.XMLParser(dtd_validation=False, load_dtd=False,
+                           remove_comments=True, remove_blank_text=True)
+
+edx_xml_parser = _make_xml_parser()
 
 etree.set_default_parser(edx_xml_parser)
 
@@ -368,7 +379,7 @@ class XMLModuleStore(ModuleStoreReadBase):
     """
     def __init__(
         self, data_dir, default_class=None, course_dirs=None, course_ids=None,
-        load_error_modules=True, i18n_service=None, **kwargs
+        load_error_modules=True, i18n_service=None, course_load_workers=1, **kwargs
     ):
         """
         Initialize an XMLModuleStore from data_dir
@@ -381,6 +392,9 @@ class XMLModuleStore(ModuleStoreReadBase):
 
             course_dirs or course_ids (list of str): If specified, the list of course_dirs or course_ids to load. Otherwise,
                 load all courses. Note, providing both
+
+            course_load_workers (int): the number of threads to load course dirs on. Parsing and file reads
+                release the GIL; so, loading many courses on a few threads overlaps them.
         """
         super(XMLModuleStore, self).__init__(**kwargs)
 
@@ -408,6 +422,7 @@ class XMLModuleStore(ModuleStoreReadBase):
         self.field_data = inheriting_field_data(kvs=DictKeyValueStore())
 
         self.i18n_service = i18n_service
+        self._load_state = threading.local()
 
         # If we are specifically asked for missing courses, that should
         # be an error.  If we are asked for "all" courses, find the ones
@@ -417,8 +432,43 @@ class XMLModuleStore(ModuleStoreReadBase):
         if course_dirs is None:
             course_dirs = sorted([d for d in os.listdir(self.data_dir) if
                                   os.path.exists(self.data_dir / d / "course.xml")])
+        if course_load_workers > 1 and len(course_dirs) > 1:
+            self._load_courses_concurrently(course_dirs, course_ids, course_load_workers)
+        else:
+            for course_dir in course_dirs:
+                self.try_load_course(course_dir, course_ids)
+
+    def _load_courses_concurrently(self, course_dirs, course_ids, num_workers):
+        """
+        Load the course_dirs on num_workers threads. Each course loads into its own entries of the
+        store's dicts; so, the threads don't contend on anything but the GIL.
+        """
+        pending = Queue()
         for course_dir in course_dirs:
-            self.try_load_course(course_dir, course_ids)
+            pending.put(course_dir)
+
+        def worker():
+            """
+            Load courses until there are no more pending
+            """
+            # etree.fromstring uses the thread's default parser
+            self._load_state.parser = _make_xml_parser()
+            etree.set_default_parser(self._load_state.parser)
+            while True:
+                try:
+                    course_dir = pending.get_nowait()
+                except Empty:
+                    return
+                self.try_load_course(course_dir, course_ids)
+
+        threads = [
+            threading.Thread(target=worker, name='xml-course-loader-{}'.format(index))
+            for index in range(min(num_workers, len(course_dirs)))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
 
     def try_load_course(self, course_dir, course_ids=None):
         '''
@@ -493,7 +543,8 @@ class XMLModuleStore(ModuleStoreReadBase):
             # been imported into the cms from xml
             course_file = StringIO(clean_out_mako_templating(course_file.read()))
 
-            course_data = etree.parse(course_file, parser=edx_xml_parser).getroot()
+            parser = getattr(self._load_state, 'parser', edx_xml_parser)
+            course_data = etree.parse(course_file, parser=parser).getroot()
 
             org = course_data.get('org')
 
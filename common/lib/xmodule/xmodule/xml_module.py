@@ -3,6 +3,7 @@ import copy
 import logging
 import os
 import sys
+import threading
 from lxml import etree
 
 from xblock.fields import Dict, Scope, ScopeIds
@@ -13,10 +14,21 @@ from xblock.runtime import KvsFieldData
 
 log = logging.getLogger(__name__)
 
-# assume all XML files are persisted as utf-8.
-edx_xml_parser = etree.XMLParser(dtd_validation=False, load_dtd=False,
-                                 remove_comments=True, remove_blank_text=True,
-                                 encoding='utf-8')
+_parsers = threading.local()
+
+
+def get_edx_xml_parser():
+    """
+    The calling thread's parser for edx xml files. lxml parsers are not thread safe, and
+    XMLModuleStore can load courses on several threads; so, each thread gets its own.
+    """
+    parser = getattr(_parsers, 'parser', None)
+    if parser is None:
+        # assume all XML files are persisted as utf-8.
+        parser = _parsers.parser = etree.XMLParser(dtd_validation=False, load_dtd=False,
+                                                   remove_comments=True, remove_blank_text=True,
+                                                   encoding='utf-8')
+    return parser
 
 
 def name_to_pathname(name):
@@ -172,7 +184,7 @@ class XmlDescriptor(XModuleDescriptor):
 
         Returns an lxml Element
         """
-        return etree.parse(file_object, parser=edx_xml_parser).getroot()
+        return etree.parse(file_object, parser=get_edx_xml_parser()).getroot()
 
     @classmethod
     def load_file(cls, filepath, fs, def_id):  # pylint: disable=invalid-name
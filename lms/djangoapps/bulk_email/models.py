@@ -245,6 +245,19 @@ class CourseAuthorization(models.Model):
         except cls.DoesNotExist:
             return False
 
+    @classmethod
+    def courses_with_instructor_email_enabled(cls, course_ids):
+        """
+        Returns the set of the given course ids for which email is enabled,
+        as decided by instructor_email_enabled, using a single query.
+        """
+        if not settings.FEATURES['REQUIRE_COURSE_EMAIL_AUTH']:
+            return set(course_ids)
+        course_ids = list(course_ids)
+        if not course_ids:
+            return set()
+        return set(record.course_id for record in cls.objects.filter(course_id__in=course_ids, email_enabled=True))
+
     def __unicode__(self):
         not_en = "Not "
         if self.email_enabled:
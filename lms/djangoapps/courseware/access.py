@@ -14,6 +14,7 @@ from xmodule.x_module import XModule
 
 from xblock.core import XBlock
 
+from course_overviews.models import CourseOverview
 from student.models import CourseEnrollmentAllowed
 from external_auth.models import ExternalAuthMap
 from courseware.masquerade import is_masquerading_as_student
@@ -48,7 +49,7 @@ def has_access(user, action, obj, course_key=None):
     user: a Django user object. May be anonymous. If none is passed,
                     anonymous is assumed
 
-    obj: The object to check access for.  A module, descriptor, location, or
+    obj: The object to check access for.  A module, descriptor, CourseOverview, location, or
                     certain special strings (e.g. 'global')
 
     action: A string specifying the action that the client is trying to perform.
@@ -69,7 +70,7 @@ def has_access(user, action, obj, course_key=None):
 
     # delegate the work to type-specific functions.
     # (start with more specific types, then get more general)
-    if isinstance(obj, CourseDescriptor):
+    if isinstance(obj, (CourseDescriptor, CourseOverview)):
         return _has_access_course_desc(user, action, obj)
 
     if isinstance(obj, ErrorDescriptor):
@@ -100,7 +101,7 @@ def has_access(user, action, obj, course_key=None):
 # ================ Implementation helpers ================================
 def _has_access_course_desc(user, action, course):
     """
-    Check if user has access to a course descriptor.
+    Check if user has access to a course descriptor (or the CourseOverview of one).
 
     Valid actions:
 
@@ -117,8 +118,8 @@ def _has_access_course_desc(user, action, course):
 
         NOTE: this is not checking whether user is actually enrolled in the course.
         """
-        # delegate to generic descriptor check to check start dates
-        return _has_access_descriptor(user, 'load', course, course.id)
+        # same start date check as for other descriptors
+        return _can_load_by_start_date(user, course, course.id)
 
     def can_load_forum():
         """
@@ -248,29 +249,10 @@ def _has_access_descriptor(user, action, descriptor, course_key=None):
         students to see modules.  If not, views should check the course, so we
         don't have to hit the enrollments table on every module load.
         """
-        # If start dates are off, can always load
-        if settings.FEATURES['DISABLE_START_DATES'] and not is_masquerading_as_student(user):
-            debug("Allow: DISABLE_START_DATES")
+        if 'detached' in descriptor._class_tags:
+            debug("Allow: detached")
             return True
-
-        # Check start date
-        if 'detached' not in descriptor._class_tags and descriptor.start is not None:
-            now = datetime.now(UTC())
-            effective_start = _adjust_start_date_for_beta_testers(
-                user,
-                descriptor,
-                course_key=course_key
-            )
-            if now > effective_start:
-                # after start date, everyone can see it
-                debug("Allow: now > effective start date")
-                return True
-            # otherwise, need staff access
-            return _has_staff_access_to_descriptor(user, descriptor, course_key)
-
-        # No start date, so can always load.
-        debug("Allow: no start date")
-        return True
+        return _can_load_by_start_date(user, descriptor, course_key)
 
     checkers = {
         'load': can_load,
@@ -370,6 +352,35 @@ def _dispatch(table, action, user, obj):
         type(obj), action))
 
 
+def _can_load_by_start_date(user, descriptor, course_key):
+    """
+    Helper: can user load descriptor (or CourseOverview) given its start date?
+    """
+    # If start dates are off, can always load
+    if settings.FEATURES['DISABLE_START_DATES'] and not is_masquerading_as_student(user):
+        debug("Allow: DISABLE_START_DATES")
+        return True
+
+    # Check start date
+    if descriptor.start is not None:
+        now = datetime.now(UTC())
+        effective_start = _adjust_start_date_for_beta_testers(
+            user,
+            descriptor,
+            course_key=course_key
+        )
+        if now > effective_start:
+            # after start date, everyone can see it
+            debug("Allow: now > effective start date")
+            return True
+        # otherwise, need staff access
+        return _has_staff_access_to_descriptor(user, descriptor, course_key)
+
+    # No start date, so can always load.
+    debug("Allow: no start date")
+    return True
+
+
 def _adjust_start_date_for_beta_testers(user, descriptor, course_key=None):  # pylint: disable=invalid-name
     """
     If user is in a beta test group, adjust the start date by the appropriate number of
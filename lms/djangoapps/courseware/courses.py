@@ -16,6 +16,7 @@ from xmodule.modulestore.exceptions import ItemNotFoundError
 from static_replace import replace_static_urls
 from xmodule.modulestore import MONGO_MODULESTORE_TYPE
 
+from course_overviews.models import CourseOverview
 from courseware.access import has_access
 from courseware.model_data import FieldDataCache
 from courseware.module_render import get_module
@@ -105,6 +106,8 @@ def get_opt_course_with_access(user, action, course_key):
 def course_image_url(course):
     """Try to look up the image url for the course.  If it's not found,
     log an error and return the dead link"""
+    if isinstance(course, CourseOverview):
+        return course.course_image_url
     if course.static_asset_path or modulestore().get_modulestore_type(course.id) == XML_MODULESTORE_TYPE:
         # If we are a static course with the course_image attribute
         # set different than the default, return that path so that
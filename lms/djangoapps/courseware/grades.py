@@ -13,8 +13,8 @@ from django.test.client import RequestFactory
 from dogapi import dog_stats_api
 
 from courseware import courses
-from courseware.model_data import FieldDataCache
-from student.models import anonymous_id_for_user
+from courseware.model_data import FieldDataCache, chunks
+from student.models import ANONYMOUS_ID_BATCH_SIZE, anonymous_id_for_user, anonymous_ids_for_users
 from submissions import api as sub_api
 from xmodule import graders
 from xmodule.graders import Score
@@ -521,25 +521,28 @@ def iterate_grades_for(course_id, students):
     # grading that student.
     request = RequestFactory().get('/')
 
-    for student in students:
-        with dog_stats_api.timer('lms.grades.iterate_grades_for', tags=['action:{}'.format(course_id)]):
-            try:
-                request.user = student
-                # Grading calls problem rendering, which calls masquerading,
-                # which checks session vars -- thus the empty session dict below.
-                # It's not pretty, but untangling that is currently beyond the
-                # scope of this feature.
-                request.session = {}
-                gradeset = grade(student, request, course)
-                yield student, gradeset, ""
-            except Exception as exc:  # pylint: disable=broad-except
-                # Keep marching on even if this student couldn't be graded for
-                # some reason, but log it for future reference.
-                log.exception(
-                    'Cannot grade student %s (%s) in course %s because of exception: %s',
-                    student.username,
-                    student.id,
-                    course_id,
-                    exc.message
-                )
-                yield student, {}, exc.message
+    for students_chunk in chunks(students, ANONYMOUS_ID_BATCH_SIZE):
+        # Look up the anonymous ids that grading needs for the students' submissions at once
+        anonymous_ids_for_users(students_chunk, course.id)
+        for student in students_chunk:
+            with dog_stats_api.timer('lms.grades.iterate_grades_for', tags=['action:{}'.format(course_id)]):
+                try:
+                    request.user = student
+                    # Grading calls problem rendering, which calls masquerading,
+                    # which checks session vars -- thus the empty session dict below.
+                    # It's not pretty, but untangling that is currently beyond the
+                    # scope of this feature.
+                    request.session = {}
+                    gradeset = grade(student, request, course)
+                    yield student, gradeset, ""
+                except Exception as exc:  # pylint: disable=broad-except
+                    # Keep marching on even if this student couldn't be graded for
+                    # some reason, but log it for future reference.
+                    log.exception(
+                        'Cannot grade student %s (%s) in course %s because of exception: %s',
+                        student.username,
+                        student.id,
+                        course_id,
+                        exc.message
+                    )
+                    yield student, {}, exc.message
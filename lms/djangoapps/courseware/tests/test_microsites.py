@@ -8,6 +8,7 @@ from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
 
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
 
+from course_overviews.models import CourseOverview
 from helpers import LoginEnrollmentTestCase
 from courseware.tests.modulestore_config import TEST_DATA_MIXED_MODULESTORE
 
@@ -44,6 +45,10 @@ class TestMicrosites(ModuleStoreTestCase, LoginEnrollmentTestCase):
 
         self.course_outside_microsite = CourseFactory.create(display_name='Robot_Course_Outside_Microsite', org='FooX')
 
+        # the catalog lists the courses' overviews, which Studio would have created
+        CourseOverview.update_from_course(self.course)
+        CourseOverview.update_from_course(self.course_outside_microsite)
+
     def create_student_accounts(self):
         """
         Build out the test accounts we'll use in these tests
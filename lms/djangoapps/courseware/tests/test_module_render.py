@@ -39,6 +39,8 @@ from courseware.tests.test_submitting_problems import TestSubmittingProblems
 
 from student.models import anonymous_id_for_user
 from lms.lib.xblock.runtime import quote_slashes
+from request_cache.middleware import RequestCache
+import static_replace
 
 
 @override_settings(MODULESTORE=TEST_DATA_MIXED_MODULESTORE)
@@ -501,6 +503,50 @@ class TestHtmlModifiers(ModuleStoreTestCase):
         # NOTE: check handouts output...right now test course seems to have no such content
         # at least this makes sure get_course_info_section returns without exception
 
+    def _render_vertical_rewrites(self):
+        """
+        Renders a vertical holding an html block with urls to rewrite and returns its content and the
+        texts static_replace.replace_urls was called with
+        """
+        vertical = ItemFactory.create(category='vertical', parent_location=self.course.location)
+        ItemFactory.create(
+            category='html', parent_location=vertical.location,
+            data=self.content_string + self.rewrite_link + self.course_link
+        )
+        field_data_cache = FieldDataCache.cache_for_descriptor_descendents(self.course.id, self.user, vertical)
+        module = render.get_module(self.user, self.request, vertical.location, field_data_cache, self.course.id)
+
+        with patch('static_replace.replace_urls', wraps=static_replace.replace_urls) as mock_replace_urls:
+            result_fragment = module.render('student_view')
+
+        self.assertIn('/c4x/{org}/{course}/asset/foo_content'.format(
+            org=self.course.location.org,
+            course=self.course.location.course,
+        ), result_fragment.content)
+        self.assertIn('/courses/{}/bar/content'.format(self.course.id.to_deprecated_string()), result_fragment.content)
+        return [call_args[0][0] for call_args in mock_replace_urls.call_args_list]
+
+    def test_container_skips_rewritten_children(self):
+        """
+        Make sure a container doesn't rewrite the urls in its children's already rewritten content
+        """
+        request_cache = RequestCache()
+        request_cache.process_request(self.request)
+        try:
+            rewritten_texts = self._render_vertical_rewrites()
+        finally:
+            request_cache.process_response(self.request, None)
+        self.assertEqual(1, sum(self.content_string in text for text in rewritten_texts))
+
+    def test_rewritten_children_not_remembered_outside_request(self):
+        """
+        Make sure rewritten content isn't put in the request cache when there's no request to clear it
+        """
+        RequestCache().clear_request_cache()
+        rewritten_texts = self._render_vertical_rewrites()
+        self.assertEqual(2, sum(self.content_string in text for text in rewritten_texts))
+        self.assertNotIn('xmodule_modifiers.rewritten_fragments', RequestCache.get_request_cache().data)
+
     def test_course_link_rewrite(self):
         module = render.get_module(
             self.user,
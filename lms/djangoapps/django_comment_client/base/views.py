@@ -42,8 +42,18 @@ def permitted(fn):
                 content = None
             return content
         course_key = SlashSeparatedCourseKey.from_deprecated_string(kwargs['course_id'])
-        if check_permissions_by_view(request.user, course_key, fetch_content(), request.view_name):
-            return fn(request, *args, **kwargs)
+        content = fetch_content()
+        if check_permissions_by_view(request.user, course_key, content, request.view_name):
+            response = fn(request, *args, **kwargs)
+            # every permitted view writes to the comments service: stop using the
+            # cached thread lists and user info it may have changed
+            commentable_id = kwargs.get('commentable_id') or (content or {}).get('commentable_id')
+            cc.utils.invalidate_cached_requests(
+                course_id=course_key.to_deprecated_string(),
+                commentable_ids=[commentable_id] if commentable_id else [],
+                user_ids=[request.user.id],
+            )
+            return response
         else:
             return JsonError("unauthorized", status=401)
     return wrapper
@@ -58,6 +58,7 @@ def get_threads(request, course_id, discussion_id=None, per_page=THREADS_PER_PAG
         cc_user = cc.User.from_django_user(request.user)
         cc_user.default_sort_key = request.GET.get('sort_key')
         cc_user.save()
+        cc.utils.invalidate_cached_requests(user_ids=[request.user.id])
 
     #there are 2 dimensions to consider when executing a search with respect to group id
     #is user a moderator
@@ -117,9 +118,11 @@ def inline_discussion(request, course_id, discussion_id):
 
     course = get_course_with_access(request.user, 'load_forum', course_id)
 
-    threads, query_params = get_threads(request, course_id, discussion_id, per_page=INLINE_THREADS_PER_PAGE)
     cc_user = cc.User.from_django_user(request.user)
-    user_info = cc_user.to_dict()
+    (threads, query_params), user_info = cc.utils.perform_concurrently(
+        lambda: get_threads(request, course_id, discussion_id, per_page=INLINE_THREADS_PER_PAGE),
+        cc_user.to_dict,
+    )
 
     with newrelic.agent.FunctionTrace(nr_transaction, "get_metadata_for_threads"):
         annotated_content_info = utils.get_metadata_for_threads(course_id, threads, request.user, user_info)
@@ -176,16 +179,17 @@ def forum_form_discussion(request, course_id):
     with newrelic.agent.FunctionTrace(nr_transaction, "get_discussion_category_map"):
         category_map = utils.get_discussion_category_map(course)
 
+    user = cc.User.from_django_user(request.user)
     try:
-        unsafethreads, query_params = get_threads(request, course_id)   # This might process a search query
+        (unsafethreads, query_params), user_info = cc.utils.perform_concurrently(
+            lambda: get_threads(request, course_id),   # This might process a search query
+            user.to_dict,
+        )
         threads = [utils.safe_content(thread) for thread in unsafethreads]
     except cc.utils.CommentClientMaintenanceError:
         log.warning("Forum is in maintenance mode")
         return render_to_response('discussion/maintenance.html', {})
 
-    user = cc.User.from_django_user(request.user)
-    user_info = user.to_dict()
-
     with newrelic.agent.FunctionTrace(nr_transaction, "get_metadata_for_threads"):
         annotated_content_info = utils.get_metadata_for_threads(course_id, threads, request.user, user_info)
 
@@ -237,17 +241,19 @@ def single_thread(request, course_id, discussion_id, thread_id):
 
     course = get_course_with_access(request.user, 'load_forum', course_id)
     cc_user = cc.User.from_django_user(request.user)
-    user_info = cc_user.to_dict()
 
     # Currently, the front end always loads responses via AJAX, even for this
     # page; it would be a nice optimization to avoid that extra round trip to
     # the comments service.
     try:
-        thread = cc.Thread.find(thread_id).retrieve(
-            recursive=request.is_ajax(),
-            user_id=request.user.id,
-            response_skip=request.GET.get("resp_skip"),
-            response_limit=request.GET.get("resp_limit")
+        thread, user_info = cc.utils.perform_concurrently(
+            lambda: cc.Thread.find(thread_id).retrieve(
+                recursive=request.is_ajax(),
+                user_id=request.user.id,
+                response_skip=request.GET.get("resp_skip"),
+                response_limit=request.GET.get("resp_limit")
+            ),
+            cc_user.to_dict,
         )
     except cc.utils.CommentClientRequestError as e:
         if e.status_code == 404:
@@ -335,10 +341,12 @@ def user_profile(request, course_id, user_id):
             'per_page': THREADS_PER_PAGE,   # more than threads_per_page to show more activities
         }
 
-        threads, page, num_pages = profiled_user.active_threads(query_params)
+        (threads, page, num_pages), user_info = cc.utils.perform_concurrently(
+            lambda: profiled_user.active_threads(query_params),
+            cc.User.from_django_user(request.user).to_dict,
+        )
         query_params['page'] = page
         query_params['num_pages'] = num_pages
-        user_info = cc.User.from_django_user(request.user).to_dict()
 
         with newrelic.agent.FunctionTrace(nr_transaction, "get_metadata_for_threads"):
             annotated_content_info = utils.get_metadata_for_threads(course_id, threads, request.user, user_info)
@@ -385,10 +393,12 @@ def followed_threads(request, course_id, user_id):
             'sort_order': request.GET.get('sort_order', 'desc'),
         }
 
-        threads, page, num_pages = profiled_user.subscribed_threads(query_params)
+        (threads, page, num_pages), user_info = cc.utils.perform_concurrently(
+            lambda: profiled_user.subscribed_threads(query_params),
+            cc.User.from_django_user(request.user).to_dict,
+        )
         query_params['page'] = page
         query_params['num_pages'] = num_pages
-        user_info = cc.User.from_django_user(request.user).to_dict()
 
         with newrelic.agent.FunctionTrace(nr_transaction, "get_metadata_for_threads"):
             annotated_content_info = utils.get_metadata_for_threads(course_id, threads, request.user, user_info)
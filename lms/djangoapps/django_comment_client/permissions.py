@@ -5,25 +5,69 @@ Module for checking permissions with the comment_client backend
 import logging
 from types import NoneType
 from django.core import cache
+from django_comment_common.models import FORUM_ROLE_STUDENT
+from request_cache.middleware import RequestCache
+from xmodule.modulestore.django import modulestore
+from xmodule.modulestore.exceptions import ItemNotFoundError
 from xmodule.modulestore.keys import CourseKey
 
 CACHE = cache.get_cache('default')
 CACHE_LIFESPAN = 60
+REQUEST_CACHE_KEY = 'django_comment_client.permissions'
 
 
 def cached_has_permission(user, permission, course_id=None):
     """
-    Call has_permission if it's not cached. A change in a user's role or
-    a role's permissions will only become effective after CACHE_LIFESPAN seconds.
+    Check the permission against the user's cached permissions. A change in a user's role
+    or a role's permissions will only become effective after CACHE_LIFESPAN seconds.
     """
     assert isinstance(course_id, (NoneType, CourseKey))
-    key = u"permission_{user_id:d}_{course_id}_{permission}".format(
-        user_id=user.id, course_id=course_id, permission=permission)
-    val = CACHE.get(key, None)
-    if val not in [True, False]:
-        val = has_permission(user, permission, course_id=course_id)
-        CACHE.set(key, val, CACHE_LIFESPAN)
-    return val
+    return permission in get_permissions(user, course_id)
+
+
+def get_permissions(user, course_id=None):
+    """
+    Returns the frozenset of the names of the permissions the user has in the course.
+
+    The set is loaded once per request (and cached for CACHE_LIFESPAN seconds)
+    so that checking any number of permissions is a set lookup.
+    """
+    assert isinstance(course_id, (NoneType, CourseKey))
+    key = u"permissions_{user_id:d}_{course_id}".format(user_id=user.id, course_id=course_id)
+    request_permissions = None
+    if RequestCache.get_current_request() is not None:
+        request_permissions = RequestCache.get_request_cache().data.setdefault(REQUEST_CACHE_KEY, {})
+        if key in request_permissions:
+            return request_permissions[key]
+
+    permissions = CACHE.get(key)
+    if permissions is None:
+        permissions = _load_permissions(user, course_id)
+        CACHE.set(key, permissions, CACHE_LIFESPAN)
+    if request_permissions is not None:
+        request_permissions[key] = permissions
+    return permissions
+
+
+def _load_permissions(user, course_id):
+    """
+    The permissions of all of the user's roles in the course, with one query, applying
+    the same restriction on students' permissions as Role.has_permission
+    """
+    permissions = set()
+    course = None
+    for role_name, permission in user.roles.filter(course_id=course_id).values_list('name', 'permissions__name'):
+        if permission is None:
+            continue
+        if role_name == FORUM_ROLE_STUDENT and permission.startswith(('edit', 'update', 'create')):
+            if course is None:
+                course = modulestore().get_course(course_id)
+                if course is None:
+                    raise ItemNotFoundError(course_id)
+            if not course.forum_posts_allowed:
+                continue
+        permissions.add(permission)
+    return frozenset(permissions)
 
 
 def has_permission(user, permission, course_id=None):
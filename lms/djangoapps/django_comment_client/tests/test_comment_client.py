@@ -0,0 +1,96 @@
+import threading
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.test.utils import override_settings
+from django.utils import translation
+from mock import Mock, patch
+
+import lms.lib.comment_client as cc
+
+
+class PerformConcurrentlyTestCase(TestCase):
+    def test_results_in_order(self):
+        calling_thread = threading.current_thread()
+        results = cc.utils.perform_concurrently(
+            lambda: threading.current_thread() is calling_thread,
+            lambda: 2,
+            lambda: 3,
+        )
+        self.assertEqual([True, 2, 3], results)
+
+    def test_language(self):
+        translation.activate('eo')
+        try:
+            results = cc.utils.perform_concurrently(translation.get_language, translation.get_language)
+        finally:
+            translation.deactivate()
+        self.assertEqual(['eo', 'eo'], results)
+
+    def test_raises_first_error(self):
+        def not_found():
+            raise cc.CommentClientRequestError('not found', 404)
+
+        finished = []
+        with self.assertRaises(cc.CommentClientRequestError):
+            cc.utils.perform_concurrently(lambda: None, not_found, lambda: finished.append(True))
+        self.assertEqual([True], finished)
+
+    def test_nested(self):
+        results = cc.utils.perform_concurrently(
+            lambda: 1,
+            lambda: cc.utils.perform_concurrently(lambda: 2, lambda: 3),
+        )
+        self.assertEqual([1, [2, 3]], results)
+
+    def test_session(self):
+        self.assertIs(cc.utils.get_session(), cc.utils.get_session())
+
+
+@override_settings(COMMENTS_SERVICE_CACHE_TIMEOUT=30)
+@patch('lms.lib.comment_client.utils.requests.Session.request')
+class CachedRequestsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def search(self, mock_request, **query_params):
+        mock_request.return_value = Mock(status_code=200, json=Mock(return_value={'collection': []}))
+        query_params.setdefault('course_id', 'edX/toy/2012_Fall')
+        query_params.setdefault('user_id', 1)
+        cc.Thread.search(query_params)
+
+    def test_search_cached(self, mock_request):
+        self.search(mock_request, commentable_id='alpha')
+        self.search(mock_request, commentable_id='alpha')
+        self.assertEqual(1, mock_request.call_count)
+
+        # another user's list and another commentable's list are cached separately
+        self.search(mock_request, commentable_id='alpha', user_id=2)
+        self.search(mock_request, commentable_id='beta')
+        self.assertEqual(3, mock_request.call_count)
+
+    def test_invalidate_commentable(self, mock_request):
+        self.search(mock_request, commentable_id='alpha')
+        self.search(mock_request, commentable_id='beta')
+        self.search(mock_request)
+        cc.utils.invalidate_cached_requests(course_id='edX/toy/2012_Fall', commentable_ids=['alpha'])
+        self.search(mock_request, commentable_id='beta')
+        self.assertEqual(3, mock_request.call_count)
+        self.search(mock_request, commentable_id='alpha')
+        self.search(mock_request)
+        self.assertEqual(5, mock_request.call_count)
+
+    def test_invalidate_user(self, mock_request):
+        mock_request.return_value = Mock(status_code=200, json=Mock(return_value={'id': '1'}))
+        cc.User(id='1').to_dict()
+        cc.User(id='1').to_dict()
+        self.assertEqual(1, mock_request.call_count)
+        cc.utils.invalidate_cached_requests(user_ids=['1'])
+        cc.User(id='1').to_dict()
+        self.assertEqual(2, mock_request.call_count)
+
+    @override_settings(COMMENTS_SERVICE_CACHE_TIMEOUT=0)
+    def test_disabled(self, mock_request):
+        self.search(mock_request)
+        self.search(mock_request)
+        self.assertEqual(2, mock_request.call_count)
@@ -0,0 +1,58 @@
+from django.core.cache import cache
+from django.test.utils import override_settings
+from mock import Mock
+
+from courseware.tests.tests import TEST_DATA_MONGO_MODULESTORE
+from django_comment_client.permissions import cached_has_permission, get_permissions, has_permission
+from django_comment_client.tests.factories import RoleFactory
+from request_cache.middleware import RequestCache
+from student.tests.factories import UserFactory
+from xmodule.modulestore.tests.factories import CourseFactory
+from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
+
+
+@override_settings(MODULESTORE=TEST_DATA_MONGO_MODULESTORE)
+class GetPermissionsTestCase(ModuleStoreTestCase):
+    def setUp(self):
+        cache.clear()
+        self.course = CourseFactory.create()
+        self.student = UserFactory()
+        self.student_role = RoleFactory(name='Student', course_id=self.course.id)
+        self.student_role.users.add(self.student)
+        for permission in ('vote', 'create_comment'):
+            self.student_role.add_permission(permission)
+        self.moderator = UserFactory()
+        self.moderator_role = RoleFactory(name='Moderator', course_id=self.course.id)
+        self.moderator_role.users.add(self.moderator)
+        self.moderator_role.add_permission('openclose_thread')
+
+    def test_permissions(self):
+        self.assertEqual(frozenset(['vote', 'create_comment']), get_permissions(self.student, self.course.id))
+        self.assertEqual(frozenset(['openclose_thread']), get_permissions(self.moderator, self.course.id))
+        for permission in ('vote', 'create_comment', 'openclose_thread'):
+            self.assertEqual(
+                has_permission(self.student, permission, self.course.id),
+                cached_has_permission(self.student, permission, self.course.id)
+            )
+
+    def test_forum_posts_not_allowed(self):
+        course = CourseFactory.create(number='blackout', discussion_blackouts=[["1999-01-01T00:00", "2999-01-01T00:00"]])
+        role = RoleFactory(name='Student', course_id=course.id)
+        role.users.add(self.student)
+        for permission in ('vote', 'create_comment'):
+            role.add_permission(permission)
+        self.assertEqual(frozenset(['vote']), get_permissions(self.student, course.id))
+        self.assertFalse(has_permission(self.student, 'create_comment', course.id))
+
+    def test_loaded_once_per_request(self):
+        middleware = RequestCache()
+        middleware.process_request(Mock())
+        try:
+            with self.assertNumQueries(1):
+                get_permissions(self.student, self.course.id)
+            cache.clear()
+            with self.assertNumQueries(0):
+                self.assertTrue(cached_has_permission(self.student, 'vote', self.course.id))
+                self.assertFalse(cached_has_permission(self.student, 'openclose_thread', self.course.id))
+        finally:
+            middleware.process_response(Mock(), Mock())
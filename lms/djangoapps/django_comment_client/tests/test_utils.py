@@ -4,12 +4,14 @@ import json
 import mock
 from datetime import datetime
 from pytz import UTC
+from django.core.cache import cache
 from django.core.urlresolvers import reverse
 from django.test import TestCase
 from django.test.utils import override_settings
 from student.tests.factories import UserFactory, CourseEnrollmentFactory
 from django_comment_client.tests.factories import RoleFactory
 from django_comment_client.tests.unicode import UnicodeTestMixin
+from django_comment_common.utils import clear_discussion_modules
 import django_comment_client.utils as utils
 from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
@@ -81,6 +83,7 @@ class AccessUtilsTestCase(TestCase):
 @override_settings(MODULESTORE=TEST_DATA_MONGO_MODULESTORE)
 class CoursewareContextTestCase(ModuleStoreTestCase):
     def setUp(self):
+        cache.clear()
         self.course = CourseFactory.create(org="TestX", number="101", display_name="Test Course")
         self.discussion1 = ItemFactory.create(
             parent_location=self.course.location,
@@ -137,6 +140,7 @@ class CoursewareContextTestCase(ModuleStoreTestCase):
 @override_settings(MODULESTORE=TEST_DATA_MONGO_MODULESTORE)
 class CategoryMapTestCase(ModuleStoreTestCase):
     def setUp(self):
+        cache.clear()
         self.course = CourseFactory.create(
             org="TestX", number="101", display_name="Test Course",
             # This test needs to use a course that has already started --
@@ -505,6 +509,20 @@ class CategoryMapTestCase(ModuleStoreTestCase):
             }
         )
 
+    def test_discussion_modules_cached(self):
+        self.create_discussion("Chapter", "Discussion 1")
+        utils.get_discussion_category_map(self.course)
+        self.create_discussion("Chapter", "Discussion 2")
+
+        with mock.patch('django_comment_client.utils.modulestore') as mock_modulestore:
+            category_map = utils.get_discussion_category_map(self.course)
+            self.assertFalse(mock_modulestore.called)
+        self.assertEqual(["Discussion 1"], category_map["subcategories"]["Chapter"]["children"])
+
+        clear_discussion_modules(self.course.id)
+        category_map = utils.get_discussion_category_map(self.course)
+        self.assertEqual(["Discussion 1", "Discussion 2"], category_map["subcategories"]["Chapter"]["children"])
+
 
 class JsonResponseTestCase(TestCase, UnicodeTestMixin):
     def _test_unicode_data(self, text):
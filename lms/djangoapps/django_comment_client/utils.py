@@ -4,12 +4,15 @@ import logging
 from datetime import datetime
 
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.urlresolvers import reverse
 from django.db import connection
 from django.http import HttpResponse
 from django.utils import simplejson
 from django_comment_common.models import Role, FORUM_ROLE_STUDENT
+from django_comment_common.utils import discussion_modules_cache_key, DISCUSSION_MODULES_CACHE_TIMEOUT
 from django_comment_client.permissions import check_permissions_by_view
+from request_cache.middleware import RequestCache
 
 from edxmako import lookup_template
 import pystache_custom as pystache
@@ -56,24 +59,46 @@ def has_forum_access(uname, course_id, rolename):
 
 
 def _get_discussion_modules(course):
-    all_modules = modulestore().get_items(course.id, category='discussion')
-
-    def has_required_keys(module):
-        for key in ('discussion_id', 'discussion_category', 'discussion_target'):
-            if getattr(module, key) is None:
-                log.warning("Required key '%s' not in discussion %s, leaving out of category map" % (key, module.location))
-                return False
-        return True
+    """
+    Returns a summary of the course's inline discussion modules: a list of
+    (discussion_id, discussion_target, discussion_category, sort_key, start, location) tuples.
 
-    return filter(has_required_keys, all_modules)
+    Loading every discussion module in the course is expensive, so the summary is cached
+    (until Studio changes the course, see django_comment_common.utils.clear_discussion_modules)
+    and remembered for the rest of the request.
+    """
+    request_modules = {}
+    if RequestCache.get_current_request() is not None:
+        request_modules = RequestCache.get_request_cache().data.setdefault('django_comment_client.discussion_modules', {})
+        if course.id in request_modules:
+            return request_modules[course.id]
+
+    cache_key = discussion_modules_cache_key(course.id)
+    modules = cache.get(cache_key)
+    if modules is None:
+        def has_required_keys(module):
+            for key in ('discussion_id', 'discussion_category', 'discussion_target'):
+                if getattr(module, key) is None:
+                    log.warning("Required key '%s' not in discussion %s, leaving out of category map" % (key, module.location))
+                    return False
+            return True
+
+        modules = [
+            (module.discussion_id, module.discussion_target, module.discussion_category,
+             module.sort_key, module.start, module.location)
+            for module in modulestore().get_items(course.id, category='discussion')
+            if has_required_keys(module)
+        ]
+        cache.set(cache_key, modules, DISCUSSION_MODULES_CACHE_TIMEOUT)
+    request_modules[course.id] = modules
+    return modules
 
 
 def _get_discussion_id_map(course):
     def get_entry(module):
-        discussion_id = module.discussion_id
-        title = module.discussion_target
-        last_category = module.discussion_category.split("/")[-1].strip()
-        return (discussion_id, {"location": module.location, "title": last_category + " / " + title})
+        discussion_id, title, category, __, __, location = module
+        last_category = category.split("/")[-1].strip()
+        return (discussion_id, {"location": location, "title": last_category + " / " + title})
 
     return dict(map(get_entry, _get_discussion_modules(course)))
 
@@ -135,13 +160,10 @@ def get_discussion_category_map(course):
 
     modules = _get_discussion_modules(course)
 
-    for module in modules:
-        id = module.discussion_id
-        title = module.discussion_target
-        sort_key = module.sort_key
-        category = " / ".join([x.strip() for x in module.discussion_category.split("/")])
+    for id, title, category, sort_key, start, __ in modules:
+        category = " / ".join([x.strip() for x in category.split("/")])
         #Handle case where module.start is None
-        entry_start_date = module.start if module.start else datetime.max.replace(tzinfo=pytz.UTC)
+        entry_start_date = start if start else datetime.max.replace(tzinfo=pytz.UTC)
         unexpanded_category_map[category].append({"title": title, "id": id, "sort_key": sort_key, "start_date": entry_start_date})
 
     category_map = {"entries": defaultdict(dict), "subcategories": defaultdict(dict)}
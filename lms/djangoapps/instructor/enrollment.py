@@ -24,6 +24,9 @@ from microsite_configuration import microsite
 # For determining if a shibboleth course
 SHIBBOLETH_DOMAIN_PREFIX = 'shib:'
 
+# the number of emails enrolled together by enroll_emails
+ENROLLMENT_BATCH_SIZE = 300
+
 
 class EmailEnrollmentState(object):
     """ Store the complete enrollment state of an email in a class """
@@ -109,6 +112,68 @@ def enroll_email(course_id, student_email, auto_enroll=False, email_students=Fal
     return previous_state, after_state
 
 
+def enroll_emails(course_id, student_emails, auto_enroll=False, email_students=False, email_params=None):
+    """
+    Enroll a batch of students by email.
+
+    Has the effect of calling `enroll_email` for each of the emails, in a few
+    queries: the users with the emails are enrolled with
+    `CourseEnrollment.bulk_enroll`, and the other emails are allowed to enroll
+    with one bulk insert. Emails are matched to users and existing
+    CourseEnrollmentAllowed records ignoring case, as MySQL compares them.
+
+    `student_emails` is a list of valid emails, distinct ignoring case, no
+        more than ENROLLMENT_BATCH_SIZE of them.
+    `auto_enroll`, `email_students` and `email_params` are as for `enroll_email`,
+        except that the emails aren't sent: the caller sends them (with
+        `send_mail_to_student`) once the enrollments are committed.
+
+    returns a dict mapping each of `student_emails` to what was done:
+        'enrolled', 'already_enrolled' or 'allowed', and a list of the
+        (email, email params) to send, empty unless `email_students`.
+    """
+    # look the lowercased emails up too, for databases which compare case
+    lookup_emails = set(student_emails) | set(email.lower() for email in student_emails)
+    users_by_email = {}
+    for user in User.objects.filter(email__in=lookup_emails).select_related('profile'):
+        users_by_email.setdefault(user.email.lower(), user)
+    student_users = [
+        (email, users_by_email[email.lower()]) for email in student_emails if email.lower() in users_by_email
+    ]
+    enrolled_ids = set(
+        enrollment.user_id
+        for enrollment in CourseEnrollment.bulk_enroll([user for __, user in student_users], course_id)
+    )
+    results = {
+        email: 'enrolled' if user.id in enrolled_ids else 'already_enrolled'
+        for email, user in student_users
+    }
+
+    allowed_emails = [email for email in student_emails if email not in results]
+    if allowed_emails:
+        lookup_emails = set(allowed_emails) | set(email.lower() for email in allowed_emails)
+        ceas = CourseEnrollmentAllowed.objects.filter(course_id=course_id, email__in=lookup_emails)
+        ceas.update(auto_enroll=auto_enroll)
+        existing_emails = set(email.lower() for email in ceas.values_list('email', flat=True))
+        CourseEnrollmentAllowed.objects.bulk_create([
+            CourseEnrollmentAllowed(course_id=course_id, email=email, auto_enroll=auto_enroll)
+            for email in allowed_emails if email.lower() not in existing_emails
+        ])
+        results.update((email, 'allowed') for email in allowed_emails)
+
+    mails = []
+    if email_students:
+        for email, user in student_users:
+            params = dict(email_params, message='enrolled_enroll', email_address=email, full_name=user.profile.name)
+            mails.append((email, params))
+        for email in allowed_emails:
+            params = dict(email_params, message='allowed_enroll', email_address=email)
+            params.pop('full_name', None)
+            mails.append((email, params))
+
+    return results, mails
+
+
 def unenroll_email(course_id, student_email, email_students=False, email_params=None):
     """
     Unenroll a student by email.
@@ -7,6 +7,7 @@ import unittest
 import json
 import requests
 import datetime
+from collections import defaultdict
 from urllib import quote
 from django.test import TestCase
 from nose.tools import raises
@@ -40,6 +41,7 @@ from instructor.access import allow_access
 import instructor.views.api
 from instructor.views.api import _split_input_list, common_exceptions_400
 from instructor_task.api_helper import AlreadyRunningError
+from instructor_task.models import BulkEnrollment
 from xmodule.modulestore.locations import SlashSeparatedCourseKey
 
 from .test_tools import msk_from_problem_urlname, get_extended_due
@@ -1323,7 +1325,7 @@ class TestInstructorAPILevelsDataDump(ModuleStoreTestCase, LoginEnrollmentTestCa
             self.assertEqual(student_json['username'], student.username)
             self.assertEqual(student_json['email'], student.email)
 
-    @patch.object(instructor.views.api, 'anonymous_id_for_user', Mock(return_value='42'))
+    @patch.object(instructor.views.api, 'anonymous_ids_for_users', Mock(return_value=defaultdict(lambda: '42')))
     @patch.object(instructor.views.api, 'unique_id_for_user', Mock(return_value='41'))
     def test_get_anon_ids(self):
         """
@@ -1383,6 +1385,16 @@ class TestInstructorAPILevelsDataDump(ModuleStoreTestCase, LoginEnrollmentTestCa
         already_running_status = "A grade report generation task is already in progress. Check the 'Pending Instructor Tasks' table for the status of the task. When completed, the report will be available for download in the table below."
         self.assertIn(already_running_status, response.content)
 
+    def test_students_bulk_enroll(self):
+        url = reverse('students_bulk_enroll', kwargs={'course_id': self.course.id.to_deprecated_string()})
+
+        with patch('instructor_task.api.submit_bulk_enroll_students') as mock_submit:
+            response = self.client.post(url, {'emails': 'one@example.com,\ntwo@example.com', 'auto_enroll': 'true'})
+        self.assertEqual(response.status_code, 200)
+        bulk_enrollment = BulkEnrollment.objects.get(id=mock_submit.call_args[0][2])
+        self.assertEqual(bulk_enrollment.emails, u'one@example.com\ntwo@example.com')
+        self.assertEqual(mock_submit.call_args[0][3:], (True, False))
+
     def test_get_students_features_csv(self):
         """
         Test that some minimum of information is formatted
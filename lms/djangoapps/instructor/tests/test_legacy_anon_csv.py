@@ -8,6 +8,8 @@ Notes for running by hand:
 ./manage.py lms --settings test test lms/djangoapps/instructor
 """
 
+from collections import defaultdict
+
 from django.test.utils import override_settings
 
 # Need access to internal func to put users in the right group
@@ -52,7 +54,7 @@ class TestInstructorDashboardAnonCSV(ModuleStoreTestCase, LoginEnrollmentTestCas
         self.login(self.instructor, self.password)
         self.enroll(self.toy)
 
-    @patch.object(instructor.views.legacy, 'anonymous_id_for_user', Mock(return_value='42'))
+    @patch.object(instructor.views.legacy, 'anonymous_ids_for_users', Mock(return_value=defaultdict(lambda: '42')))
     @patch.object(instructor.views.legacy, 'unique_id_for_user', Mock(return_value='41'))
     def test_download_anon_csv(self):
         course = self.toy
@@ -33,11 +33,11 @@ from django_comment_common.models import (
 )
 
 from courseware.models import StudentModule
-from student.models import CourseEnrollment, unique_id_for_user, anonymous_id_for_user
+from student.models import CourseEnrollment, unique_id_for_user, anonymous_ids_for_users
 import instructor_task.api
 from instructor_task.api_helper import AlreadyRunningError
 from instructor_task.views import get_task_completion_info
-from instructor_task.models import ReportStore
+from instructor_task.models import BulkEnrollment, ReportStore
 import instructor.enrollment as enrollment
 from instructor.enrollment import (
     enroll_email,
@@ -318,6 +318,42 @@ def students_update_enrollment(request, course_id):
     return JsonResponse(response_payload)
 
 
+@ensure_csrf_cookie
+@cache_control(no_cache=True, no_store=True, must_revalidate=True)
+@require_level('staff')
+@require_post_params(emails="stringified list of emails")
+def students_bulk_enroll(request, course_id):
+    """
+    Enroll a long list of students by email in a background task.
+    Requires staff access.
+
+    POST Parameters:
+    - emails is a string containing a list of emails separated by anything
+        split_input_list can handle, e.g. the contents of a CSV file.
+    - auto_enroll and email_students are as for students_update_enrollment.
+
+    The task's progress is shown in the 'Pending Instructor Tasks' section, and
+    a CSV file of any invalid emails is available for download once it's done.
+    """
+    course_key = SlashSeparatedCourseKey.from_deprecated_string(course_id)
+    emails = _split_input_list(request.POST.get('emails'))
+    auto_enroll = request.POST.get('auto_enroll') in ['true', 'True', True]
+    email_students = request.POST.get('email_students') in ['true', 'True', True]
+
+    # The BulkEnrollment is saved immediately, so that any transaction that has
+    # been pending up to this point will also be committed.
+    bulk_enrollment = BulkEnrollment.create(course_key, request.user, u'\n'.join(emails))
+    try:
+        instructor_task.api.submit_bulk_enroll_students(
+            request, course_key, bulk_enrollment.id, auto_enroll, email_students
+        )
+        success_status = _("Your students are being enrolled! You can view the status of the enrollment task in the 'Pending Instructor Tasks' section.")
+        return JsonResponse({"status": success_status})
+    except AlreadyRunningError:
+        already_running_status = _("These students are already being enrolled. Check the 'Pending Instructor Tasks' table for the status of the task.")
+        return JsonResponse({"status": already_running_status})
+
+
 @ensure_csrf_cookie
 @cache_control(no_cache=True, no_store=True, must_revalidate=True)
 @require_level('instructor')
@@ -630,7 +666,8 @@ def get_anon_ids(request, course_id):  # pylint: disable=W0613
         courseenrollment__course_id=course_id,
     ).order_by('id')
     header = ['User ID', 'Anonymized user ID', 'Course Specific Anonymized user ID']
-    rows = [[s.id, unique_id_for_user(s), anonymous_id_for_user(s, course_id)] for s in students]
+    anonymous_ids = anonymous_ids_for_users(students, course_id)
+    rows = [[s.id, unique_id_for_user(s), anonymous_ids[s.id]] for s in students]
     return csv_response(course_id.to_deprecated_string().replace('/', '-') + '-anon-ids.csv', header, rows)
 
 
@@ -7,6 +7,8 @@ from django.conf.urls import patterns, url
 urlpatterns = patterns('',  # nopep8
     url(r'^students_update_enrollment$',
         'instructor.views.api.students_update_enrollment', name="students_update_enrollment"),
+    url(r'^students_bulk_enroll$',
+        'instructor.views.api.students_bulk_enroll', name="students_bulk_enroll"),
     url(r'^list_course_role_members$',
         'instructor.views.api.list_course_role_members', name="list_course_role_members"),
     url(r'^modify_access$',
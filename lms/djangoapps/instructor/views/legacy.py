@@ -70,7 +70,8 @@ from student.models import (
     CourseEnrollment,
     CourseEnrollmentAllowed,
     unique_id_for_user,
-    anonymous_id_for_user
+    anonymous_id_for_user,
+    anonymous_ids_for_users
 )
 from student.views import course_from_id
 import track.views
@@ -692,7 +693,8 @@ def instructor_dashboard(request, course_id):
         ).order_by('id')
 
         datatable = {'header': ['User ID', 'Anonymized user ID', 'Course Specific Anonymized user ID']}
-        datatable['data'] = [[s.id, unique_id_for_user(s), anonymous_id_for_user(s, course_id)] for s in students]
+        anonymous_ids = anonymous_ids_for_users(students, course_key)
+        datatable['data'] = [[s.id, unique_id_for_user(s), anonymous_ids[s.id]] for s in students]
         return return_csv(course_key.to_deprecated_string().replace('/', '-') + '-anon-ids.csv', datatable)
 
     #----------------------------------------
@@ -17,7 +17,8 @@ from instructor_task.tasks import (rescore_problem,
                                    reset_problem_attempts,
                                    delete_problem_state,
                                    send_bulk_course_email,
-                                   calculate_grades_csv)
+                                   calculate_grades_csv,
+                                   enroll_students)
 
 from instructor_task.api_helper import (check_arguments_for_rescoring,
                                         encode_problem_and_student_input,
@@ -208,6 +209,26 @@ def submit_bulk_course_email(request, course_key, email_id):
     return submit_task(request, task_type, task_class, course_key, task_input, task_key)
 
 
+def submit_bulk_enroll_students(request, course_key, bulk_enrollment_id, auto_enroll=False, email_students=False):
+    """
+    Request to have the emails of a BulkEnrollment enrolled in a course as a background task.
+
+    Parameters are the `course_key`, the `bulk_enrollment_id`, the id of the BulkEnrollment
+    object, and `auto_enroll` and `email_students`, which are as for instructor.enrollment.enroll_email.
+
+    AlreadyRunningError is raised if the same BulkEnrollment is already being enrolled.
+    """
+    task_type = 'bulk_enroll_students'
+    task_class = enroll_students
+    task_input = {
+        'bulk_enrollment_id': bulk_enrollment_id,
+        'auto_enroll': auto_enroll,
+        'email_students': email_students,
+    }
+    task_key = hashlib.md5(str(bulk_enrollment_id)).hexdigest()
+    return submit_task(request, task_type, task_class, course_key, task_input, task_key)
+
+
 def submit_calculate_grades_csv(request, course_key):
     """
     AlreadyRunningError is raised if the course's grades are already being updated.
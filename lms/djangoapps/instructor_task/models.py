@@ -190,6 +190,42 @@ class InstructorTask(models.Model):
         return json.dumps({'message': 'Task revoked before running'})
 
 
+class BulkEnrollment(models.Model):
+    """
+    Stores the list of emails to be enrolled in a course by a bulk enrollment
+    task, which is too long for the task's `task_input`.
+
+    `emails` stores the emails, separated by newlines.
+    `requester` stores id of user who submitted the emails
+    `created` stores date that entry was first created
+    """
+    course_id = CourseKeyField(max_length=255, db_index=True)
+    emails = models.TextField()
+    requester = models.ForeignKey(User)
+    created = models.DateTimeField(auto_now_add=True, null=True)
+
+    @classmethod
+    def create(cls, course_id, requester, emails):
+        """
+        Create an instance of BulkEnrollment.
+
+        The BulkEnrollment.save_now method makes sure the entry is committed, so
+        that the task can read it.
+        """
+        bulk_enrollment = cls(course_id=course_id, requester=requester, emails=emails)
+        bulk_enrollment.save_now()
+        return bulk_enrollment
+
+    @transaction.autocommit
+    def save_now(self):
+        """
+        Writes BulkEnrollment immediately, ensuring the transaction is committed.
+
+        See InstructorTask.save_now.
+        """
+        self.save()
+
+
 class ReportStore(object):
     """
     Simple abstraction layer that can fetch and store CSV files for reports
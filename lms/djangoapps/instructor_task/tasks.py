@@ -31,6 +31,7 @@ from instructor_task.tasks_helper import (
     reset_attempts_module_state,
     delete_problem_module_state,
     push_grades_to_s3,
+    enroll_students_in_bulk,
 )
 from bulk_email.tasks import perform_delegate_email_batches
 
@@ -139,3 +140,23 @@ def calculate_grades_csv(entry_id, xmodule_instance_args):
     action_name = ugettext_noop('graded')
     task_fn = partial(push_grades_to_s3, xmodule_instance_args)
     return run_main_task(entry_id, task_fn, action_name)
+
+
+@task(base=BaseInstructorTask)  # pylint: disable=E1102
+def enroll_students(entry_id, xmodule_instance_args):
+    """Enrolls a list of students in a course by email.
+
+    `entry_id` is the id value of the InstructorTask entry that corresponds to this task.
+    The entry contains the `course_id` that identifies the course, as well as the
+    `task_input`, which contains task-specific input.
+
+    The task_input should be a dict with the following entries:
+
+      'bulk_enrollment_id': the id of the BulkEnrollment listing the emails.  (required)
+      'auto_enroll': whether emails without users are enrolled when they register.
+      'email_students': whether the students are notified by email.
+    """
+    # Translators: This is a past-tense verb that is inserted into task progress messages as {action}.
+    action_name = ugettext_noop('enrolled')
+    task_fn = partial(enroll_students_in_bulk, xmodule_instance_args)
+    return run_main_task(entry_id, task_fn, action_name)
@@ -12,6 +12,8 @@ from celery import Task, current_task
 from celery.utils.log import get_task_logger
 from celery.states import SUCCESS, FAILURE
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
 from django.db import transaction, reset_queries
 from dogapi import dog_stats_api
 from pytz import UTC
@@ -19,11 +21,13 @@ from pytz import UTC
 from xmodule.modulestore.django import modulestore
 from track.views import task_track
 
+from courseware.courses import get_course_by_id
 from courseware.grades import iterate_grades_for
 from courseware.models import StudentModule
 from courseware.model_data import FieldDataCache
 from courseware.module_render import get_module_for_descriptor_internal
-from instructor_task.models import ReportStore, InstructorTask, PROGRESS
+from instructor.enrollment import ENROLLMENT_BATCH_SIZE, enroll_emails, get_email_params, send_mail_to_student
+from instructor_task.models import BulkEnrollment, ReportStore, InstructorTask, PROGRESS
 from student.models import CourseEnrollment
 
 # define different loggers for use within tasks and on client side
@@ -571,3 +575,105 @@ def push_grades_to_s3(_xmodule_instance_args, _entry_id, course_id, _task_input,
 
     # One last update before we close out...
     return update_task_progress()
+
+
+def enroll_students_in_bulk(_xmodule_instance_args, _entry_id, course_id, task_input, action_name):
+    """
+    Enroll the emails of the BulkEnrollment with id `task_input['bulk_enrollment_id']`
+    in the course `course_id`, as `enroll_email` would one at a time.
+
+    The emails are validated in one pass first. They're then enrolled in batches
+    of ENROLLMENT_BATCH_SIZE by `enroll_emails`, each batch in its own
+    transaction, so that enrolling many thousands of students takes a few
+    queries per batch and the task's progress can be reported after each one.
+    The emails to the students, if any, are sent after each batch commits.
+    The invalid emails, and those which couldn't be sent, are stored in a CSV
+    file using a `ReportStore`.
+
+    Emails which are enrolled or allowed to enroll "succeed", and those of
+    students who were already enrolled, or which are repeated (ignoring case),
+    are "skipped". Those which are invalid, or whose email couldn't be sent,
+    "fail".
+    """
+    start_time = datetime.now(UTC)
+    auto_enroll = task_input.get('auto_enroll', False)
+    email_students = task_input.get('email_students', False)
+
+    emails = BulkEnrollment.objects.get(id=task_input['bulk_enrollment_id']).emails.split()
+    num_total = len(emails)
+    num_attempted = 0
+    num_succeeded = 0
+    num_skipped = 0
+    num_failed = 0
+    curr_step = "Validating Emails"
+
+    def update_task_progress():
+        """Return a dict containing info about current task"""
+        current_time = datetime.now(UTC)
+        progress = {
+            'action_name': action_name,
+            'attempted': num_attempted,
+            'succeeded': num_succeeded,
+            'skipped': num_skipped,
+            'failed': num_failed,
+            'total': num_total,
+            'duration_ms': int((current_time - start_time).total_seconds() * 1000),
+            'step': curr_step,
+        }
+        _get_current_task().update_state(state=PROGRESS, meta=progress)
+
+        return progress
+
+    update_task_progress()
+    valid_emails = []
+    seen_emails = set()
+    err_rows = [["email", "error_msg"]]
+    for email in emails:
+        if email.lower() in seen_emails:
+            num_attempted += 1
+            num_skipped += 1
+            continue
+        seen_emails.add(email.lower())
+        try:
+            validate_email(email)
+        except ValidationError:
+            num_attempted += 1
+            num_failed += 1
+            err_rows.append([email.encode('utf-8'), "Invalid email address"])
+        else:
+            valid_emails.append(email)
+
+    curr_step = "Enrolling Students"
+    email_params = {}
+    if email_students:
+        email_params = get_email_params(get_course_by_id(course_id), auto_enroll)
+    for batch_start in xrange(0, len(valid_emails), ENROLLMENT_BATCH_SIZE):
+        batch = valid_emails[batch_start:batch_start + ENROLLMENT_BATCH_SIZE]
+        with transaction.commit_on_success():
+            results, mails = enroll_emails(course_id, batch, auto_enroll, email_students, email_params)
+        # one email which can't be sent doesn't stop the others
+        for email, params in mails:
+            try:
+                send_mail_to_student(email, params)
+            except Exception:  # pylint: disable=broad-except
+                TASK_LOG.exception(u"Unable to send the enrollment email to %s", email)
+                results[email] = 'failed'
+                err_rows.append([email.encode('utf-8'), "Unable to send email"])
+        num_attempted += len(batch)
+        num_failed += sum(1 for result in results.itervalues() if result == 'failed')
+        num_skipped += sum(1 for result in results.itervalues() if result == 'already_enrolled')
+        num_succeeded += sum(1 for result in results.itervalues() if result in ('enrolled', 'allowed'))
+        update_task_progress()
+
+    if len(err_rows) > 1:
+        curr_step = "Uploading CSV"
+        update_task_progress()
+        timestamp_str = start_time.strftime("%Y-%m-%d-%H%M")
+        course_id_prefix = urllib.quote(course_id.to_deprecated_string().replace("/", "_"))
+        ReportStore.from_config().store_rows(
+            course_id,
+            u"{}_enrollment_errors_{}.csv".format(course_id_prefix, timestamp_str),
+            err_rows
+        )
+
+    return update_task_progress()
@@ -17,12 +17,14 @@ from xmodule.modulestore.locations import i4xEncoder
 
 from courseware.models import StudentModule
 from courseware.tests.factories import StudentModuleFactory
+from student.models import CourseEnrollment, CourseEnrollmentAllowed
 from student.tests.factories import UserFactory, CourseEnrollmentFactory
+from instructor.enrollment import enroll_emails
 
-from instructor_task.models import InstructorTask
-from instructor_task.tests.test_base import InstructorTaskModuleTestCase
+from instructor_task.models import BulkEnrollment, InstructorTask
+from instructor_task.tests.test_base import InstructorTaskCourseTestCase, InstructorTaskModuleTestCase
 from instructor_task.tests.factories import InstructorTaskFactory
-from instructor_task.tasks import rescore_problem, reset_problem_attempts, delete_problem_state
+from instructor_task.tasks import rescore_problem, reset_problem_attempts, delete_problem_state, enroll_students
 from instructor_task.tasks_helper import UpdateProblemModuleStateError
 
 PROBLEM_URL_NAME = "test_urlname"
@@ -438,3 +440,100 @@ class TestDeleteStateInstructorTask(TestInstructorTasks):
                 StudentModule.objects.get(course_id=self.course.id,
                                           student=student,
                                           module_state_key=self.location)
+
+
+class TestEnrollStudentsInstructorTask(InstructorTaskCourseTestCase):
+    """Tests instructor task that enrolls students in bulk."""
+
+    def setUp(self):
+        self.initialize_course()
+        self.instructor = self.create_instructor('instructor')
+
+    def _run_task(self, emails, email_students=False):
+        """Run the task on the emails, mocking how celery provides a current_task."""
+        bulk_enrollment = BulkEnrollment.create(self.course.id, self.instructor, u'\n'.join(emails))
+        task_entry = InstructorTaskFactory.create(
+            course_id=self.course.id,
+            requester=self.instructor,
+            task_input=json.dumps({
+                'bulk_enrollment_id': bulk_enrollment.id, 'auto_enroll': True, 'email_students': email_students,
+            }),
+            task_key='dummy value',
+            task_id=str(uuid4())
+        )
+        current_task = Mock()
+        current_task.request = Mock()
+        current_task.request.id = task_entry.task_id
+        with patch('instructor_task.tasks_helper._get_current_task') as mock_get_task:
+            mock_get_task.return_value = current_task
+            with patch('instructor_task.tasks_helper.ReportStore') as mock_report_store:
+                status = enroll_students.apply([task_entry.id, {}], task_id=task_entry.task_id).get()
+        return status, mock_report_store
+
+    def test_enroll(self):
+        enrolled = self.create_student('enrolled')
+        unenrolled = UserFactory.create(email='unenrolled@test.com')
+        inactive = UserFactory.create(email='inactive@test.com')
+        CourseEnrollmentFactory.create(user=inactive, course_id=self.course.id, is_active=False)
+
+        status, mock_report_store = self._run_task([
+            enrolled.email, unenrolled.email, inactive.email, 'unregistered@test.com', 'invalid', unenrolled.email
+        ])
+        self.assertEquals(status.get('attempted'), 6)
+        self.assertEquals(status.get('succeeded'), 3)
+        self.assertEquals(status.get('skipped'), 2)
+        self.assertEquals(status.get('failed'), 1)
+        self.assertEquals(status.get('total'), 6)
+        self.assertEquals(status.get('action_name'), 'enrolled')
+
+        for user in (enrolled, unenrolled, inactive):
+            self.assertTrue(CourseEnrollment.is_enrolled(user, self.course.id))
+        self.assertEquals(CourseEnrollment.num_enrolled_in(self.course.id), 4)
+        allowed = CourseEnrollmentAllowed.objects.get(course_id=self.course.id, email='unregistered@test.com')
+        self.assertTrue(allowed.auto_enroll)
+        rows = mock_report_store.from_config.return_value.store_rows.call_args[0][2]
+        self.assertEquals(rows[1:], [['invalid', 'Invalid email address']])
+
+    def test_enroll_mixed_case(self):
+        student = UserFactory.create(email='student@test.com')
+        results, mails = enroll_emails(self.course.id, ['Student@Test.com'], email_students=True, email_params={})
+        self.assertEquals(results, {'Student@Test.com': 'enrolled'})
+        self.assertTrue(CourseEnrollment.is_enrolled(student, self.course.id))
+        self.assertFalse(CourseEnrollmentAllowed.objects.filter(course_id=self.course.id).exists())
+        self.assertEquals(mails, [('Student@Test.com', {
+            'message': 'enrolled_enroll', 'email_address': 'Student@Test.com', 'full_name': student.profile.name,
+        })])
+
+        # repeats which differ in case are skipped
+        status, __ = self._run_task(['unregistered@test.com', 'Unregistered@Test.com', 'STUDENT@test.com'])
+        self.assertEquals(status.get('succeeded'), 1)
+        self.assertEquals(status.get('skipped'), 2)
+        self.assertEquals(CourseEnrollmentAllowed.objects.filter(course_id=self.course.id).count(), 1)
+
+    def test_enroll_email_failure(self):
+        student = UserFactory.create(email='student@test.com')
+
+        def send_mail(email, __):
+            """Fail to send one of the emails"""
+            if email == student.email:
+                raise Exception('SMTP is down')
+
+        with patch('instructor_task.tasks_helper.send_mail_to_student', side_effect=send_mail) as mock_send_mail:
+            status, mock_report_store = self._run_task([student.email, 'unregistered@test.com'], email_students=True)
+        self.assertEquals(mock_send_mail.call_count, 2)
+        self.assertEquals(status.get('attempted'), 2)
+        self.assertEquals(status.get('succeeded'), 1)
+        self.assertEquals(status.get('failed'), 1)
+        # the enrollment itself is kept
+        self.assertTrue(CourseEnrollment.is_enrolled(student, self.course.id))
+        rows = mock_report_store.from_config.return_value.store_rows.call_args[0][2]
+        self.assertEquals(rows[1:], [['student@test.com', 'Unable to send email']])
+
+    def test_enroll_batches(self):
+        students = [UserFactory.create() for _ in range(5)]
+        with patch('instructor_task.tasks_helper.ENROLLMENT_BATCH_SIZE', 2):
+            status, mock_report_store = self._run_task([student.email for student in students])
+        self.assertEquals(status.get('succeeded'), 5)
+        self.assertFalse(mock_report_store.from_config.called)
+        for student in students:
+            self.assertTrue(CourseEnrollment.is_enrolled(student, self.course.id))
@@ -268,45 +268,80 @@ class PhotoVerification(StatusModel):
         If window=None, this checks initial verifications
         If window is set, this checks for the reverification associated with that window
         """
-        status = 'none'
-        error_msg = ''
+        return cls._status_from_attempts(list(cls.objects.filter(user=user, window=window)), window)
+
+    @classmethod
+    def user_statuses(cls, user, windows=()):
+        """
+        Returns the user's initial verification status and their reverification
+        status for each of the given windows, using a single query.
+
+        The result maps None (for the initial verification) and each window's id
+        to a (status, error_msg, display) tuple, where status and error_msg are as
+        returned by user_status and display is as returned by display_status.
+        """
+        window_ids = [window.id for window in windows]
+        attempts_by_window = {window_id: [] for window_id in [None] + window_ids}
+        query = models.Q(window__isnull=True)
+        if window_ids:
+            query |= models.Q(window__in=window_ids)
+        for attempt in cls.objects.filter(query, user=user):
+            attempts_by_window[attempt.window_id].append(attempt)
+
+        statuses = {}
+        for window_id, attempts in attempts_by_window.iteritems():
+            status, error_msg = cls._status_from_attempts(attempts, window_id)
+            latest = max(attempts, key=lambda attempt: attempt.updated_at) if attempts else None
+            display = latest.display if latest is not None else True
+            statuses[window_id] = (status, error_msg, display)
+        return statuses
+
+    @classmethod
+    def _status_from_attempts(cls, attempts, window):
+        """
+        Implements the logic of user_status over the given list of the user's
+        attempts for the window (or for their initial verification, if window is None)
+        """
+        earliest_allowed_date = cls._earliest_allowed_date()
+        recent_attempts = [attempt for attempt in attempts if attempt.created_at >= earliest_allowed_date]
+        valid_statuses = ['submitted', 'approved']
+        if not window:
+            valid_statuses.append('must_retry')
 
-        if cls.user_is_verified(user, window=window):
-            status = 'approved'
+        if any(attempt.status == 'approved' for attempt in recent_attempts):
+            return ('approved', '')
 
-        elif cls.user_has_valid_or_pending(user, window=window):
-            # user_has_valid_or_pending does include 'approved', but if we are
+        if any(attempt.status in valid_statuses for attempt in recent_attempts):
+            # valid_statuses does include 'approved', but if we are
             # here, we know that the attempt is still pending
-            status = 'pending'
+            return ('pending', '')
+
+        # we need to check the most recent attempt to see if we need to ask them to do
+        # a retry
+        if not attempts:
+            # If no verification exists for a *midcourse* reverification, then that just
+            # means the student still needs to reverify.  For *original* verifications,
+            # we return 'none'
+            if window:
+                return ('must_reverify', '')
+            else:
+                return ('none', '')
+        attempt = max(attempts, key=lambda attempt: attempt.updated_at)
 
-        else:
-            # we need to check the most recent attempt to see if we need to ask them to do
-            # a retry
-            try:
-                attempts = cls.objects.filter(user=user, window=window).order_by('-updated_at')
-                attempt = attempts[0]
-            except IndexError:
-
-                # If no verification exists for a *midcourse* reverification, then that just
-                # means the student still needs to reverify.  For *original* verifications,
-                # we return 'none'
-                if(window):
-                    return('must_reverify', error_msg)
-                else:
-                    return ('none', error_msg)
-
-            if attempt.created_at < cls._earliest_allowed_date():
-                return ('expired', error_msg)
-
-            # If someone is denied their original verification attempt, they can try to reverify.
-            # However, if a midcourse reverification is denied, that denial is permanent.
-            if attempt.status == 'denied':
-                if window is None:
-                    status = 'must_reverify'
-                else:
-                    status = 'denied'
-            if attempt.error_msg:
-                error_msg = attempt.parsed_error_msg()
+        if attempt.created_at < earliest_allowed_date:
+            return ('expired', '')
+
+        status = 'none'
+        error_msg = ''
+        # If someone is denied their original verification attempt, they can try to reverify.
+        # However, if a midcourse reverification is denied, that denial is permanent.
+        if attempt.status == 'denied':
+            if window is None:
+                status = 'must_reverify'
+            else:
+                status = 'denied'
+        if attempt.error_msg:
+            error_msg = attempt.parsed_error_msg()
 
         return (status, error_msg)
 
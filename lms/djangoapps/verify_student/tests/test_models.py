@@ -377,6 +377,24 @@ class TestPhotoVerification(TestCase):
         reverify_status = SoftwareSecurePhotoVerification.user_status(user=user, window=window)
         self.assertEquals(reverify_status, ('denied', ''))
 
+    def test_user_statuses(self):
+        user = UserFactory.create()
+        window = MidcourseReverificationWindowFactory()
+        other_window = MidcourseReverificationWindowFactory(
+            course_id=SlashSeparatedCourseKey('MITx', '888', 'Other_Course')
+        )
+        SoftwareSecurePhotoVerification(user=user, status='denied', error_msg='Not Provided').save()
+        SoftwareSecurePhotoVerification(user=user, window=window, status='denied', display=False).save()
+
+        with self.assertNumQueries(1):
+            statuses = SoftwareSecurePhotoVerification.user_statuses(user, [window, other_window])
+        self.assertEquals(statuses[None][:2], SoftwareSecurePhotoVerification.user_status(user))
+        for each_window in (window, other_window):
+            status, error_msg = SoftwareSecurePhotoVerification.user_status(user, each_window)
+            display = SoftwareSecurePhotoVerification.display_status(user, each_window)
+            self.assertEquals(statuses[each_window.id], (status, error_msg, display))
+        self.assertEquals(statuses[window.id], ('denied', '', False))
+
     def test_display(self):
         user = UserFactory.create()
         window = MidcourseReverificationWindowFactory()
@@ -47,6 +47,9 @@ DISCUSSION_SETTINGS = {
     'MAX_COMMENT_DEPTH': 2,
 }
 
+# Seconds to cache comments service thread lists and user info for (0 to not cache them)
+COMMENTS_SERVICE_CACHE_TIMEOUT = 30
+
 
 # Features
 FEATURES = {
@@ -255,6 +258,9 @@ FEATURES = {
     # Show a "Download your certificate" on the Progress page if the lowest
     # nonzero grade cutoff is met
     'SHOW_PROGRESS_SUCCESS_BUTTON': False,
+
+    # Profile a sample of requests' calls to each middleware (see monitoring.middleware_profiler)
+    'ENABLE_MIDDLEWARE_PROFILER': False,
 }
 
 # Used for A/B testing
@@ -463,10 +469,17 @@ MODULESTORE = {
         'OPTIONS': {
             'data_dir': DATA_DIR,
             'default_class': 'xmodule.hidden_module.HiddenDescriptor',
+            # the number of threads to load course dirs on at startup
+            'course_load_workers': 1,
         }
     }
 }
 CONTENTSTORE = None
+# Where the contentserver spills assets too large for memcached, e.g.
+# {'DIRECTORY': '/var/tmp/edx-contentserver', 'MAX_SIZE': 1024 ** 3}; None disables it
+CONTENTSERVER_DISK_CACHE = None
+# How long browsers may use unlocked course assets w/o revalidating them
+CONTENTSERVER_MAX_AGE = 60 * 60
 DOC_STORE_CONFIG = {
     'host': 'localhost',
     'db': 'xmodule',
@@ -752,6 +765,12 @@ TEMPLATE_LOADERS = (
 
 )
 
+# Used when FEATURES['ENABLE_MIDDLEWARE_PROFILER'] is set
+MIDDLEWARE_PROFILER = {
+    'SAMPLE_RATE': 0.01,
+    'REPORT_INTERVAL': 300,
+}
+
 MIDDLEWARE_CLASSES = (
     'request_cache.middleware.RequestCache',
     'microsite_configuration.middleware.MicrositeMiddleware',
@@ -1256,6 +1275,9 @@ INSTALLED_APPS = (
 
     # Monitoring functionality
     'monitoring',
+
+    # Denormalized course summaries for course listings
+    'course_overviews',
 )
 
 ######################### MARKETING SITE ###############################
@@ -6,3 +6,12 @@ else:
     SERVICE_HOST = 'http://localhost:4567'
 
 PREFIX = SERVICE_HOST + '/api/v1'
+
+# The most pooled keep-alive connections to the comments service per process,
+# and how many times to retry a request whose connection fails (e.g. an idle
+# pooled connection the service has closed)
+POOL_SIZE = getattr(settings, "COMMENTS_SERVICE_POOL_SIZE", 10)
+MAX_RETRIES = getattr(settings, "COMMENTS_SERVICE_MAX_RETRIES", 1)
+
+# The number of threads per process for requests made concurrently
+CONCURRENCY = getattr(settings, "COMMENTS_SERVICE_CONCURRENCY", 4)
@@ -2,7 +2,8 @@ import logging
 
 from eventtracking import tracker
 from .utils import merge_dict, strip_blank, strip_none, extract, perform_request
-from .utils import CommentClientRequestError
+from .utils import CommentClientRequestError, invalidate_cached_requests
+from .utils import course_version, commentable_version, user_version
 import models
 import settings
 
@@ -44,6 +45,19 @@ class Thread(models.Model):
                           'recursive': False}
         params = merge_dict(default_params, strip_blank(strip_none(query_params)))
 
+        # the list changes with any change to the threads of the commentables it's
+        # limited to (or of the course) and, for its read states, with the user's reads
+        if params.get('commentable_id') and not query_params.get('text'):
+            cache_versions = [commentable_version(params['commentable_id'])]
+        elif params.get('commentable_ids') and not query_params.get('text'):
+            cache_versions = [
+                commentable_version(commentable_id) for commentable_id in params['commentable_ids'].split(',')
+            ]
+        else:
+            cache_versions = [course_version(params['course_id'])]
+        if params.get('user_id'):
+            cache_versions.append(user_version(params['user_id']))
+
         if query_params.get('text'):
             url = cls.url(action='search')
         else:
@@ -56,7 +70,8 @@ class Thread(models.Model):
             params,
             metric_tags=[u'course_id:{}'.format(query_params['course_id'])],
             metric_action='thread.search',
-            paged_results=True
+            paged_results=True,
+            cache_versions=cache_versions
         )
         if query_params.get('text'):
             search_query = query_params['text']
@@ -126,6 +141,9 @@ class Thread(models.Model):
             metric_tags=self._metric_tags
         )
         self._update_from_response(response)
+        if request_params.get('mark_as_read') and request_params.get('user_id'):
+            # the thread's read state in the user's cached thread lists is out of date
+            invalidate_cached_requests(user_ids=[request_params['user_id']])
 
     def flagAbuse(self, user, voteable):
         if voteable.type == 'thread':
@@ -1,4 +1,4 @@
-from .utils import merge_dict, perform_request, CommentClientRequestError
+from .utils import merge_dict, perform_request, CommentClientRequestError, user_version
 
 import models
 import settings
@@ -126,6 +126,7 @@ class User(models.Model):
                 retrieve_params,
                 metric_action='model.retrieve',
                 metric_tags=self._metric_tags,
+                cache_versions=[user_version(self.id)],
             )
         except CommentClientRequestError as e:
             if e.status_code == 404:
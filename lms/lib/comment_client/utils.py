@@ -1,14 +1,34 @@
 from contextlib import contextmanager
 from dogapi import dog_stats_api
+import hashlib
+import json
 import logging
+import os
+import Queue
+import sys
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from django.conf import settings
+from django.core.cache import cache
 from time import time
 from uuid import uuid4
+from django.utils import translation
 from django.utils.translation import get_language
 
+import settings as cc_settings
+
 log = logging.getLogger(__name__)
 
+# The prefixes of the cache keys of the responses of cached requests and of
+# the versions those responses are cached under
+RESPONSE_CACHE_PREFIX = 'comment_client.response.'
+VERSION_CACHE_PREFIX = 'comment_client.version.'
+VERSION_CACHE_TIMEOUT = 24 * 60 * 60
+
+_session_lock = threading.Lock()
+_session = [None, None]  # [pid, session]
+
 
 def strip_none(dic):
     return dict([(k, v) for k, v in dic.iteritems() if v is not None])
@@ -50,9 +70,93 @@ def request_timer(request_id, method, url, tags=None):
     )
 
 
+def get_session():
+    """
+    Returns this process's requests.Session, whose pooled keep-alive
+    connections are shared by every request to the comments service
+    """
+    pid, session = _session
+    if pid != os.getpid():
+        with _session_lock:
+            pid, session = _session
+            if pid != os.getpid():
+                # don't share a parent process's connections
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=cc_settings.POOL_SIZE,
+                    pool_maxsize=cc_settings.POOL_SIZE,
+                    max_retries=cc_settings.MAX_RETRIES,
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _session[:] = [os.getpid(), session]
+    return session
+
+
+def course_version(course_id):
+    """The name of the version of cached responses about a whole course"""
+    return u'course:{}'.format(course_id)
+
+
+def commentable_version(commentable_id):
+    """The name of the version of cached responses about one commentable"""
+    return u'commentable:{}'.format(commentable_id)
+
+
+def user_version(user_id):
+    """The name of the version of cached responses about (or for) one user"""
+    return u'user:{}'.format(user_id)
+
+
+def _version_key(name):
+    return VERSION_CACHE_PREFIX + hashlib.md5(name.encode('utf-8')).hexdigest()
+
+
+def _get_versions(names):
+    """
+    Returns the current versions of the names, starting any which aren't cached
+    """
+    keys = [_version_key(name) for name in names]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, uuid4().hex, VERSION_CACHE_TIMEOUT)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def invalidate_cached_requests(course_id=None, commentable_ids=(), user_ids=()):
+    """
+    Move the versions of the course, commentables and users on so none of the
+    responses cached under their old versions are used again
+    """
+    names = [commentable_version(commentable_id) for commentable_id in commentable_ids]
+    names.extend(user_version(user_id) for user_id in user_ids)
+    if course_id is not None:
+        names.append(course_version(course_id))
+    cache.set_many({_version_key(name): uuid4().hex for name in names}, VERSION_CACHE_TIMEOUT)
+
+
+def _response_cache_key(url, params, versions):
+    """
+    The cache key of the response to a GET of url with params (in any order),
+    under the current versions of the names in versions
+    """
+    key = json.dumps([url, params, _get_versions(versions)], sort_keys=True, default=unicode)
+    return RESPONSE_CACHE_PREFIX + hashlib.md5(key).hexdigest()
+
+
 def perform_request(method, url, data_or_params=None, raw=False,
-                    metric_action=None, metric_tags=None, paged_results=False):
+                    metric_action=None, metric_tags=None, paged_results=False,
+                    cache_versions=None):
+    """
+    Make a request to the comments service.
 
+    If `cache_versions` is a list of version names (see `course_version`,
+    `commentable_version` and `user_version`), the response to a GET is cached
+    for COMMENTS_SERVICE_CACHE_TIMEOUT seconds or until any of those versions
+    is moved on by `invalidate_cached_requests`.
+    """
     if metric_tags is None:
         metric_tags = []
 
@@ -62,6 +166,16 @@ def perform_request(method, url, data_or_params=None, raw=False,
 
     if data_or_params is None:
         data_or_params = {}
+
+    cache_key = None
+    cache_timeout = getattr(settings, 'COMMENTS_SERVICE_CACHE_TIMEOUT', 0)
+    if cache_versions is not None and method == 'get' and cache_timeout:
+        cache_key = _response_cache_key(url, [data_or_params, raw, get_language()], cache_versions)
+        result = cache.get(cache_key)
+        if result is not None:
+            dog_stats_api.increment('comment_client.request.cached', tags=metric_tags)
+            return result
+
     headers = {
         'X-Edx-Api-Key': getattr(settings, "COMMENTS_SERVICE_KEY", None),
         'Accept-Language': get_language(),
@@ -76,7 +190,7 @@ def perform_request(method, url, data_or_params=None, raw=False,
         data = None
         params = merge_dict(data_or_params, request_id_dict)
     with request_timer(request_id, method, url, metric_tags):
-        response = requests.request(
+        response = get_session().request(
             method,
             url,
             data=data,
@@ -102,7 +216,7 @@ def perform_request(method, url, data_or_params=None, raw=False,
         raise CommentClient500Error(response.text)
     else:
         if raw:
-            return response.text
+            result = response.text
         else:
             data = response.json()
             if paged_results:
@@ -121,7 +235,108 @@ def perform_request(method, url, data_or_params=None, raw=False,
                     value=data.get('num_pages', 1),
                     tags=metric_tags
                 )
-            return data
+            result = data
+        if cache_key is not None:
+            cache.set(cache_key, result, cache_timeout)
+        return result
+
+
+class _PendingCall(object):
+    """
+    A call made by a `_CallPool` thread, in the language of the thread which made it
+    """
+    def __init__(self, func):
+        self.func = func
+        self.language = get_language()
+        self.result = None
+        self.exc_info = None
+        self.done = threading.Event()
+
+    def run(self):
+        translation.activate(self.language)
+        try:
+            self.result = self.func()
+        except Exception:  # pylint: disable=broad-except
+            self.exc_info = sys.exc_info()
+        finally:
+            translation.deactivate()
+            self.done.set()
+
+
+class _CallPool(object):
+    """
+    A pool of threads for `perform_concurrently`, restarted if the process forks
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid = None
+        self._queue = None
+        self._threads = []
+        self._local = threading.local()
+
+    @property
+    def in_worker(self):
+        """Whether the calling thread is one of the pool's threads"""
+        return getattr(self._local, 'worker', False)
+
+    def _ensure_threads(self):
+        with self._lock:
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._queue = Queue.Queue()
+                self._threads = []
+            self._threads = [thread for thread in self._threads if thread.is_alive()]
+            while len(self._threads) < cc_settings.CONCURRENCY:
+                thread = threading.Thread(target=self._work, args=(self._queue,), name='comment-client-worker')
+                thread.daemon = True
+                thread.start()
+                self._threads.append(thread)
+            return self._queue
+
+    def _work(self, queue):
+        self._local.worker = True
+        while True:
+            queue.get().run()
+
+    def submit(self, func):
+        """Queue a call for the pool's threads and return its _PendingCall"""
+        pending = _PendingCall(func)
+        self._ensure_threads().put(pending)
+        return pending
+
+
+_call_pool = _CallPool()
+
+
+def perform_concurrently(*calls):
+    """
+    Make independent comment service calls at the same time, e.g.
+
+        (threads, page, num_pages), user_info = perform_concurrently(
+            lambda: cc.Thread.search(query_params),
+            cc.User.from_django_user(request.user).to_dict,
+        )
+
+    `calls` are callables taking no arguments. The first is called in the
+    calling thread and the rest on a pool of threads, so only the first may
+    use the database. Returns their results in order; if any raised, raises
+    the first of their exceptions once they've all finished.
+    """
+    if len(calls) < 2 or cc_settings.CONCURRENCY < 1 or _call_pool.in_worker:
+        # a call made from a pool thread runs in that thread so the pool can't deadlock
+        return [call() for call in calls]
+
+    pending = [_call_pool.submit(call) for call in calls[1:]]
+    try:
+        results = [calls[0]()]
+    finally:
+        for pending_call in pending:
+            pending_call.done.wait()
+    for pending_call in pending:
+        if pending_call.exc_info:
+            raise pending_call.exc_info[0], pending_call.exc_info[1], pending_call.exc_info[2]
+        results.append(pending_call.result)
+    return results
 
 
 class CommentClientError(Exception):
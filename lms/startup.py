@@ -29,6 +29,9 @@ def run():
     if settings.FEATURES.get('ENABLE_THIRD_PARTY_AUTH', False):
         enable_third_party_auth()
 
+    if settings.FEATURES.get('ENABLE_MIDDLEWARE_PROFILER', False):
+        enable_middleware_profiler()
+
 
 def enable_theme():
     """
@@ -111,3 +114,13 @@ def enable_third_party_auth():
 
     from third_party_auth import settings as auth_settings
     auth_settings.apply_settings(settings.THIRD_PARTY_AUTH, settings)
+
+
+def enable_middleware_profiler():
+    """
+    Enable profiling a sample of requests' calls to each middleware. This
+    must run before the request handler loads the middleware.
+    For configuration details, see common/djangoapps/monitoring/middleware_profiler.py.
+    """
+    from monitoring import middleware_profiler
+    middleware_profiler.install()